@@ -0,0 +1,64 @@
+''' Times a full rebuild of the puzzles and answers tables on a scratch database: the old 
+    per-puzzle path (each `Puzzle` writes itself, then back-fills its own answers) against 
+    the batched upsert path in `sql_functions`.
+
+    Usage:  python benchmarks/bench_db_rebuild.py
+'''
+import tempfile
+import time
+from pathlib import Path
+
+from rich import print
+from rich.table import Table
+
+import advent_of_code.models.puzzle as puzzle_module
+import advent_of_code.models.puzzle_answer as answer_module
+import advent_of_code.sql_functions as sql_functions
+from advent_of_code.constants import ROOT_DIR
+from advent_of_code.models import Puzzle
+from advent_of_code.sql_engine import get_engine
+from advent_of_code.sql_schema import metadata_obj
+
+MOCK_HTML = ROOT_DIR / 'tests' / 'mock_html' / 'both_parts_solved.html'
+YEARS = range(2015, 2026)
+
+def make_rows() -> list[dict]:
+    raw_html = MOCK_HTML.read_text()
+    return [dict(year=year, day=day, title=f"--- Day {day}: Benchmark ---", 
+                 part_1_description='x' * 4000, part_2_description='x' * 2000,
+                 example_text='x' * 200, input_text='x' * 20_000, raw_html=raw_html,
+                 url=f"https://adventofcode.com/{year}/day/{day}")
+            for year in YEARS for day in range(1, 26)]
+
+def use_database(path: Path) -> None:
+    engine = get_engine(f"sqlite:///{path}")
+    metadata_obj.create_all(engine)
+    for module in (puzzle_module, answer_module, sql_functions):
+        module.SQL_ENGINE = engine
+
+def rebuild_per_puzzle(rows: list[dict]) -> None:
+    puzzles = [Puzzle(**row) for row in rows]   # __post_init__ inserts each puzzle
+    for puzzle in puzzles:
+        puzzle.part_1_answer, puzzle.part_2_answer = '', ''
+        puzzle.find_answers_in_raw_html()
+
+def rebuild_batched(rows: list[dict]) -> None:
+    sql_functions.upsert_puzzle_rows(rows)
+    sql_functions.find_answers_in_html_text_on_db()
+
+def main():
+    rows = make_rows()
+    table = Table(title=f"Rebuilding {len(rows)} puzzles")
+    table.add_column('Path')
+    table.add_column('Time (s)', justify='right')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, fn in [('per-puzzle', rebuild_per_puzzle), ('batched upsert', rebuild_batched)]:
+            use_database(Path(tmp_dir) / f"{name}.db")
+            start = time.perf_counter()
+            fn(rows)
+            table.add_row(name, f"{time.perf_counter() - start:.3f}")
+    print(table)
+
+if __name__ == '__main__':
+    main()
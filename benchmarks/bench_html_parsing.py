@@ -0,0 +1,68 @@
+''' Times HTML extraction over every `raw_html` row on the database (or the mock pages in
+    `tests/mock_html` if the database is empty): the old path, which built a fresh soup of the
+    whole page for each consumer, against the single-pass `parse_puzzle_html`.
+
+    Usage:  python benchmarks/bench_html_parsing.py
+'''
+import importlib.util
+import time
+from typing import Callable
+
+import sqlalchemy as db
+from bs4 import BeautifulSoup
+from rich import print
+from rich.table import Table
+
+import advent_of_code.html_parsing as html
+from advent_of_code.constants import ROOT_DIR, SQLITE_PATH
+from advent_of_code.exceptions import ElementNotFound
+from advent_of_code.sql_engine import get_engine
+from advent_of_code.sql_schema import puzzles_table
+
+def load_pages() -> list[str]:
+    pages = []
+    if SQLITE_PATH.exists():
+        with get_engine().connect() as conn:
+            pages = conn.execute(db.select(puzzles_table.c.raw_html)).scalars().all()
+    if not pages:
+        pages = [f.read_text() for f in (ROOT_DIR / 'tests' / 'mock_html').glob('*.html')]
+    return [page for page in pages if page and '<h2' in page]
+
+def parse_old(raw_html: str) -> None:
+    soup = BeautifulSoup(raw_html, 'html.parser')   # Puzzle.from_server
+    html.get_solved_statuses_from_soup(soup)
+    html.get_puzzle_title_and_descriptions_from_soup(soup)
+    html.get_answers_from_soup(soup)
+    try:
+        html.get_example_from_soup(soup)
+    except ElementNotFound:
+        pass
+    soup = BeautifulSoup(raw_html, 'html.parser')   # Puzzle.find_answers_in_raw_html
+    [p for p in soup.find_all('p') if 'Your puzzle answer was' in p.get_text()]
+
+def time_pages(fn: Callable[[str], object], pages: list[str]) -> float:
+    start = time.perf_counter()
+    for page in pages:
+        fn(page)
+    return time.perf_counter() - start
+
+def main():
+    pages = load_pages()
+    candidates: list[tuple[str, Callable[[str], object]]] = [
+        ('separate soups (html.parser)', parse_old),
+        ('single pass (html.parser)', lambda page: html.parse_puzzle_html(page, 'html.parser')),
+    ]
+    if importlib.util.find_spec('lxml'):
+        candidates.append(('single pass (lxml)', lambda page: html.parse_puzzle_html(page, 'lxml')))
+
+    table = Table(title=f"Parsing {len(pages)} pages")
+    table.add_column('Path')
+    table.add_column('Total (s)', justify='right')
+    table.add_column('Per page (ms)', justify='right')
+    for name, fn in candidates:
+        elapsed = time_pages(fn, pages)
+        table.add_row(name, f"{elapsed:.3f}", f"{elapsed / len(pages) * 1000:.2f}")
+    print(table)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+''' Times shortest-path search across a large generated maze (a perfect maze, so the path
+    winds through a big share of the cells, like the 2016 day13/day24 and 2018 day15 mazes
+    but bigger): the old path-copying BFS, the parent-pointer `search.bfs` over the same
+    tuple-keyed graph, and `search.bfs_grid` over linear indices on a padded `Grid`.
+
+    Usage:  python benchmarks/bench_search.py [SIZE]
+'''
+import random
+import sys
+import time
+from collections import deque
+from typing import Callable
+
+from rich import print
+from rich.table import Table
+
+from advent_of_code import search
+from advent_of_code.grid import Grid
+
+type Point = tuple[int, int]
+
+def make_maze(size: int, seed: int = 2016) -> str:
+    ''' A (2 * size + 1)-square maze carved by an iterative depth-first search. '''
+    rng = random.Random(seed)
+    width = 2 * size + 1
+    cells = [['#'] * width for _ in range(width)]
+    stack = [(0, 0)]
+    seen = {(0, 0)}
+    cells[1][1] = '.'
+    while stack:
+        row, col = stack[-1]
+        options = [(row + dr, col + dc) for dr, dc in ((-1, 0), (0, 1), (1, 0), (0, -1))
+                   if 0 <= row + dr < size and 0 <= col + dc < size and (row + dr, col + dc) not in seen]
+        if not options:
+            stack.pop()
+            continue
+        next_row, next_col = rng.choice(options)
+        cells[row + next_row + 1][col + next_col + 1] = '.'
+        cells[2 * next_row + 1][2 * next_col + 1] = '.'
+        seen.add((next_row, next_col))
+        stack.append((next_row, next_col))
+    cells[1][1] = 'S'
+    cells[width - 2][width - 2] = 'E'
+    return '\n'.join(''.join(row) for row in cells)
+
+def make_graph(maze: str) -> dict[Point, list[Point]]:
+    lines = maze.splitlines()
+    return {(r, c): [(r + dr, c + dc) for dr, dc in ((-1, 0), (0, 1), (1, 0), (0, -1))
+                     if lines[r + dr][c + dc] != '#']
+            for r, line in enumerate(lines) for c, char in enumerate(line) if char != '#'}
+
+def path_copying_bfs(graph: dict[Point, list[Point]], start: Point, end: Point) -> int:
+    queue = deque([(start, [])])
+    visited = {start}
+    while queue:
+        node, path = queue.popleft()
+        if node == end:
+            return len(path)
+        for neighbor in graph[node]:
+            if neighbor not in visited:
+                queue.append((neighbor, path + [neighbor]))
+                visited.add(neighbor)
+    return -1
+
+def time_call(fn: Callable[[], int]) -> tuple[int, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    maze = make_maze(size)
+    graph = make_graph(maze)
+    grid = Grid.from_text(maze, codes={'#': 1, '.': 0, 'S': 0, 'E': 0}, pad_value=1)
+    start, end = (1, 1), (2 * size - 1, 2 * size - 1)
+
+    candidates: list[tuple[str, Callable[[], int]]] = [
+        ('path-copying BFS', lambda: path_copying_bfs(graph, start, end)),
+        ('search.bfs (parent dict)', lambda: search.bfs(start, graph.__getitem__, goal=end).distance),
+        ('search.bfs_grid (parent list)', lambda: search.bfs_grid(grid, grid.start, {1}, grid.target).distance),
+    ]
+
+    table = Table(title=f"{2 * size + 1}x{2 * size + 1} maze, {len(graph):,} open cells")
+    table.add_column('Search')
+    table.add_column('Distance', justify='right')
+    table.add_column('Time (ms)', justify='right')
+    for name, fn in candidates:
+        distance, elapsed = time_call(fn)
+        table.add_row(name, f"{distance:,}", f"{elapsed * 1000:.1f}")
+    print(table)
+
+if __name__ == '__main__':
+    main()
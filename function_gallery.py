@@ -1,5 +1,5 @@
 from enum import Enum, IntEnum, StrEnum
-from typing import NamedTuple, Callable, Any
+from typing import NamedTuple, Callable, Any, Optional
 from dataclasses import dataclass, field
 from collections import deque
 
@@ -169,21 +169,22 @@ def create_graph(node_dict: dict[tuple[int, int], Node]) -> NodeGraph:
     return output_dict
 
 def find_shortest_path(self, start_node: Node, end_node: Node) -> int:
-    queue = deque([(start_node, [])])
-
-    visited = set()
-    visited.add(start_node)
+    # Parent pointers instead of `(node, path + [neighbor])` queue entries, so each step is O(1);
+    # see `advent_of_code.search` for BFS/Dijkstra/A* versions that also rebuild the path
+    queue = deque([start_node])
+    parents: dict[Node, Optional[Node]] = {start_node: None}
 
     while queue:
-        node, path = queue.popleft()
+        node = queue.popleft()
         if node == end_node:
-            return len(path)
-        neighbors = self.graph[node]
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                new_path = path + [neighbor]
-                queue.append((neighbor, new_path))
-                visited.add(neighbor)
+            length = 0
+            while (node := parents[node]) is not None:
+                length += 1
+            return length
+        for neighbor in self.graph[node]:
+            if neighbor not in parents:
+                parents[neighbor] = node
+                queue.append(neighbor)
     return -1
 
 def find_reachable_nodes(graph: dict[Point, list[Point]], 
@@ -1,4 +1,3 @@
-import hashlib
 from pathlib import Path
 from rich import print
 
@@ -13,29 +12,16 @@ EXAMPLES = ['abcdef', 'pqrstuv']
 INPUT = aoc.get_input(YEAR, DAY)
 DESCRIPTION = aoc.get_description(YEAR, DAY)
 
-def get_hash(s: str):
-    return hashlib.md5(s.encode('utf-8')).hexdigest()
-
 def parse_data(data: str) -> str:
     return data.strip('\n')
 
 def part_one(data: str) -> int:
     secret_key = parse_data(data)
-    test_num = 0
-    while True:
-        if get_hash(f"{secret_key}{test_num}")[0:5] == '00000':
-            return test_num
-        else:
-            test_num += 1
+    return aoc.hashing.find_nonce(secret_key, zeros=5)
             
 def part_two(data: str):
     secret_key = parse_data(data)
-    test_num = 0
-    while True:
-        if get_hash(f"{secret_key}{test_num}")[0:6] == '000000':
-            return test_num
-        else:
-            test_num += 1
+    return aoc.hashing.find_nonce(secret_key, zeros=6)
 
 
 
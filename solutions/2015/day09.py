@@ -1,4 +1,3 @@
-import itertools
 from dataclasses import dataclass
 from pathlib import Path
 from rich import print
@@ -44,31 +43,21 @@ def parse_data(data: str) -> FlightSet:
         output_list.append(Flight(parts[0], parts[2], int(parts[4])))
     return FlightSet(output_list)
 
-def get_route_distances(flight_set: FlightSet) -> list[int]:
-    perms = itertools.permutations(flight_set.all_cities, 
-                                   len(flight_set.all_cities))
-
-    route_distances = []
-    for route in perms:
-        route_distance = 0
-        for i, city in enumerate(route):
-            if i == len(route) - 1:
-                break
-            route_distance += flight_set.get_distance(city, route[i+1])
-        route_distances.append(route_distance)
-    return route_distances
+def get_route_distances(flight_set: FlightSet) -> list[list[int | float]]:
+    cities = sorted(flight_set.all_cities)
+    return aoc.routes.make_distance_matrix(cities, flight_set.get_distance)
 
     
 def part_one(data: str):
     flight_set = parse_data(data)
     route_distances = get_route_distances(flight_set)
-    return min(route_distances)       
+    return aoc.routes.held_karp(route_distances).length
     
 
 def part_two(data: str):
     flight_set = parse_data(data)
     route_distances = get_route_distances(flight_set)
-    return max(route_distances)
+    return aoc.routes.held_karp(route_distances, maximize=True).length
 
 
 
@@ -1,4 +1,3 @@
-import itertools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple
@@ -55,14 +54,11 @@ class PairSet:
         
         return pair1.value + pair2.value
 
-    def get_result_from_permutation(self, perm: tuple[str, ...]) -> int:
-        output = 0
-        for i, name in enumerate(perm):
-            try:
-                output += self.get_result(name, perm[i+1])
-            except IndexError:
-                output += self.get_result(name, perm[0])
-        return output
+    def get_best_seating(self) -> int:
+        ''' The most total happiness around the table: a closed tour, since it's round. '''
+        guests = sorted(self.all_guests)
+        happiness = aoc.routes.make_distance_matrix(guests, self.get_result)
+        return aoc.routes.held_karp(happiness, closed=True, maximize=True).length
 
 def parse_data(data: str) -> PairSet:
     line_list = data.splitlines()
@@ -85,14 +81,12 @@ def parse_data(data: str) -> PairSet:
 
 def part_one(data: str):
     pair_set = parse_data(data)
-    perms = itertools.permutations(pair_set.all_guests, pair_set.num_seats)
-    return max(pair_set.get_result_from_permutation(perm) for perm in perms)
+    return pair_set.get_best_seating()
         
 def part_two(data: str):
     pair_set = parse_data(data)
     pair_set.add_me()
-    perms = itertools.permutations(pair_set.all_guests, pair_set.num_seats)
-    return max(pair_set.get_result_from_permutation(perm) for perm in perms)
+    return pair_set.get_best_seating()
 
 
 def main():
@@ -22,85 +22,25 @@ def parse_data(data: str) -> np.ndarray:
         output_list.append([int(char) for char in line])
     return np.array(output_list)
 
-def get_neighbors(matrix: np.ndarray, x: int, y: int) -> np.ndarray:
-    m = matrix.copy()
-    x_start = max(x-1, 0)
-    x_end = min(x+2, matrix.shape[1])
-    
-    y_start = max(y-1, 0)
-    y_end = min(y+2, matrix.shape[0])
-    
-    return m[x_start:x_end, y_start:y_end]
-
-def get_light_state(matrix: np.ndarray, x: int, y: int) -> int:
-    m = matrix.copy()
-    current_state = m[x, y]
-    neighbor_matrix = get_neighbors(m, x, y)
-    neighbor_sum = np.sum(neighbor_matrix) - current_state
-
-    if current_state == 1:
-        if neighbor_sum == 2 or neighbor_sum == 3:
-            return 1
-        else:
-            return 0
-    else:
-        if neighbor_sum == 3:
-            return 1
-        else: 
-            return 0
-
-def animate_matrix(matrix: np.ndarray):
-    rows, cols = matrix.shape
-    m_copy = matrix.copy()
-    for row in range(rows):
-        for col in range(cols):
-            matrix[row, col] = get_light_state(m_copy, row, col)
-    return matrix
-    
+LIFE = aoc.automaton.make_life_rule(birth=[3], survive=[2, 3])
 
 def part_one(data: str, steps: int):
     matrix = parse_data(data)
-    for _ in range(steps):
-        animate_matrix(matrix)
-    return np.sum(matrix)
-
-
-
-
-def get_light_state_part_two(matrix: np.ndarray, x: int, y: int) -> int:
-    if ((x == 0 or x == matrix.shape[0]-1) 
-        and (y == 0 or y == matrix.shape[1]-1)):
-        return 1
-    
-    m = matrix.copy()
-    current_state = m[x, y]
-    neighbor_matrix = get_neighbors(m, x, y)
-    neighbor_sum = np.sum(neighbor_matrix) - current_state
-    
-    if current_state == 1:
-        if neighbor_sum == 2 or neighbor_sum == 3:
-            return 1
-        else:
-            return 0
-    else:
-        if neighbor_sum == 3:
-            return 1
-        else: 
-            return 0
-
-def animate_matrix_part_two(matrix: np.ndarray):
-    rows, cols = matrix.shape
-    m_copy = matrix.copy()
-    for row in range(rows):
-        for col in range(cols):
-            matrix[row, col] = get_light_state_part_two(m_copy, row, col)
-    return matrix
+    lights = aoc.automaton.Automaton(matrix, LIFE)
+    return lights.run(steps).count()
+
+
+def get_corners(matrix: np.ndarray) -> np.ndarray:
+    corners = np.zeros(matrix.shape, dtype=bool)
+    corners[::matrix.shape[0]-1, ::matrix.shape[1]-1] = True
+    return corners
 
 def part_two(data: str, steps: int):
     matrix = parse_data(data)
-    for _ in range(steps):
-        animate_matrix_part_two(matrix)
-    return np.sum(matrix)
+    corners = get_corners(matrix)
+    matrix[corners] = 1
+    lights = aoc.automaton.Automaton(matrix, LIFE, fixed=corners)
+    return lights.run(steps).count()
 
 
 
@@ -1,4 +1,3 @@
-import hashlib
 import pathlib
 
 from rich import print
@@ -12,32 +11,24 @@ DAY = int(CURRENT_FILE.stem.removeprefix('day'))
 EXAMPLE = 'abc'
 INPUT = aoc.get_input(YEAR, DAY)
 
-def get_hash(s: str):
-    return hashlib.md5(s.encode('utf-8')).hexdigest()
-    
 def part_one(door_id: str):
     output_str = ''
-    i = 0
-    while len(output_str) < 8:
-        hash = get_hash(f"{door_id}{i}")
-        if hash[0:5] == '00000':
-            output_str += hash[5]
-        i += 1
-    return output_str
+    for _, hash in aoc.hashing.iter_matches(door_id, zeros=5):
+        output_str += hash[5]
+        if len(output_str) == 8:
+            return output_str
 
 def validate_hash(hash: str) -> bool:
-    return hash[0:5] == '00000' and hash[5].isdigit() and int(hash[5]) < 8
+    return hash[5].isdigit() and int(hash[5]) < 8
 
 def part_two(door_id: str):
     d: dict[int, str] = {}
-    i = 0
-    while len(d) < 8:
-        hash = get_hash(f"{door_id}{i}")
+    for _, hash in aoc.hashing.iter_matches(door_id, zeros=5):
         if validate_hash(hash) and int(hash[5]) not in d.keys():
             key = int(hash[5])
             d[key] = hash[6]
-        i += 1
-    return ''.join(d[key] for key in sorted(d.keys()))
+            if len(d) == 8:
+                return ''.join(d[key] for key in sorted(d.keys()))
 
 def main():
     print(f"Part One (example):  {part_one(EXAMPLE)}")
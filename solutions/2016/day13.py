@@ -70,6 +70,7 @@ class Maze:
 
         while queue:
             node, path = queue.popleft()
+            aoc.increment('nodes_expanded')
             if part_two and len(path) == 50:
                 return len(visited)
             if node == end:
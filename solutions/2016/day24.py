@@ -1,13 +1,9 @@
 import functools
-import itertools
-import math
-from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import NamedTuple
 
-from alive_progress import alive_bar
 from rich import print
 
 import advent_of_code as aoc
@@ -90,48 +86,19 @@ class Grid:
         return abs(node.x - self.start.x) + abs(node.y - self.start.y)
 
     def find_shortest_path(self, start_node: Node, end_node: Node) -> int:
-        queue = deque([(start_node, [])])
-
-        visited = set()
-        visited.add(start_node)
-
-        while queue:
-            node, path = queue.popleft()
-            if node == end_node:
-                return len(path)
-            neighbors = self.graph[node]
-            for neighbor in neighbors:
-                if neighbor not in visited:
-                    new_path = path + [neighbor]
-                    queue.append((neighbor, new_path))
-                    visited.add(neighbor)
-        return -1
+        result = aoc.search.bfs(start_node, self.graph.__getitem__, goal=end_node)
+        return result.distance if result.found else -1
+
+    @functools.cached_property
+    def distances(self) -> list[list[int | float]]:
+        ''' Steps between every pair of points of interest; the start is row/column 0. '''
+        return aoc.routes.get_graph_distances([self.start] + self.locations, self.graph.__getitem__)
 
     def solve_part_one(self):
-        path_lengths: list[int] = []
-        with alive_bar(total=math.factorial(len(self.locations))) as bar:
-            for combo in itertools.permutations(self.locations, len(self.locations)):
-                locations = [self.start] + list(combo)
-
-                path_length = 0
-                for i in range(len(locations) - 1):
-                    path_length += self.find_shortest_path(locations[i], locations[i+1])
-                path_lengths.append(path_length)
-                bar()
-        return min(path_lengths)
+        return aoc.routes.held_karp(self.distances, start=0).length
 
     def solve_part_two(self):
-        path_lengths: list[int] = []
-        with alive_bar(total=math.factorial(len(self.locations))) as bar:
-            for combo in itertools.permutations(self.locations, len(self.locations)):
-                locations = [self.start] + list(combo) + [self.start]
-
-                path_length = 0
-                for i in range(len(locations) - 1):
-                    path_length += self.find_shortest_path(locations[i], locations[i+1])
-                path_lengths.append(path_length)
-                bar()
-        return min(path_lengths)
+        return aoc.routes.held_karp(self.distances, start=0, closed=True).length
 
 @functools.cache
 def parse_data(data: str):
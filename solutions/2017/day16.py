@@ -70,14 +70,9 @@ def part_one(data: str):
 
 def part_two(data: str):
     dg = DanceGroup.from_data(data)
-
-    seen_list = [dg.dancers]
-    for _ in range(1_000_000_000):
-        dg.simulate_dance()
-        if dg.dancers in seen_list:
-            return seen_list[1_000_000_000 % len(seen_list)]
-        else:
-            seen_list.append(dg.dancers)
+    return aoc.cycles.fast_forward(dg, DanceGroup.simulate_dance, 1_000_000_000,
+                                   key=lambda dg: dg.dancers,
+                                   observe=lambda dg: dg.dancers)
 
 def main():
     print(f"Part One (example):  {example_part_one()}")
@@ -30,9 +30,17 @@ class PlantGroup:
                     new_dict[pot_num] = False
             self.pot_dict = new_dict
            
-        pots_with_plants = (k for k, v in self.pot_dict.items() if v)
-        
-        return sum(pots_with_plants)
+        return self.get_plant_sum()
+
+    def grow(self) -> None:
+        self.simulate_growth(num_generations=1)
+
+    def get_plant_sum(self) -> int:
+        return sum(k for k, v in self.pot_dict.items() if v)
+
+    def get_pattern(self) -> str:
+        ''' The pots from the first plant to the last, wherever they are along the row. '''
+        return ''.join('#' if self.pot_dict[k] else '.' for k in sorted(self.pot_dict)).strip('.')
 
     def print_pots(self):
         output = ''
@@ -67,18 +75,13 @@ def part_one(data: str):
     answer = plants.simulate_growth()
     return answer
 
-def part_two_exploration(data: str):
-    for x in range(2, 201):
-        plants1 = parse_data(data)
-        plants2 = parse_data(data)
-        answer1 = plants1.simulate_growth(num_generations=x-1)
-        answer2 = plants2.simulate_growth(num_generations=x)
-        print(f"{x}:  {answer2} - {answer2 - answer1}")
-
-    return 4107 + ((50_000_000_000 - 163) * 23)
-
 def part_two(data: str):
-    return 4107 + ((50_000_000_000 - 163) * 23)
+    plants = parse_data(data)
+    # Growth settles into a pattern that slides along the row, so the sum drifts steadily
+    return aoc.cycles.fast_forward(plants, PlantGroup.grow, 50_000_000_000,
+                                   key=PlantGroup.get_pattern,
+                                   observe=PlantGroup.get_plant_sum,
+                                   drift=True)
 
 def main():
     print(f"Part One (example):  {part_one(EXAMPLE)}")
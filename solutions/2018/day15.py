@@ -362,6 +362,7 @@ def find_shortest_paths(start_node: Node,
                       if len(path) == shortest_path_length]
     return (shortest_paths, shortest_path_length)
 
+@aoc.cached_parse
 def create_graph(node_list: list[Node]) -> dict[Node, list[Node]]:
     output_dict: dict[Node, list[Node]] = {}
 
@@ -1,10 +1,10 @@
-from enum import Enum, IntEnum
 from pathlib import Path
-from typing import NamedTuple
 from rich import print
 
 import advent_of_code as aoc
 
+np = aoc.lazy_import('numpy')
+
 CURRENT_FILE = Path(__file__)
 YEAR = int(CURRENT_FILE.parts[-2])
 DAY = int(CURRENT_FILE.stem.removeprefix('day')[0:2])
@@ -12,94 +12,32 @@ DAY = int(CURRENT_FILE.stem.removeprefix('day')[0:2])
 EXAMPLE = aoc.get_example(YEAR, DAY)
 INPUT = aoc.get_input(YEAR, DAY)
 
-class Direction(IntEnum):
-    NORTH = 0
-    NORTHEAST = 1
-    EAST = 2
-    SOUTHEAST = 3
-    SOUTH = 4
-    SOUTHWEST = 5
-    WEST = 6
-    NORTHWEST = 7
-
-# ROW, COL
-DIRECTION_DELTAS = {
-    Direction.NORTH: (-1, 0),
-    Direction.NORTHEAST: (-1, 1),
-    Direction.EAST: (0, 1),
-    Direction.SOUTHEAST: (1, 1),
-    Direction.SOUTH: (1, 0),
-    Direction.SOUTHWEST: (1, -1),
-    Direction.WEST: (0, -1),
-    Direction.NORTHWEST: (-1, -1)
-}
-
-class NodeType(Enum):
-    OPEN = 0
-    PAPER = 1
-
-class Node(NamedTuple):
-    row: int
-    col: int
-    node_type: NodeType
-
-def parse_data(data: str) -> dict[tuple[int, int], Node]:
-    line_list = data.splitlines()
-    node_list: list[Node] = []
-    for row, line in enumerate(line_list):
-        for col, char in enumerate(line):
-            node_type = NodeType.PAPER if char == '@' else NodeType.OPEN
-            node_list.append(Node(row, col, node_type))
-    node_dict = {(node.row, node.col): node for node in node_list}
-    return node_dict
-        
-def get_node_neighbor_coordinates(node: Node) -> list[tuple[int, int]]:
-    row, col = (node.row, node.col)
-
-    output_list = []
-    for dir in Direction:
-        delta_row, delta_col = DIRECTION_DELTAS[dir]
-        output_list.append((row + delta_row, col + delta_col))
-    return output_list
+EMPTY = 0
+PAPER = 1
 
-def create_graph(node_dict: dict[tuple[int, int], Node]) -> dict[Node, list[Node]]:
-    output_dict: dict[Node, list[Node]] = {}
-    
-    for node in node_dict.values():
-        neighbor_list = []
-        for neighbor_coords in get_node_neighbor_coordinates(node):
-            try:
-                neighbor_list.append(node_dict[neighbor_coords])
-            except KeyError:
-                continue
-        output_dict[node] = neighbor_list
-        
-    return output_dict
+def parse_data(data: str) -> "aoc.grid.Grid":
+    return aoc.grid.Grid.from_text(data, codes={'.': EMPTY, '@': PAPER})
 
-def find_accessible_paper_rolls(node_dict: dict[tuple[int, int], Node]) -> list[Node]:
-    graph = create_graph(node_dict)
-    return [node for node in graph if node.node_type == NodeType.PAPER
-            and len([n for n in graph[node] if n.node_type == NodeType.PAPER]) < 4]
+def find_accessible_paper_rolls(grid: "aoc.grid.Grid") -> "np.ndarray":
+    ''' Boolean (rows, cols) mask of the rolls with fewer than four rolls around them. '''
+    return (grid.array == PAPER) & (grid.count_neighbors(PAPER) < 4)
 
 def part_one(data: str):
-    node_dict = parse_data(data)
-    accessible_paper_rolls = find_accessible_paper_rolls(node_dict)
-    return len(accessible_paper_rolls)
+    grid = parse_data(data)
+    return int(find_accessible_paper_rolls(grid).sum())
 
 def part_two(data: str):
-    node_dict = parse_data(data)
+    grid = parse_data(data)
 
     rolls_removed = 0
     while True:
-        accessible_paper_rolls = find_accessible_paper_rolls(node_dict)
-        if len(accessible_paper_rolls) == 0:
+        accessible_paper_rolls = find_accessible_paper_rolls(grid)
+        num_accessible = int(accessible_paper_rolls.sum())
+        if num_accessible == 0:
             return rolls_removed
 
-        new_empty_nodes = [Node(node.row, node.col, NodeType.OPEN) 
-                           for node in accessible_paper_rolls]
-        for node in new_empty_nodes:
-            node_dict[(node.row, node.col)] = node
-            rolls_removed += 1
+        grid.array[accessible_paper_rolls] = EMPTY
+        rolls_removed += num_accessible
 
 def main():
     print(f"Part One (example):  {part_one(EXAMPLE)}")
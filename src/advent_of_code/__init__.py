@@ -1,5 +1,49 @@
+import importlib
+
 from .constants import DATA_DIR
-from .sdk import get_example, get_input, print_description, get_description
-from .logging_config import setup_logging
 
-setup_logging()
+# Public names are imported on first use (PEP 562), so that `import advent_of_code` doesn't
+# pull in SQLAlchemy, BeautifulSoup, requests and loguru before a solution even needs them.
+_LAZY_ATTRIBUTES = {
+    'get_example': 'sdk',
+    'get_input': 'sdk',
+    'get_input_bytes': 'sdk',
+    'open_input': 'sdk',
+    'print_description': 'sdk',
+    'get_description': 'sdk',
+    'clear_puzzle_cache': 'sdk',
+    'lazy_import': 'helpers',
+    'iter_lines': 'readers',
+    'iter_blocks': 'readers',
+    'iter_ints': 'readers',
+    'cached_parse': 'parse_cache',
+    'counted': 'instrumentation',
+    'timed': 'instrumentation',
+    'increment': 'instrumentation',
+    'timer': 'instrumentation',
+    'counter_scope': 'instrumentation',
+    'setup_logging': 'logging_config',
+}
+
+# Submodules used as namespaces, e.g. `aoc.grid.parse(...)` (these may import NumPy)
+_LAZY_SUBMODULES = {'grid', 'search', 'routes', 'cycles', 'automaton', 'hashing'}
+
+def resolve_attribute_module(name: str) -> str | None:
+    ''' The submodule behind `aoc.<name>` (e.g. 'sdk' for `get_input`, 'grid' for `grid`), without
+        importing it; None if the package doesn't provide that name lazily. '''
+    if name in _LAZY_SUBMODULES:
+        return name
+    return _LAZY_ATTRIBUTES.get(name)
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES})
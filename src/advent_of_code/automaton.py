@@ -0,0 +1,75 @@
+import itertools
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from advent_of_code.grid import ORTHOGONAL_DELTAS
+
+# Life-like cellular automata on a 2D array of small-int states.  Each generation is a handful
+# of whole-array operations: neighbor counts come from shifted-array sums over a zero-padded
+# copy, and the rule is a lookup table indexed by (state, count of each counted state), so no
+# Python code runs per cell.  Cells outside the grid never count as neighbors.
+
+MAX_NEIGHBORS = 8
+
+def make_rule(num_states: int, counted: Sequence[int], fn: Callable[..., int]) -> np.ndarray:
+    ''' Tabulates `fn(state, *counts)` (one count per state in `counted`) as a lookup table of
+        shape (num_states, 9, 9, ...). '''
+    table = np.zeros((num_states, *(MAX_NEIGHBORS + 1,) * len(counted)), dtype=np.uint8)
+    for index in itertools.product(*(range(size) for size in table.shape)):
+        table[index] = fn(*index)
+    return table
+
+def make_life_rule(birth: Sequence[int] = (3,), survive: Sequence[int] = (2, 3)) -> np.ndarray:
+    ''' A two-state rule in B/S notation (Conway's Life by default), counting live (1) cells. '''
+    return make_rule(2, (1,), lambda state, live: live in (survive if state else birth))
+
+class Automaton:
+    ''' Steps `cells` under a lookup-table `rule` from `make_rule`.  Cells where `fixed` is True
+        keep the values they start with (e.g. lights stuck on). '''
+    def __init__(self,
+                 cells: np.ndarray,
+                 rule: np.ndarray,
+                 counted: Sequence[int] = (1,),
+                 fixed: Optional[np.ndarray] = None,
+                 diagonal: bool = True):
+        if rule.ndim != len(counted) + 1:
+            raise ValueError(f"A rule for {len(counted)} counted state(s) needs {len(counted) + 1} dimensions, not {rule.ndim}")
+        self.cells = np.ascontiguousarray(cells, dtype=np.uint8)
+        self.rule = rule
+        self.counted = tuple(counted)
+        self.diagonal = diagonal
+        self.fixed = fixed
+        self.fixed_values = None if fixed is None else self.cells[fixed]
+        self.generation = 0
+        rows, cols = self.cells.shape
+        self.padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+
+    def count_neighbors(self, state: int) -> np.ndarray:
+        padded = self.padded
+        padded[1:-1, 1:-1] = self.cells == state
+        if not self.diagonal:
+            rows, cols = self.cells.shape
+            return sum(padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols] for dr, dc in ORTHOGONAL_DELTAS)
+        # The 3x3 box sum, as a vertical then a horizontal pass, minus the cell itself
+        columns = padded[:-2] + padded[1:-1] + padded[2:]
+        return columns[:, :-2] + columns[:, 1:-1] + columns[:, 2:] - padded[1:-1, 1:-1]
+
+    def step(self) -> None:
+        counts = [self.count_neighbors(state) for state in self.counted]
+        self.cells = self.rule[(self.cells, *counts)]
+        if self.fixed is not None:
+            self.cells[self.fixed] = self.fixed_values
+        self.generation += 1
+
+    def run(self, generations: int) -> "Automaton":
+        for _ in range(generations):
+            self.step()
+        return self
+
+    def count(self, state: int = 1) -> int:
+        return int(np.count_nonzero(self.cells == state))
+
+    def key(self) -> bytes:
+        ''' A snapshot of the cells, e.g. as the `key` for `aoc.cycles.fast_forward`. '''
+        return self.cells.tobytes()
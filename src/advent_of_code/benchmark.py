@@ -0,0 +1,171 @@
+import statistics
+import subprocess
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import sqlalchemy as db
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from advent_of_code.logging_config import logger
+from rich.table import Table
+
+from advent_of_code.constants import ROOT_DIR
+from advent_of_code.helpers import get_now_string
+from advent_of_code.runner import DEFAULT_TIMEOUT, PartResult, SolutionFile, run_solutions
+from advent_of_code.sql_engine import get_engine
+from advent_of_code.sql_schema import benchmarks_table
+
+SQL_ENGINE = get_engine()
+
+DEFAULT_REPEATS = 5
+DEFAULT_REGRESSION_THRESHOLD = 10.0   # percent
+
+@dataclass
+class BenchmarkResult:
+    year: int
+    day: int
+    part: int
+    commit: str
+    runs: int
+    min_time: float
+    median_time: float
+    p95_time: float
+    timestamp: str = field(default_factory=get_now_string)
+    baseline_commit: Optional[str] = field(default=None)
+    baseline_median_time: Optional[float] = field(default=None)
+
+    @property
+    def change_pct(self) -> Optional[float]:
+        if not self.baseline_median_time:
+            return None
+        return (self.median_time - self.baseline_median_time) / self.baseline_median_time * 100
+
+    def is_regression(self, threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> bool:
+        change = self.change_pct
+        return change is not None and change > threshold
+
+
+def get_git_commit() -> str:
+    try:
+        resp = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Could not determine git commit: {e}")
+        return 'unknown'
+    return resp.stdout.strip()
+
+def percentile(timings: list[float], pct: int) -> float:
+    ''' Nearest-rank percentile (so the p95 of a handful of runs is an actual observed run). '''
+    ordered = sorted(timings)
+    rank = max(1, -(-pct * len(ordered) // 100))   # ceiling division
+    return ordered[rank - 1]
+
+def summarize_timings(year: int, day: int, part: int, commit: str, timings: list[float]) -> BenchmarkResult:
+    return BenchmarkResult(year=year,
+                           day=day,
+                           part=part,
+                           commit=commit,
+                           runs=len(timings),
+                           min_time=min(timings),
+                           median_time=statistics.median(timings),
+                           p95_time=percentile(timings, 95))
+
+def summarize_part_results(results: Iterable[PartResult], commit: str) -> list[BenchmarkResult]:
+    ''' Groups repeated runs by (year, day, part).  Parts with any failed run are dropped, since
+        their timings aren't comparable to a clean baseline. '''
+    timings: dict[tuple[int, int, int], list[float]] = defaultdict(list)
+    failed = set()
+    for result in results:
+        key = (result.year, result.day, result.part)
+        if result.ok:
+            timings[key].append(result.wall_time)
+        elif result.status != 'missing':
+            failed.add(key)
+            logger.warning(f"{result.year} DAY {result.day:02d} | Part {result.part}: {result.status} ({result.error})")
+
+    return [summarize_timings(*key, commit, timings[key])
+            for key in sorted(timings) if key not in failed]
+
+def run_benchmarks(solutions: Iterable[SolutionFile],
+                   repeats: int = DEFAULT_REPEATS,
+                   max_workers: Optional[int] = None,
+                   timeout: Optional[float] = DEFAULT_TIMEOUT) -> list[BenchmarkResult]:
+    repeated = [solution for solution in solutions for _ in range(repeats)]
+    results = run_solutions(repeated, max_workers=max_workers, timeout=timeout)
+    return summarize_part_results(results, get_git_commit())
+
+def write_benchmarks_to_db(benchmarks: list[BenchmarkResult]) -> None:
+    if not benchmarks:
+        return None
+    benchmarks_table.create(SQL_ENGINE, checkfirst=True)
+
+    rows = [{'year': b.year, 'day': b.day, 'part': b.part, 'commit': b.commit, 'timestamp': b.timestamp,
+             'runs': b.runs, 'min_time': b.min_time, 'median_time': b.median_time, 'p95_time': b.p95_time}
+            for b in benchmarks]
+    stmt = sqlite_insert(benchmarks_table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['year', 'day', 'part', 'commit'],
+        set_={col: stmt.excluded[col] for col in ['timestamp', 'runs', 'min_time', 'median_time', 'p95_time']}
+    )
+    with SQL_ENGINE.connect() as conn:
+        conn.execute(stmt, rows)
+        conn.commit()
+    logger.info(f"Wrote {len(rows)} benchmark results to DB")
+
+def get_baseline_from_db(year: int, day: int, part: int,
+                         commit: str, baseline_commit: Optional[str] = None) -> Optional[db.Row]:
+    ''' Returns the named baseline commit's row, or else the latest row from any other commit. '''
+    benchmarks_table.create(SQL_ENGINE, checkfirst=True)
+    with SQL_ENGINE.connect() as conn:
+        stmt = (db.select(benchmarks_table)
+                  .where(benchmarks_table.c.year == year)
+                  .where(benchmarks_table.c.day == day)
+                  .where(benchmarks_table.c.part == part))
+        if baseline_commit:
+            stmt = stmt.where(benchmarks_table.c.commit == baseline_commit)
+        else:
+            stmt = (stmt.where(benchmarks_table.c.commit != commit)
+                        .order_by(benchmarks_table.c.timestamp.desc()))
+        return conn.execute(stmt).first()
+
+def attach_baselines(benchmarks: list[BenchmarkResult], baseline_commit: Optional[str] = None) -> None:
+    for b in benchmarks:
+        row = get_baseline_from_db(b.year, b.day, b.part, b.commit, baseline_commit)
+        if row:
+            b.baseline_commit = row.commit
+            b.baseline_median_time = row.median_time
+
+def find_regressions(benchmarks: list[BenchmarkResult],
+                     threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> list[BenchmarkResult]:
+    return [b for b in benchmarks if b.is_regression(threshold)]
+
+def make_benchmark_table(benchmarks: list[BenchmarkResult],
+                         threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> Table:
+    table = Table()
+    table.add_column('Year')
+    table.add_column('Day', justify='right')
+    table.add_column('Part', justify='center')
+    table.add_column('Runs', justify='right')
+    table.add_column('Min (s)', justify='right')
+    table.add_column('Median (s)', justify='right')
+    table.add_column('p95 (s)', justify='right')
+    table.add_column('Baseline (s)', justify='right')
+    table.add_column('Change', justify='right')
+    for b in benchmarks:
+        change = b.change_pct
+        if change is None:
+            change_str = ''
+        elif b.is_regression(threshold):
+            change_str = f"[red]{change:+.1f}%[/red]"
+        else:
+            change_str = f"{change:+.1f}%"
+        table.add_row(str(b.year),
+                      str(b.day),
+                      str(b.part),
+                      str(b.runs),
+                      f"{b.min_time:.4f}",
+                      f"{b.median_time:.4f}",
+                      f"{b.p95_time:.4f}",
+                      f"{b.baseline_median_time:.4f} ({b.baseline_commit})" if b.baseline_median_time else '',
+                      change_str)
+    return table
@@ -1,15 +1,27 @@
-from typing import Annotated
+import datetime as dt
+from pathlib import Path
+from typing import Annotated, Optional
 
 import typer
 from rich import print
 from rich.table import Table
 from bs4 import BeautifulSoup
 
-from advent_of_code.constants import LATEST_AOC_YEAR, SOLUTIONS_DIR
+from advent_of_code.benchmark import (DEFAULT_REGRESSION_THRESHOLD, DEFAULT_REPEATS, attach_baselines, 
+                                      find_regressions, make_benchmark_table, run_benchmarks, 
+                                      write_benchmarks_to_db)
+from advent_of_code.constants import LATEST_AOC_YEAR, LOGS_DIR, SOLUTIONS_DIR, TZ
 from advent_of_code.local import write_code_template
+from advent_of_code.memory import TOP_LINES, make_allocation_table, make_memory_table, measure_memory
+from advent_of_code.profiling import DEFAULT_INTERVAL, PROFILES_DIR, profile_solution
+from advent_of_code.result_cache import run_solutions_cached
+from advent_of_code.runner import (DEFAULT_TIMEOUT, SolutionFile, find_solution_files, get_solution_file,
+                                   make_results_table, write_results_json)
+from advent_of_code.verify import count_outcomes, make_verify_table, verify_solutions
 from advent_of_code.models import Puzzle
 from advent_of_code.exceptions import (PuzzleNotFound, PuzzleAnswerAlreadySubmitted, 
-                                       PuzzleLevelAlreadySolved, AOCLoginException, ElementNotFound)
+                                       PuzzleLevelAlreadySolved, AOCLoginException, ElementNotFound,
+                                       SolutionNotFound)
 
 app = typer.Typer()
 
@@ -20,6 +32,12 @@ def get_puzzle(year: int, day: int) -> Puzzle:
         puzzle = Puzzle.from_server(year, day)
         return puzzle
 
+def get_solution_file_or_exit(year: int, day: int) -> SolutionFile:
+    try:
+        return get_solution_file(year, day)
+    except SolutionNotFound as e:
+        raise typer.BadParameter(str(e), param_hint="'YEAR' / 'DAY'")
+
 @app.command(help='Make \"solutions\" subdirectories for 2015 through the latest AOC year (if not already created)')
 def makedirs():
     for x in range(2015, LATEST_AOC_YEAR+1):
@@ -29,9 +47,10 @@ def makedirs():
 
 @app.command(help="Refresh puzzle data from the AOC server")
 def refresh(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)], 
-            day: Annotated[int, typer.Argument(min=1, max=25)]):
+            day: Annotated[int, typer.Argument(min=1, max=25)],
+            force: Annotated[bool, typer.Option(help='Bypass the local HTTP cache')] = False):
     try:
-        puzzle = Puzzle.from_server(year, day)
+        puzzle = Puzzle.from_server(year, day, use_cache=not force)
     except (AOCLoginException, ElementNotFound):
         print("Refresh failed.")
         return None
@@ -53,8 +72,9 @@ def description(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEA
 
 @app.command(help='Make a new code file from template')
 def template(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)], 
-             day: Annotated[int, typer.Argument(min=1, max=25)]):
-    write_code_template(year, day)
+             day: Annotated[int, typer.Argument(min=1, max=25)],
+             lite: Annotated[bool, typer.Option(help='Defer the heavy scientific imports until used')] = False):
+    write_code_template(year, day, lite=lite)
  
 @app.command(help='Print the Advent of Code URL')
 def url(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)], 
@@ -133,6 +153,117 @@ def html(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)],
     soup = BeautifulSoup(puzzle.raw_html, 'html.parser')
     print(soup.prettify())
 
+@app.command(help='Run every solution in parallel and report per-part timings')
+def run(year: Annotated[Optional[int], typer.Option(min=2015, max=LATEST_AOC_YEAR)] = None,
+        day: Annotated[Optional[int], typer.Option(min=1, max=25)] = None,
+        workers: Annotated[Optional[int], typer.Option(min=1)] = None,
+        timeout: Annotated[float, typer.Option(help='Seconds allowed per part')] = DEFAULT_TIMEOUT,
+        output: Annotated[Optional[Path], typer.Option(help='JSON output file')] = None,
+        force: Annotated[bool, typer.Option(help='Re-run parts whose source and input are unchanged')] = False):
+    solutions = find_solution_files(year, day)
+    if not solutions:
+        print("No solutions found.")
+        return None
+
+    results = run_solutions_cached(solutions, max_workers=workers, timeout=timeout, force=force)
+    print(make_results_table(results))
+
+    if not output:
+        output = LOGS_DIR / 'runs' / f"run_{dt.datetime.now(tz=TZ).strftime('%Y%m%d_%H%M%S')}.json"
+    write_results_json(results, output)
+
+@app.command(help="Print a solution's answers, re-running it only if its source or input changed")
+def answer(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)], 
+           day: Annotated[int, typer.Argument(min=1, max=25)],
+           part: Annotated[Optional[int], typer.Option(min=1, max=2, help='Default: both parts')] = None,
+           timeout: Annotated[float, typer.Option(help='Seconds allowed per part')] = DEFAULT_TIMEOUT,
+           force: Annotated[bool, typer.Option(help='Ignore cached results')] = False):
+    solution = get_solution_file_or_exit(year, day)
+    results = run_solutions_cached([solution], parts=[part] if part else [1, 2], timeout=timeout, force=force)
+    print(make_results_table(results))
+
+@app.command(help='Benchmark solutions and flag median-time regressions against a stored baseline')
+def bench(year: Annotated[Optional[int], typer.Option(min=2015, max=LATEST_AOC_YEAR)] = None,
+          day: Annotated[Optional[int], typer.Option(min=1, max=25)] = None,
+          repeats: Annotated[int, typer.Option(min=1)] = DEFAULT_REPEATS,
+          threshold: Annotated[float, typer.Option(help='Regression threshold (percent)')] = DEFAULT_REGRESSION_THRESHOLD,
+          baseline: Annotated[Optional[str], typer.Option(help='Baseline commit (default: latest other commit)')] = None,
+          workers: Annotated[Optional[int], typer.Option(min=1)] = None,
+          timeout: Annotated[float, typer.Option(help='Seconds allowed per part')] = DEFAULT_TIMEOUT,
+          save: Annotated[bool, typer.Option(help='Store the results in the database')] = True):
+    solutions = find_solution_files(year, day)
+    if not solutions:
+        print("No solutions found.")
+        return None
+
+    benchmarks = run_benchmarks(solutions, repeats=repeats, max_workers=workers, timeout=timeout)
+    attach_baselines(benchmarks, baseline)
+    print(make_benchmark_table(benchmarks, threshold))
+    if save:
+        write_benchmarks_to_db(benchmarks)
+
+    regressions = find_regressions(benchmarks, threshold)
+    if regressions:
+        print(f"[red]{len(regressions)} regression(s) over {threshold}%:[/red] " + 
+              ', '.join(f"{b.year} day {b.day} part {b.part}" for b in regressions))
+        raise typer.Exit(code=1)
+
+@app.command(help='Run one solution under a sampling profiler and show its hottest functions')
+def profile(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)], 
+            day: Annotated[int, typer.Argument(min=1, max=25)],
+            part: Annotated[Optional[int], typer.Option(min=1, max=2, help='Default: both parts')] = None,
+            interval: Annotated[float, typer.Option(help='Seconds of CPU time between samples')] = DEFAULT_INTERVAL,
+            top: Annotated[int, typer.Option(min=1, help='Number of functions to show')] = 20,
+            output_dir: Annotated[Path, typer.Option(help='Where to write the profile files')] = PROFILES_DIR):
+    solution = get_solution_file_or_exit(year, day)
+    for part_num in ([part] if part else [1, 2]):
+        try:
+            result = profile_solution(solution, part_num, interval)
+        except SolutionNotFound as e:
+            if part:
+                print(f"[red]{e}[/red]")
+                raise typer.Exit(code=1)
+            print(f"Skipping part {part_num}: {e}")
+            continue
+        print(result.make_top_functions_table(top))
+        speedscope_path, collapsed_path = result.write_files(output_dir)
+        print(f"Answer: {result.return_value}")
+        print(f"Wrote {speedscope_path} (open at https://www.speedscope.app) and {collapsed_path}")
+
+@app.command(help='Report peak memory and the top allocating lines for each part of a solution')
+def mem(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)], 
+        day: Annotated[int, typer.Argument(min=1, max=25)],
+        part: Annotated[Optional[int], typer.Option(min=1, max=2, help='Default: both parts')] = None,
+        top: Annotated[int, typer.Option(min=1, help='Number of allocating lines to show')] = TOP_LINES,
+        timeout: Annotated[float, typer.Option(help='Seconds allowed per part')] = DEFAULT_TIMEOUT):
+    solution = get_solution_file_or_exit(year, day)
+    results = measure_memory([solution], parts=[part] if part else [1, 2], timeout=timeout, top=top)
+    print(make_memory_table(results))
+    for result in results:
+        if result.ok:
+            print(make_allocation_table(result))
+        elif result.error:
+            print(f"[red]Part {result.part}: {result.error}[/red]")
+
+@app.command(help='Run every solution and check its answers against the accepted answers on record')
+def verify(year: Annotated[Optional[int], typer.Option(min=2015, max=LATEST_AOC_YEAR)] = None,
+           day: Annotated[Optional[int], typer.Option(min=1, max=25)] = None,
+           workers: Annotated[Optional[int], typer.Option(min=1)] = None,
+           timeout: Annotated[float, typer.Option(help='Seconds allowed per part')] = DEFAULT_TIMEOUT,
+           show_all: Annotated[bool, typer.Option('--all', help='Also list passing parts')] = False):
+    solutions = find_solution_files(year, day)
+    if not solutions:
+        print("No solutions found.")
+        return None
+
+    verifications = verify_solutions(solutions, max_workers=workers, timeout=timeout)
+    print(make_verify_table(verifications, show_all))
+
+    counts = count_outcomes(verifications)
+    print(', '.join(f"{outcome}: {count}" for outcome, count in sorted(counts.items())))
+    if any(v.failed for v in verifications):
+        raise typer.Exit(code=1)
+
 # @app.command(help='XXXXXXXXXXXXXXXXXXXXXXXXXXXX')
 # def pull(year: Annotated[int, typer.Argument(min=2015, max=LATEST_AOC_YEAR)], 
 #          day: Annotated[int, typer.Argument(min=1, max=25)]):
@@ -12,9 +12,10 @@ AOC_SESSION = os.getenv('AOC_SESSION', '')
 ROOT_DIR = Path(__file__).parent.parent.parent.resolve()  # assumes that we're in ROOT/src/advent_of_code/constants.py
 
 DATA_DIR = ROOT_DIR / 'data'
-LOGS_DIR = ROOT_DIR / 'logs'
+LOGS_DIR = Path(os.getenv('AOC_LOGS_DIR', ROOT_DIR / 'logs'))   # git-ignored; override to log elsewhere
 SOLUTIONS_DIR = ROOT_DIR / 'solutions'
 CODE_TEMPLATE = ROOT_DIR / 'template.py'
+CODE_TEMPLATE_LITE = ROOT_DIR / 'template_lite.py'
 
 EASTERN_TIME = ZoneInfo('America/New_York')
 TZ = ZoneInfo(os.getenv('TZ', 'America/New_York'))
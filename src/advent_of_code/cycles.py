@@ -0,0 +1,126 @@
+from collections import deque
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+# Long simulations ("what does the grid look like after a billion minutes?") almost always
+# settle into a loop.  These run a simulation until a state repeats and then jump straight to
+# step N, so no puzzle has to hardcode a cycle start and length found from exploratory prints.
+#
+# `step(state)` returns the next state, or None if it updated `state` in place (so methods like
+# `area.tick` can be passed as they are).  `key(state)` is a hashable snapshot of whatever
+# decides the future (e.g. the grid as a string), and `observe(state)` is the value wanted at the
+# end.  When `step` mutates in place, both must return copies rather than the state itself.
+
+type Step = Callable[[Any], Any]
+
+class Cycle(NamedTuple):
+    start: int    # the first step of the repeating part
+    length: int
+
+    def equivalent_step(self, n: int) -> int:
+        ''' The earliest step whose state is the same as step `n`'s. '''
+        if n < self.start:
+            return n
+        return self.start + (n - self.start) % self.length
+
+def identity(state: Any) -> Any:
+    return state
+
+def advance(state: Any, step: Step) -> Any:
+    result = step(state)
+    return state if result is None else result
+
+def find_cycle(state: Any,
+               step: Step,
+               key: Callable[[Any], Hashable] = identity,
+               max_steps: Optional[int] = None) -> Optional[Cycle]:
+    ''' Steps until `key(state)` repeats, remembering every key seen.  None if there's no
+        repeat within `max_steps`. '''
+    seen: dict[Hashable, int] = {}
+    i = 0
+    while max_steps is None or i <= max_steps:
+        snapshot = key(state)
+        if snapshot in seen:
+            return Cycle(seen[snapshot], i - seen[snapshot])
+        seen[snapshot] = i
+        state = advance(state, step)
+        i += 1
+    return None
+
+def brent(state: Any,
+          step: Step,
+          key: Callable[[Any], Hashable] = identity,
+          max_steps: Optional[int] = None) -> Optional[Cycle]:
+    ''' Brent's algorithm: the same answer as `find_cycle` while holding two states rather than
+        a key per step, for about three times the steps.  `step` must return a new state, not
+        mutate its argument, since states are stepped from more than once. '''
+    power = length = 1
+    tortoise, hare = key(state), step(state)
+    steps = 1
+    while tortoise != key(hare):
+        if power == length:
+            tortoise = key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+        steps += 1
+        if max_steps is not None and steps > max_steps:
+            return None
+
+    # With the hare `length` steps ahead, the two first meet at the start of the cycle
+    tortoise = hare = state
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+    return Cycle(start, length)
+
+def fast_forward(state: Any,
+                 step: Step,
+                 n: int,
+                 key: Callable[[Any], Hashable] = identity,
+                 observe: Callable[[Any], Any] = identity,
+                 drift: bool = False) -> Any:
+    ''' `observe` of the state after `n` steps, skipping every whole lap of the cycle once the
+        states repeat.  With `drift`, the (numeric) observed value may also change by the same
+        amount every lap, e.g. the sum of positions of a pattern that repeats a few cells further
+        along; `key` should then describe the state without that shift. '''
+    seen: dict[Hashable, int] = {}
+    values = []
+    for i in range(n + 1):
+        snapshot = key(state)
+        if snapshot in seen:
+            cycle = Cycle(seen[snapshot], i - seen[snapshot])
+            laps, offset = divmod(n - cycle.start, cycle.length)
+            value = values[cycle.start + offset]
+            if drift:
+                value += laps * (observe(state) - values[cycle.start])
+            return value
+        seen[snapshot] = i
+        values.append(observe(state))
+        if i == n:
+            break
+        state = advance(state, step)
+    return values[n]
+
+def extrapolate_linear(state: Any,
+                       step: Step,
+                       n: int,
+                       observe: Callable[[Any], int | float],
+                       confirmations: int = 20) -> int | float:
+    ''' `observe` after `n` steps, for a value that ends up changing by a fixed amount per step
+        when there's no handy `key` for `fast_forward`.  This is a heuristic: the drift counts as
+        steady once the last `confirmations` differences are all equal. '''
+    recent: deque[int | float] = deque(maxlen=confirmations + 1)
+    for i in range(n + 1):
+        recent.append(observe(state))
+        if i == n:
+            break
+        if len(recent) == recent.maxlen:
+            differences = {b - a for a, b in zip(recent, list(recent)[1:])}
+            if len(differences) == 1:
+                return recent[-1] + differences.pop() * (n - i)
+        state = advance(state, step)
+    return recent[-1]
@@ -17,4 +17,12 @@ class PuzzleAnswerAlreadySubmitted(Exception):
     pass
 
 class PuzzleLevelAlreadySolved(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class SolutionNotFound(Exception):
+    pass
+
+class SolutionTimeout(Exception):
+    pass
+class PuzzleInputNotFound(Exception):
+    pass
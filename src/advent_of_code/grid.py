@@ -0,0 +1,167 @@
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+type Coordinate = tuple[int, int]   # (row, col)
+
+class ParsedGrid(NamedTuple):
+    array: np.ndarray              # uint8, shape (rows, cols)
+    start: Optional[Coordinate]
+    target: Optional[Coordinate]
+
+def to_bytes(data: str | bytes | bytearray | memoryview) -> bytes:
+    raw = data.encode() if isinstance(data, str) else bytes(data)
+    if b'\r' in raw:
+        raw = raw.replace(b'\r', b'')
+    return raw.rstrip(b'\n')   # like str.splitlines(): leading blank rows are rows
+
+def make_lookup_table(codes: dict[str, int], default: int = 255) -> np.ndarray:
+    ''' A 256-entry table mapping each byte to its code (`default` for unlisted characters). '''
+    table = np.full(256, default, dtype=np.uint8)
+    for char, code in codes.items():
+        table[ord(char)] = code
+    return table
+
+def find(array: np.ndarray, value: int) -> list[Coordinate]:
+    ''' Every (row, col) where the array equals `value`, in reading order. '''
+    return [(int(row), int(col)) for row, col in np.argwhere(array == value)]
+
+def parse(data: str | bytes | bytearray | memoryview,
+          codes: Optional[dict[str, int]] = None,
+          start: Optional[str] = 'S',
+          target: Optional[str] = 'E',
+          default: Optional[int] = None) -> ParsedGrid:
+    ''' Turns a rectangular text grid into a 2D `uint8` array in one pass over a single buffer:
+        no per-cell Python objects.  Without `codes` each cell holds its ASCII value (so
+        `array == ord('#')` works); with `codes` each character is mapped through a lookup table,
+        and any character missing from it raises unless a `default` code is given.  The first
+        `start` and `target` characters are found (on the raw characters, before mapping) and
+        returned as (row, col), or None if absent. '''
+    raw = to_bytes(data)
+    width = raw.find(b'\n')
+    if width == -1:
+        width = len(raw)
+    if not raw:
+        return ParsedGrid(np.zeros((0, 0), dtype=np.uint8), None, None)
+    if (len(raw) + 1) % (width + 1):
+        raise ValueError("Grid lines are not all the same length")
+
+    # Each row is `width` cells plus its newline; the newline column is sliced away
+    flat = np.frombuffer(raw + b'\n', dtype=np.uint8)
+    chars = flat.reshape(-1, width + 1)[:, :width]
+    if (chars == ord('\n')).any() or (flat.reshape(-1, width + 1)[:, width] != ord('\n')).any():
+        raise ValueError("Grid lines are not all the same length")
+
+    def locate(char: Optional[str]) -> Optional[Coordinate]:
+        if not char:
+            return None
+        matches = np.flatnonzero(chars == ord(char))
+        if not matches.size:
+            return None
+        row, col = divmod(int(matches[0]), width)
+        return (row, col)
+
+    if codes is None:
+        array = chars.copy()
+    else:
+        table = make_lookup_table(codes, 255 if default is None else default)
+        array = table[chars]
+        if default is None:
+            unmapped = set(chars[array == 255].tobytes().decode()) - {c for c, code in codes.items() if code == 255}
+            if unmapped:
+                raise ValueError(f"No code given for character(s): {''.join(sorted(unmapped))!r}")
+
+    return ParsedGrid(array, locate(start), locate(target))
+
+
+# (row, col) deltas, clockwise from north
+ORTHOGONAL_DELTAS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+ALL_DELTAS = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+class Grid:
+    ''' A 2D grid of small ints in one flat buffer, addressed by linear index.
+
+        `data` (a `bytearray`, for fast per-cell access from Python loops) and `cells` (a NumPy
+        view of the same memory, for vectorized work) are always in sync.  With `pad_value`,
+        the grid gets a one-cell border of that value, so neighbor lookups need no bounds
+        checks: `index + offset` always lands on a real cell or a sentinel. '''
+    def __init__(self, array: np.ndarray, pad_value: Optional[int] = None):
+        self.rows, self.cols = array.shape
+        self.pad = 0 if pad_value is None else 1
+        if pad_value is not None:
+            array = np.pad(array, 1, constant_values=pad_value)
+        self.width = self.cols + 2 * self.pad
+        self.data = bytearray(np.ascontiguousarray(array, dtype=np.uint8).tobytes())
+        self.cells = np.frombuffer(self.data, dtype=np.uint8)
+        self.offsets_4 = tuple(dr * self.width + dc for dr, dc in ORTHOGONAL_DELTAS)
+        self.offsets_8 = tuple(dr * self.width + dc for dr, dc in ALL_DELTAS)
+        self.start: Optional[int] = None
+        self.target: Optional[int] = None
+
+    @classmethod
+    def from_text(cls,
+                  data: str | bytes | bytearray | memoryview,
+                  codes: Optional[dict[str, int]] = None,
+                  pad_value: Optional[int] = None,
+                  start: Optional[str] = 'S',
+                  target: Optional[str] = 'E',
+                  default: Optional[int] = None) -> "Grid":
+        parsed = parse(data, codes, start, target, default)
+        grid = cls(parsed.array, pad_value)
+        grid.start = grid.index(*parsed.start) if parsed.start else None
+        grid.target = grid.index(*parsed.target) if parsed.target else None
+        return grid
+
+    @property
+    def array(self) -> np.ndarray:
+        ''' A writable (rows, cols) view of the grid, without the padding. '''
+        return self.cells.reshape(-1, self.width)[self.pad:self.pad + self.rows, self.pad:self.pad + self.cols]
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.pad) * self.width + col + self.pad
+
+    def coordinate(self, index: int) -> Coordinate:
+        row, col = divmod(index, self.width)
+        return (row - self.pad, col - self.pad)
+
+    def in_bounds(self, index: int) -> bool:
+        row, col = self.coordinate(index)
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def __getitem__(self, index: int) -> int:
+        return self.data[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.data[index] = value
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def neighbors(self, index: int, diagonal: bool = False) -> list[int]:
+        ''' Indices of the cell's neighbors.  On a padded grid these may be sentinel cells. '''
+        offsets = self.offsets_8 if diagonal else self.offsets_4
+        if self.pad:
+            return [index + offset for offset in offsets]
+        row, col = self.coordinate(index)
+        return [self.index(row + dr, col + dc) for dr, dc in (ALL_DELTAS if diagonal else ORTHOGONAL_DELTAS)
+                if 0 <= row + dr < self.rows and 0 <= col + dc < self.cols]
+
+    def indices_of(self, value: int) -> list[int]:
+        ''' Linear indices of every (non-padding) cell equal to `value`. '''
+        return [self.index(row, col) for row, col in find(self.array, value)]
+
+    def count_neighbors(self, value: int, diagonal: bool = True) -> np.ndarray:
+        ''' For every cell, how many of its neighbors equal `value`, as a (rows, cols) array.
+            Cells outside the grid never count, whatever the padding holds. '''
+        mask = np.pad((self.array == value).astype(np.uint8), 1)
+        counts = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        for dr, dc in (ALL_DELTAS if diagonal else ORTHOGONAL_DELTAS):
+            counts += mask[1 + dr:1 + dr + self.rows, 1 + dc:1 + dc + self.cols]
+        return counts
+
+    def to_text(self, chars: Optional[dict[int, str]] = None) -> str:
+        ''' The inverse of `from_text` (ASCII values by default), e.g. for printing. '''
+        if chars is None:
+            return '\n'.join(row.tobytes().decode() for row in self.array)
+        table = np.array([ord(chars.get(i, '?')) for i in range(256)], dtype=np.uint8)
+        return '\n'.join(row.tobytes().decode() for row in table[self.array])
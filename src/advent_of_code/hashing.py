@@ -0,0 +1,67 @@
+import hashlib
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, NamedTuple, Optional
+
+# Brute-force searches for MD5 hashes of `prefix + str(nonce)` that start with some number of
+# zero hex digits.  The prefix is fed to MD5 once and the hasher copied for each candidate, the
+# zeros are checked on the raw digest bytes rather than a hex string, and the nonce space is
+# split into chunks spread over a process pool.  Matches always come back in nonce order.
+
+CHUNK_SIZE = 50_000
+
+class Match(NamedTuple):
+    nonce: int
+    hexdigest: str
+
+def mine_chunk(prefix: bytes, zeros: int, start: int, stop: int) -> list[Match]:
+    ''' Every match with a nonce in [start, stop).  A hash starts with `zeros` zero hex digits
+        when its first `zeros // 2` bytes are zero and, for an odd count, the next byte is < 16. '''
+    full, half = divmod(zeros, 2)
+    zero_bytes = bytes(full)
+    base = hashlib.md5(prefix)
+    matches = []
+    for nonce in range(start, stop):
+        hasher = base.copy()
+        hasher.update(b'%d' % nonce)
+        digest = hasher.digest()
+        if digest[:full] == zero_bytes and (not half or digest[full] < 0x10):
+            matches.append(Match(nonce, digest.hex()))
+    return matches
+
+def iter_matches(prefix: str | bytes,
+                 zeros: int = 5,
+                 start: int = 0,
+                 max_workers: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE) -> Iterator[Match]:
+    ''' Matches in increasing nonce order, without end: stop iterating once you have enough.
+        A few chunks per worker are kept in flight, and only yielded once every earlier chunk
+        is done.  With `max_workers=1` everything runs in this process. '''
+    if isinstance(prefix, str):
+        prefix = prefix.encode()
+    chunk_starts = itertools.count(start, chunk_size)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if max_workers == 1:
+        for chunk_start in chunk_starts:
+            yield from mine_chunk(prefix, zeros, chunk_start, chunk_start + chunk_size)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    pending: deque[Future] = deque()
+    try:
+        for chunk_start in itertools.islice(chunk_starts, 2 * max_workers):
+            pending.append(executor.submit(mine_chunk, prefix, zeros, chunk_start, chunk_start + chunk_size))
+        while True:
+            matches = pending.popleft().result()
+            chunk_start = next(chunk_starts)
+            pending.append(executor.submit(mine_chunk, prefix, zeros, chunk_start, chunk_start + chunk_size))
+            yield from matches
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def find_nonce(prefix: str | bytes, zeros: int = 5, start: int = 0, max_workers: Optional[int] = None) -> int:
+    ''' The lowest nonce whose hash starts with `zeros` zero hex digits. '''
+    return next(iter_matches(prefix, zeros, start, max_workers)).nonce
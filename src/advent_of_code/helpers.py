@@ -1,4 +1,7 @@
 import datetime as dt
+import importlib.util
+import sys
+from types import ModuleType
 
 from rich import print
 
@@ -27,6 +30,21 @@ def validate_year_and_day(year: int|str, day: int|str) -> None:
         raise ValueError(f"Invalid day: {day} (must be between 1 and {dt.date.today().day})")
     return None
 
+def lazy_import(name: str) -> ModuleType:
+    ''' Returns a module whose actual import is deferred until one of its attributes is used
+        (the `importlib.util.LazyLoader` recipe from the standard library docs). '''
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
 def make_solution_dirs():
     for x in range(2015, LATEST_AOC_YEAR+1):
         new_dir = SOLUTIONS_DIR / f"{x}"
@@ -1,8 +1,54 @@
-from bs4 import BeautifulSoup
+import importlib.util
+from typing import NamedTuple, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
 
 from advent_of_code.constants import PART_ONE_SOLVED_TEXT, PART_TWO_SOLVED_TEXT
 from advent_of_code.exceptions import ElementNotFound
 
+# lxml's tree builder is several times faster than the pure-Python one, but it's optional
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+class ParsedPuzzleHTML(NamedTuple):
+    title: str
+    part_1_description: str
+    part_2_description: str
+    example_text: str
+    part_1_answer: str
+    part_2_answer: str
+    part_1_solved: bool
+    part_2_solved: bool
+
+def make_soup(raw_html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    ''' Builds the tree for just the `<main>` element (everything we read lives there), falling
+        back to the whole page if there isn't one. '''
+    parser = parser or HTML_PARSER
+    soup = BeautifulSoup(raw_html, parser, parse_only=SoupStrainer('main'))
+    if not soup.find('main'):
+        soup = BeautifulSoup(raw_html, parser)
+    return soup
+
+def parse_puzzle_html(raw_html: str, parser: Optional[str] = None) -> ParsedPuzzleHTML:
+    ''' Extracts everything we store about a puzzle page from a single parse. '''
+    soup = make_soup(raw_html, parser)
+
+    title, part_1_description, part_2_description = get_puzzle_title_and_descriptions_from_soup(soup)
+    try:
+        example_text = get_example_from_soup(soup)
+    except ElementNotFound:
+        example_text = ''
+    part_1_answer, part_2_answer = get_answers_from_soup(soup)
+    part_1_solved, part_2_solved = get_solved_statuses_from_soup(soup)
+
+    return ParsedPuzzleHTML(title=title,
+                            part_1_description=part_1_description,
+                            part_2_description=part_2_description,
+                            example_text=example_text,
+                            part_1_answer=part_1_answer,
+                            part_2_answer=part_2_answer,
+                            part_1_solved=part_1_solved,
+                            part_2_solved=part_2_solved)
+
 def get_puzzle_title_from_soup(soup: BeautifulSoup) -> str:
     title = soup.find('h2')
 
@@ -12,9 +58,10 @@ def get_puzzle_title_from_soup(soup: BeautifulSoup) -> str:
     return title.get_text()
 
 def get_solved_statuses_from_soup(soup: BeautifulSoup) -> tuple[bool, bool]:
-    if PART_TWO_SOLVED_TEXT in soup.get_text():
+    text = soup.get_text()
+    if PART_TWO_SOLVED_TEXT in text:
         return (True, True)
-    elif PART_ONE_SOLVED_TEXT in soup.get_text():
+    elif PART_ONE_SOLVED_TEXT in text:
         return (True, False)
     else:
         return (False, False)
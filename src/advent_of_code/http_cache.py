@@ -0,0 +1,83 @@
+import datetime as dt
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+from advent_of_code.logging_config import logger
+
+from advent_of_code.constants import AOC_SESSION, DATA_DIR
+
+HTTP_CACHE_DIR = DATA_DIR / 'http_cache'
+
+class ResponseCache:
+    ''' Content-addressed cache of response bodies from the AOC server.
+
+        - `index/<key>.json` maps a (URL, session) key to the hash of the body and its fetch time
+        - `objects/<hash[:2]>/<hash>` holds each distinct body once
+    '''
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR, session: str = AOC_SESSION):
+        self.cache_dir = cache_dir
+        self.session_hash = hashlib.sha256(session.encode()).hexdigest()
+
+    def get_key(self, url: str) -> str:
+        return hashlib.sha256(f"{url}\0{self.session_hash}".encode()).hexdigest()
+
+    def get_index_path(self, url: str) -> Path:
+        return self.cache_dir / 'index' / f"{self.get_key(url)}.json"
+
+    def get_object_path(self, content_hash: str) -> Path:
+        return self.cache_dir / 'objects' / content_hash[:2] / content_hash
+
+    def get_entry(self, url: str) -> Optional[dict]:
+        index_path = self.get_index_path(url)
+        if not index_path.exists():
+            return None
+        with open(index_path) as f:
+            return json.load(f)
+
+    def get_age(self, url: str) -> Optional[dt.timedelta]:
+        entry = self.get_entry(url)
+        if not entry:
+            return None
+        return dt.datetime.now(dt.timezone.utc) - dt.datetime.fromisoformat(entry['fetched_at'])
+
+    def get(self, url: str, max_age: Optional[dt.timedelta] = None) -> Optional[str]:
+        ''' Returns the cached body, or None if it's missing or older than `max_age`
+            (`max_age=None` means the entry never expires). '''
+        entry = self.get_entry(url)
+        if not entry:
+            return None
+
+        if max_age is not None and self.get_age(url) > max_age:   # type: ignore
+            logger.debug(f"HTTP cache expired: {url}")
+            return None
+
+        object_path = self.get_object_path(entry['content_hash'])
+        if not object_path.exists():
+            return None
+        logger.debug(f"HTTP cache hit: {url}")
+        return object_path.read_text()
+
+    def put(self, url: str, text: str) -> str:
+        content_hash = hashlib.sha256(text.encode()).hexdigest()
+        object_path = self.get_object_path(content_hash)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(object_path, text)
+
+        index_path = self.get_index_path(url)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(index_path, json.dumps({'url': url,
+                                             'content_hash': content_hash,
+                                             'fetched_at': dt.datetime.now(dt.timezone.utc).isoformat()}))
+        return content_hash
+
+    def invalidate(self, url: str) -> None:
+        self.get_index_path(url).unlink(missing_ok=True)
+        logger.debug(f"HTTP cache invalidated: {url}")
+
+def write_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(text)
+    tmp_path.replace(path)
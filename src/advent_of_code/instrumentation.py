@@ -0,0 +1,169 @@
+import atexit
+import contextlib
+import contextvars
+import datetime as dt
+import functools
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from advent_of_code.constants import LOGS_DIR
+
+# Off unless AOC_INSTRUMENT is set ("1", or a path for the JSON dump).  When it's off, the
+# decorators hand back the undecorated function, so instrumented solutions pay nothing.
+INSTRUMENT_ENV_VAR = 'AOC_INSTRUMENT'
+ENABLED = os.getenv(INSTRUMENT_ENV_VAR, '') not in ('', '0')
+INSTRUMENTATION_DIR = LOGS_DIR / 'instrumentation'
+
+@dataclass
+class TimerStat:
+    calls: int = 0
+    seconds: float = 0.0
+
+@dataclass
+class Registry:
+    ''' Counters and timers for one scope (e.g. a whole script, or one part of a solution). '''
+    name: str
+    counters: Counter[str] = field(default_factory=Counter)
+    timers: dict[str, TimerStat] = field(default_factory=dict)
+    children: list["Registry"] = field(default_factory=list)
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    def increment(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def add_time(self, name: str, seconds: float) -> None:
+        stat = self.timers.setdefault(name, TimerStat())
+        stat.calls += 1
+        stat.seconds += seconds
+
+    def merge(self, other: "Registry") -> None:
+        self.counters.update(other.counters)
+        for name, stat in other.timers.items():
+            own_stat = self.timers.setdefault(name, TimerStat())
+            own_stat.calls += stat.calls
+            own_stat.seconds += stat.seconds
+
+    def get_rate(self, name: str) -> float:
+        ''' Operations per second: over the matching timer if there is one, else over the scope. '''
+        seconds = self.timers[name].seconds if name in self.timers else self.elapsed
+        return self.counters[name] / seconds if seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'elapsed': self.elapsed,
+            'counters': {name: {'count': count, 'per_second': self.get_rate(name)}
+                         for name, count in sorted(self.counters.items())},
+            'timers': {name: {'calls': stat.calls,
+                              'seconds': stat.seconds,
+                              'calls_per_second': stat.calls / stat.seconds if stat.seconds else 0.0}
+                       for name, stat in sorted(self.timers.items())},
+            'scopes': [child.to_dict() for child in self.children],
+        }
+
+ROOT_REGISTRY = Registry(Path(sys.argv[0]).stem or 'python')
+CURRENT_REGISTRY: contextvars.ContextVar[Registry] = contextvars.ContextVar('aoc_registry', default=ROOT_REGISTRY)
+
+def get_registry() -> Registry:
+    return CURRENT_REGISTRY.get()
+
+def increment(name: str, n: int = 1) -> None:
+    ''' For counting inside a loop, e.g. `aoc.increment('nodes_expanded')`. '''
+    if ENABLED:
+        CURRENT_REGISTRY.get().increment(name, n)
+
+@contextlib.contextmanager
+def counter_scope(name: str) -> Iterator[Registry]:
+    ''' Collects counts in a fresh registry, which is then folded into (and nested under) the
+        enclosing one.  Scopes follow `contextvars`, so threads and asyncio tasks don't mix.
+        When instrumentation is off, this is just the enclosing registry, left untouched. '''
+    parent = CURRENT_REGISTRY.get()
+    if not ENABLED:
+        yield parent
+        return
+    registry = Registry(name)
+    token = CURRENT_REGISTRY.set(registry)
+    try:
+        yield registry
+    finally:
+        registry.end = time.perf_counter()
+        CURRENT_REGISTRY.reset(token)
+        parent.merge(registry)
+        parent.children.append(registry)
+
+@contextlib.contextmanager
+def timer(name: str) -> Iterator[None]:
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        CURRENT_REGISTRY.get().add_time(name, time.perf_counter() - start)
+
+def counted(fn: Optional[Callable] = None, *, name: Optional[str] = None) -> Callable:
+    ''' Counts calls to the function.  Works bare (`@counted`) or with a name (`@counted(name=...)`). '''
+    def decorator(fn: Callable) -> Callable:
+        if not ENABLED:
+            return fn
+        counter_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            CURRENT_REGISTRY.get().increment(counter_name)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator(fn) if fn else decorator
+
+def timed(fn: Optional[Callable] = None, *, name: Optional[str] = None) -> Callable:
+    ''' Accumulates calls and total time spent in the function (recursive calls included). '''
+    def decorator(fn: Callable) -> Callable:
+        if not ENABLED:
+            return fn
+        timer_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                CURRENT_REGISTRY.get().add_time(timer_name, time.perf_counter() - start)
+        return wrapper
+
+    return decorator(fn) if fn else decorator
+
+def get_output_path() -> Path:
+    value = os.getenv(INSTRUMENT_ENV_VAR, '')
+    if value not in ('', '0', '1'):
+        return Path(value)
+    timestamp = dt.datetime.now().strftime('%Y%m%d_%H%M%S')
+    return INSTRUMENTATION_DIR / f"{ROOT_REGISTRY.name}_{timestamp}.json"
+
+def dump_json(filepath: Optional[Path] = None, registry: Registry = ROOT_REGISTRY) -> Path:
+    filepath = filepath or get_output_path()
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    registry.end = time.perf_counter()
+    with open(filepath, 'w') as f:
+        json.dump(registry.to_dict(), f, indent=2)
+    return filepath
+
+def dump_at_exit() -> None:
+    if ROOT_REGISTRY.counters or ROOT_REGISTRY.timers:
+        print(f"Instrumentation written to {dump_json()}", file=sys.stderr)
+
+if ENABLED:
+    atexit.register(dump_at_exit)
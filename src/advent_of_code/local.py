@@ -1,22 +1,15 @@
 from pathlib import Path
 
-from bs4 import BeautifulSoup
-from loguru import logger
+from advent_of_code.logging_config import logger
 from rich.table import Table
 
-from advent_of_code.constants import CODE_TEMPLATE, DATA_DIR, LATEST_AOC_YEAR, SOLUTIONS_DIR
-from advent_of_code.exceptions import ElementNotFound
+from advent_of_code.constants import CODE_TEMPLATE, CODE_TEMPLATE_LITE, DATA_DIR, LATEST_AOC_YEAR, SOLUTIONS_DIR
 from advent_of_code.helpers import validate_year_and_day
-from advent_of_code.html_parsing import (
-    get_example_from_soup,
-    get_puzzle_description_from_soup,
-    get_puzzle_title_from_soup,
-    get_solved_statuses_from_soup,
-)
+from advent_of_code.html_parsing import parse_puzzle_html
 from advent_of_code.models import Puzzle
 
 
-def write_code_template(year: int, day: int, overwrite: bool = False) -> None:
+def write_code_template(year: int, day: int, overwrite: bool = False, lite: bool = False) -> None:
     solution_dir = Path(SOLUTIONS_DIR / str(year))
 
     if not solution_dir.exists():
@@ -28,13 +21,14 @@ def write_code_template(year: int, day: int, overwrite: bool = False) -> None:
         logger.error(f"File {file} already exists.")
         return None
         
-    with open(CODE_TEMPLATE, 'r') as f:
+    with open(CODE_TEMPLATE_LITE if lite else CODE_TEMPLATE, 'r') as f:
         template_text = f.read()
     with open(solution_dir / f"day{day:02d}.py", 'w') as f:
         f.write(template_text.removesuffix('\n'))
 
 
-def get_puzzle_from_local(year: int, day: int) -> Puzzle:
+def get_puzzle_values_from_local(year: int, day: int) -> dict:
+    ''' Parses the saved HTML (and input) files into a dict of `puzzles` column values. '''
     if year < 2015 or year > LATEST_AOC_YEAR:
         raise ValueError(f"Invalid year: {year}")
     if day < 1 or day > 31: 
@@ -49,21 +43,9 @@ def get_puzzle_from_local(year: int, day: int) -> Puzzle:
     with open(filepath, 'r') as f:
         raw_html = f.read()
 
-    soup = BeautifulSoup(raw_html, 'html.parser')
-
-    part_1_solved, part_2_solved = get_solved_statuses_from_soup(soup)
-    
-    part_1_description, part_2_description = get_puzzle_description_from_soup(soup)
-
-    title = get_puzzle_title_from_soup(soup)
-    part_1_description = part_1_description.replace(title, '')
-    part_2_description = part_2_description.replace('--- Part Two ---', '')
-
-    try:
-        example_text = get_example_from_soup(soup)
-    except ElementNotFound as e:
-        logger.debug(f"{year} DAY {day:02d} | {e}")
-        example_text = ''
+    parsed = parse_puzzle_html(raw_html)
+    if not parsed.example_text:
+        logger.debug(f"{year} DAY {day:02d} | No example found")
 
     input_filepath = DATA_DIR / str(year) / str(day) / 'input.txt'
     if input_filepath.exists():
@@ -72,16 +54,27 @@ def get_puzzle_from_local(year: int, day: int) -> Puzzle:
     else:
         input_text = ''
 
-    return Puzzle(year=year, 
+    return dict(year=year, 
                 day=day, 
-                title=title,
-                part_1_description=part_1_description,
-                part_1_solved=part_1_solved,
-                part_2_description=part_2_description,
-                part_2_solved=part_2_solved,
-                example_text=example_text,
+                title=parsed.title,
+                part_1_description=parsed.part_1_description,
+                part_1_solved=parsed.part_1_solved,
+                part_2_description=parsed.part_2_description,
+                part_2_solved=parsed.part_2_solved,
+                example_text=parsed.example_text,
                 input_text=input_text,
-                raw_html=raw_html)
+                raw_html=raw_html,
+                url=f"https://adventofcode.com/{year}/day/{day}")
+
+
+def get_puzzle_from_local(year: int, day: int) -> Puzzle:
+    return Puzzle(**get_puzzle_values_from_local(year, day))
+
+
+def get_all_puzzle_values_from_local() -> list[dict]:
+    return [get_puzzle_values_from_local(year, day) 
+            for year in range(2015, LATEST_AOC_YEAR+1)
+            for day in range(1, 26)]
 
 
 def get_all_puzzles_from_local() -> list[Puzzle]:
@@ -22,6 +22,10 @@ def setup_logging():
         retention="30 days",
         serialize=False,
         diagnose=True,
+        delay=True,   # don't open the log file until something is logged
         level='DEBUG'
     )
 
+# Modules that log import `logger` from here (rather than from loguru), so the sinks are set 
+# up the first time one of them loads instead of on every `import advent_of_code`
+setup_logging()
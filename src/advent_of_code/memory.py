@@ -0,0 +1,173 @@
+import contextlib
+import io
+import linecache
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Optional
+
+from rich.table import Table
+
+from advent_of_code.exceptions import SolutionTimeout
+from advent_of_code.runner import (DEFAULT_TIMEOUT, PartResult, SolutionFile, call_part_function,
+                                   get_part_function, get_peak_rss_kb, load_solution_module,
+                                   run_solutions, time_limit)
+
+TOP_LINES = 10
+RSS_SAMPLE_INTERVAL = 0.01   # seconds
+PAGE_SIZE_KB = os.sysconf('SC_PAGE_SIZE') // 1024
+
+@dataclass
+class AllocationSite:
+    location: str
+    source: str
+    size_kb: float
+    count: int
+
+@dataclass
+class MemoryResult(PartResult):
+    start_rss_kb: int = 0          # after importing the solution (and loading its input)
+    sampled_peak_rss_kb: int = 0   # highest RSS seen while the part ran
+    traced_peak_kb: float = 0.0    # peak of Python allocations made by the part
+    top_lines: list[AllocationSite] = field(default_factory=list)
+
+    @property
+    def rss_growth_kb(self) -> int:
+        return max(self.sampled_peak_rss_kb - self.start_rss_kb, 0)
+
+
+def get_current_rss_kb() -> int:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * PAGE_SIZE_KB
+    except OSError:
+        return get_peak_rss_kb()   # no procfs (e.g. macOS); the high-water mark is the best we have
+
+class RSSSampler:
+    ''' Polls the process's RSS from a background thread, since `ru_maxrss` can't tell the
+        part's peak apart from whatever the import step already used. '''
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak_kb = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def sample(self) -> None:
+        while True:
+            self.peak_kb = max(self.peak_kb, get_current_rss_kb())
+            if self.stop_event.wait(self.interval):
+                return None
+
+    def __enter__(self) -> "RSSSampler":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop_event.set()
+        self.thread.join()
+        self.peak_kb = max(self.peak_kb, get_current_rss_kb())
+
+def get_top_allocation_sites(snapshot: tracemalloc.Snapshot, limit: int = TOP_LINES) -> list[AllocationSite]:
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                       tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+                                       tracemalloc.Filter(False, '<unknown>')])
+    sites = []
+    for stat in snapshot.statistics('lineno')[:limit]:
+        frame = stat.traceback[0]
+        sites.append(AllocationSite(location=f"{Path(frame.filename).name}:{frame.lineno}",
+                                    source=linecache.getline(frame.filename, frame.lineno).strip(),
+                                    size_kb=stat.size / 1024,
+                                    count=stat.count))
+    return sites
+
+def run_part_memory(solution: SolutionFile,
+                    part: int,
+                    timeout: Optional[float] = DEFAULT_TIMEOUT,
+                    top: int = TOP_LINES) -> MemoryResult:
+    ''' Like `run_part`, but traces the part's allocations and samples RSS while it runs.  The
+        allocation sites are taken from a snapshot at the end of the part, so they show what the
+        part (and its module-level caches) still held when it returned. '''
+    result = MemoryResult(solution.year, solution.day, part)
+    try:
+        with time_limit(timeout), contextlib.redirect_stdout(io.StringIO()):
+            module = load_solution_module(solution.path)
+            fn = get_part_function(module, part)
+            if fn is None or not hasattr(module, 'INPUT'):
+                result.status = 'missing'
+            else:
+                result.start_rss_kb = get_current_rss_kb()
+                sampler = RSSSampler()
+                tracemalloc.start()
+                start_wall = time.perf_counter()
+                start_cpu = time.process_time()
+                try:
+                    with sampler:
+                        answer = call_part_function(fn, module.INPUT)
+                    result.answer = str(answer)
+                finally:
+                    result.wall_time = time.perf_counter() - start_wall
+                    result.cpu_time = time.process_time() - start_cpu
+                    result.traced_peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+                    result.top_lines = get_top_allocation_sites(tracemalloc.take_snapshot(), top)
+                    tracemalloc.stop()
+                    result.sampled_peak_rss_kb = sampler.peak_kb
+    except SolutionTimeout:
+        result.status = 'timeout'
+        result.error = f"Timed out after {timeout} seconds"
+    except BaseException as e:
+        result.status = 'error'
+        result.error = f"{type(e).__name__}: {e}"
+    result.peak_rss_kb = get_peak_rss_kb()
+    return result
+
+def measure_memory(solutions: Iterable[SolutionFile],
+                   parts: Iterable[int] = (1, 2),
+                   max_workers: Optional[int] = None,
+                   timeout: Optional[float] = DEFAULT_TIMEOUT,
+                   top: int = TOP_LINES) -> list[MemoryResult]:
+    ''' Each part gets a fresh worker process, so RSS figures aren't inflated by earlier parts. '''
+    return run_solutions(solutions, parts, max_workers, timeout,
+                         task=partial(run_part_memory, top=top),
+                         result_type=MemoryResult)   # type: ignore
+
+def make_memory_table(results: list[MemoryResult]) -> Table:
+    table = Table()
+    table.add_column('Year')
+    table.add_column('Day', justify='right')
+    table.add_column('Part', justify='center')
+    table.add_column('Status')
+    table.add_column('Wall (s)', justify='right')
+    table.add_column('Start RSS (MB)', justify='right')
+    table.add_column('Peak RSS (MB)', justify='right')
+    table.add_column('RSS Growth (MB)', justify='right')
+    table.add_column('Traced Peak (MB)', justify='right')
+    for result in results:
+        status = result.status if result.ok else f"[red]{result.status}[/red]"
+        if result.start_rss_kb:
+            memory = (f"{result.start_rss_kb / 1024:.1f}",
+                      f"{max(result.sampled_peak_rss_kb, result.peak_rss_kb) / 1024:.1f}",
+                      f"{result.rss_growth_kb / 1024:.1f}",
+                      f"{result.traced_peak_kb / 1024:.1f}")
+        else:
+            memory = ('-',) * 4   # the part never started, or its worker died before reporting
+        table.add_row(str(result.year),
+                      str(result.day),
+                      str(result.part),
+                      status,
+                      f"{result.wall_time:.3f}",
+                      *memory)
+    return table
+
+def make_allocation_table(result: MemoryResult) -> Table:
+    table = Table(title=f"{result.year} DAY {result.day:02d} Part {result.part}: top allocating lines")
+    table.add_column('Line')
+    table.add_column('Source')
+    table.add_column('Size (KB)', justify='right')
+    table.add_column('Blocks', justify='right')
+    for site in result.top_lines:
+        table.add_row(site.location, site.source, f"{site.size_kb:,.1f}", f"{site.count:,}")
+    return table
@@ -3,23 +3,23 @@ from typing import Optional, Literal, Self
 
 import sqlalchemy as db
 from sqlalchemy.exc import IntegrityError
-from bs4 import BeautifulSoup
-from loguru import logger
+from advent_of_code.logging_config import logger
 
-from advent_of_code.constants import SQLITE_URL
+from advent_of_code.sql_engine import get_engine
 from advent_of_code.sql_schema import puzzles_table, answers_table
-from advent_of_code.exceptions import (ElementNotFound, AOCLoginException, PuzzleNotFound, 
+from advent_of_code.exceptions import (AOCLoginException, PuzzleNotFound, 
                                        PuzzleAnswerAlreadySubmitted, PuzzleLevelAlreadySolved)
 from advent_of_code.helpers import validate_year_and_day
-from advent_of_code.server import get_raw_html_from_server, get_input_from_server
-from advent_of_code.html_parsing import (get_puzzle_title_and_descriptions_from_soup,
-                                         get_solved_statuses_from_soup, 
-                                         get_example_from_soup,
-                                         get_answers_from_soup)
+from advent_of_code.server import get_raw_html_from_server, get_input_from_server, invalidate_puzzle_page
+from advent_of_code.html_parsing import parse_puzzle_html
 
 from .puzzle_answer import PuzzleAnswer
 
-SQL_ENGINE = db.create_engine(SQLITE_URL)        
+SQL_ENGINE = get_engine()        
+
+# Heavy text columns that are only SELECTed when first accessed on a `Puzzle`
+DEFERRED_COLUMNS = ('part_1_description', 'part_2_description', 'example_text', 'input_text', 'raw_html')
+EAGER_COLUMNS = [col for col in puzzles_table.c if col.name not in DEFERRED_COLUMNS]
 
 @dataclass
 class Puzzle:
@@ -47,6 +47,40 @@ class Puzzle:
         self.answers = self.pull_all_answers_from_db()
         self.check_answers_in_list()
 
+    def __getattr__(self, name: str):
+        ''' Only called for attributes missing from the instance, i.e. deferred columns that 
+            haven't been loaded yet. '''
+        if name not in DEFERRED_COLUMNS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        
+        with SQL_ENGINE.connect() as conn:
+            stmt = (db.select(puzzles_table.c[name])
+                      .where(puzzles_table.c.id == self.id))
+            value = conn.execute(stmt).scalar()
+        logger.debug(f"{self.year} DAY {self.day:02d} (ID: {self.id}) | Loaded deferred column: {name}")
+
+        value = value or ''
+        setattr(self, name, value)
+        return value
+
+    def defer_columns(self, columns: tuple[str, ...] = DEFERRED_COLUMNS) -> None:
+        ''' Drops the given columns from the instance so that they're fetched on first access. 
+            (`update_info_on_db` only writes what's in `__dict__`, so unloaded columns are left alone.) '''
+        for name in columns:
+            self.__dict__.pop(name, None)
+
+    @property
+    def deferred_columns(self) -> list[str]:
+        return [name for name in DEFERRED_COLUMNS if name not in self.__dict__]
+
+    @classmethod
+    def from_row(cls, row: db.Row) -> Self:
+        ''' Builds a `Puzzle` from a (possibly partial) row, deferring any heavy columns it lacks. '''
+        values = row._asdict()
+        puzzle = cls(**values)
+        puzzle.defer_columns(tuple(name for name in DEFERRED_COLUMNS if name not in values))
+        return puzzle
+
     def update_answers_in_db_answer_table(self) -> None:
         if not self.part_1_answer and not self.part_2_answer:
             logger.debug(f"{self.year} DAY {self.day:02d} (ID: {self.id}) | No correct answers found.")
@@ -73,13 +107,12 @@ class Puzzle:
         if not self.raw_html:
             return None
         
-        soup = BeautifulSoup(self.raw_html, 'html.parser')
-        answer_p_tags = [p for p in soup.find_all('p') 
-                         if 'Your puzzle answer was' in p.get_text()]
+        parsed = parse_puzzle_html(self.raw_html)
 
         update_db = False
-        for i, tag in enumerate(answer_p_tags, start=1):
-            answer_text = tag.find('code').get_text() # type: ignore
+        for i, answer_text in enumerate([parsed.part_1_answer, parsed.part_2_answer], start=1):
+            if not answer_text:
+                continue
 
             if i == 1 and (answer_text != self.part_1_answer):
                 logger.info(f"{self.year} DAY {self.day:02d} (ID: {self.id}) | Adding new Part One answer: {answer_text}")
@@ -163,6 +196,8 @@ class Puzzle:
             raise
         else:
             self.answers.append(answer_obj)
+            if answer_obj.correct:
+                invalidate_puzzle_page(self.year, self.day)
             self.refresh_data_from_server()
             return answer_obj
 
@@ -208,56 +243,42 @@ class Puzzle:
             return -1
 
     @classmethod
-    def from_database(cls, year: int, day: int) -> Self:
+    def from_database(cls, year: int, day: int, deferred: bool = True) -> Self:
         validate_year_and_day(year, day)
         with SQL_ENGINE.connect() as conn:
-            stmt = (db.select(puzzles_table)
+            stmt = (db.select(*EAGER_COLUMNS if deferred else puzzles_table.c)
                     .where(puzzles_table.c.year == year)
                     .where(puzzles_table.c.day == day))
             row = conn.execute(stmt).fetchone()
             if not row:
                 raise PuzzleNotFound(f"No puzzle found in database for {year} DAY {day:02f}")
-            return cls(**row._asdict())
+            return cls.from_row(row)
 
-    def refresh_data_from_server(self):
-        self.raw_html = get_raw_html_from_server(self.year, self.day)
-        soup = BeautifulSoup(self.raw_html, 'html.parser')
+    def refresh_data_from_server(self, use_cache: bool = True):
+        self.raw_html = get_raw_html_from_server(self.year, self.day, use_cache=use_cache)
+        parsed = parse_puzzle_html(self.raw_html)
 
-        self.part_1_solved, self.part_2_solved = get_solved_statuses_from_soup(soup)
-        self.title, self.part_1_description, self.part_2_description = get_puzzle_title_and_descriptions_from_soup(soup)
-        self.part_1_answer, self.part_2_answer = get_answers_from_soup(soup)
+        self.title = parsed.title
+        self.part_1_description, self.part_2_description = parsed.part_1_description, parsed.part_2_description
+        self.part_1_solved, self.part_2_solved = parsed.part_1_solved, parsed.part_2_solved
+        self.part_1_answer, self.part_2_answer = parsed.part_1_answer, parsed.part_2_answer
 
     @classmethod
-    def from_server(cls, year: int, day: int) -> Self:
-        raw_html = get_raw_html_from_server(year, day)
-        soup = BeautifulSoup(raw_html, 'html.parser')
-
-        part_1_solved, part_2_solved = get_solved_statuses_from_soup(soup)
-        title, part_1_description, part_2_description = get_puzzle_title_and_descriptions_from_soup(soup)
-        part_1_answer, part_2_answer = get_answers_from_soup(soup)
-
-        try:
-            example_text = get_example_from_soup(soup)
-        except ElementNotFound as e:
-            logger.debug(f"{year} DAY {day:02d} | {e}")
-            example_text = ''
+    def from_server(cls, year: int, day: int, use_cache: bool = True) -> Self:
+        raw_html = get_raw_html_from_server(year, day, use_cache=use_cache)
+        parsed = parse_puzzle_html(raw_html)
+        if not parsed.example_text:
+            logger.debug(f"{year} DAY {day:02d} | No example found")
 
         try:
-            input_text = get_input_from_server(year, day)
+            input_text = get_input_from_server(year, day, use_cache=use_cache)
         except AOCLoginException as e:
             logger.debug(f"{year} DAY {day:02d} | {e}")
             input_text = ''
 
         return cls(year=year,
                    day=day, 
-                   title=title,
-                   part_1_description=part_1_description,
-                   part_1_solved=part_1_solved,
-                   part_1_answer=part_1_answer,
-                   part_2_description=part_2_description,
-                   part_2_solved=part_2_solved,
-                   part_2_answer=part_2_answer,
-                   example_text=example_text,
+                   **parsed._asdict(),
                    input_text=input_text,
                    raw_html=raw_html)
         
@@ -6,15 +6,16 @@ import requests
 import humanize
 import sqlalchemy as db
 from bs4 import BeautifulSoup
-from loguru import logger
+from advent_of_code.logging_config import logger
 
-from advent_of_code.constants import AOC_SESSION, SQLITE_URL, TZ
+from advent_of_code.constants import AOC_SESSION, TZ
 from advent_of_code.enums import ResponseType
 from advent_of_code.helpers import get_now_string
+from advent_of_code.sql_engine import get_engine
 from advent_of_code.sql_schema import answers_table
 from advent_of_code.exceptions import InvalidAnswerLevel, PuzzleAnswerAlreadySubmitted, PuzzleLevelAlreadySolved
 
-SQL_ENGINE = db.create_engine(SQLITE_URL)
+SQL_ENGINE = get_engine()
 
 @dataclass
 class PuzzleAnswer:
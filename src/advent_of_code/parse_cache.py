@@ -0,0 +1,145 @@
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import struct
+from pathlib import Path
+from types import CodeType, FunctionType
+from typing import Callable, Optional
+
+from advent_of_code.constants import DATA_DIR
+
+PARSE_CACHE_DIR = DATA_DIR / 'parse_cache'
+PARSE_CACHE_ENV_VAR = 'AOC_PARSE_CACHE'   # set to "0" to bypass the cache
+FILE_MAGIC = b'AOCPARSE5\n'
+LENGTH = struct.Struct('<Q')
+
+# File layout: magic, number of sections, each section's length, then the sections (the pickle
+# stream first, then each out-of-band buffer).  Buffers such as NumPy arrays are written as raw
+# bytes rather than copied into the pickle stream, and are rebuilt straight from the file's data.
+
+def dump_parsed(obj, filepath: Path) -> None:
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    sections = [memoryview(payload), *(buffer.raw() for buffer in buffers)]
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(FILE_MAGIC)
+        f.write(LENGTH.pack(len(sections)))
+        for section in sections:
+            f.write(LENGTH.pack(section.nbytes))
+        for section in sections:
+            f.write(section)
+    tmp_path.replace(filepath)
+
+def load_parsed(filepath: Path):
+    data = bytearray(filepath.stat().st_size)
+    with open(filepath, 'rb') as f:
+        f.readinto(data)
+    if not data.startswith(FILE_MAGIC):
+        raise pickle.UnpicklingError(f"Not a parse cache file: {filepath}")
+
+    view = memoryview(data)   # writable, so unpickled arrays are too
+    offset = len(FILE_MAGIC)
+    (num_sections,) = LENGTH.unpack_from(view, offset)
+    offset += LENGTH.size
+    lengths = [LENGTH.unpack_from(view, offset + i * LENGTH.size)[0] for i in range(num_sections)]
+    offset += num_sections * LENGTH.size
+
+    sections = []
+    for length in lengths:
+        sections.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(sections[0], buffers=sections[1:])
+
+def get_referenced_source(fn: Callable) -> str:
+    ''' The function's source plus that of every function, class and simple constant it uses
+        from its own module (transitively), so editing a helper like `create_graph` invalidates
+        the cache but editing `part_two` doesn't. '''
+    module_globals = getattr(fn, '__globals__', {})
+    module_name = getattr(fn, '__module__', None)
+    seen: set[str] = set()
+    chunks = []
+
+    def get_names(code: CodeType) -> set[str]:
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                names |= get_names(const)
+        return names
+
+    def visit(obj) -> None:
+        try:
+            chunks.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            chunks.append(getattr(obj, '__qualname__', type(obj).__name__))
+        codes = [obj.__code__] if isinstance(obj, FunctionType) else \
+                [member.__code__ for member in vars(obj).values() if isinstance(member, FunctionType)]
+        for code in codes:
+            for name in sorted(get_names(code)):
+                if name in seen or name not in module_globals:
+                    continue
+                seen.add(name)
+                value = module_globals[name]
+                if isinstance(value, (FunctionType, type)) and getattr(value, '__module__', None) == module_name:
+                    visit(value)
+                elif isinstance(value, (int, float, str, bytes, tuple, dict, list)):
+                    chunks.append(f"{name} = {value!r}")
+
+    visit(fn)
+    return '\n'.join(chunks)
+
+def hash_arguments(args: tuple, kwargs: dict) -> str:
+    ''' Text and bytes are hashed directly and paths by their contents; anything else (e.g. an
+        already-parsed list) by its pickle. '''
+    digest = hashlib.sha256()
+    for arg in (*args, *sorted(kwargs.items())):
+        if isinstance(arg, str):
+            digest.update(arg.encode())
+        elif isinstance(arg, (bytes, bytearray, memoryview)):
+            digest.update(arg)
+        elif isinstance(arg, Path):
+            digest.update(arg.read_bytes())
+        else:
+            digest.update(pickle.dumps(arg, protocol=5))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def cached_parse(fn: Optional[Callable] = None, *, cache_dir: Optional[Path] = None) -> Callable:
+    ''' Persists a parser's output to disk, keyed by a hash of its arguments (the input) and of
+        its source.  Each call returns a freshly unpickled copy, so callers can mutate it. '''
+    def decorator(fn: Callable) -> Callable:
+        source_hash = hashlib.sha256(f"{fn.__module__}.{fn.__qualname__}\n{get_referenced_source(fn)}".encode()).hexdigest()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if os.getenv(PARSE_CACHE_ENV_VAR) == '0':
+                return fn(*args, **kwargs)
+
+            key = hashlib.sha256(f"{source_hash}{hash_arguments(args, kwargs)}".encode()).hexdigest()
+            filepath = (cache_dir or PARSE_CACHE_DIR) / key[:2] / key
+            if filepath.exists():
+                try:
+                    return load_parsed(filepath)
+                except Exception:
+                    filepath.unlink(missing_ok=True)   # stale (e.g. a class that has since moved)
+
+            result = fn(*args, **kwargs)
+            try:
+                dump_parsed(result, filepath)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                pass   # unpicklable results (lambdas, generators) just aren't cached
+            return result
+        return wrapper
+
+    return decorator(fn) if fn else decorator
+
+def clear_parse_cache(cache_dir: Path = PARSE_CACHE_DIR) -> int:
+    count = 0
+    for filepath in cache_dir.glob('*/*'):
+        filepath.unlink()
+        count += 1
+    return count
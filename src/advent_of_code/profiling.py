@@ -0,0 +1,158 @@
+import contextlib
+import io
+import json
+import signal
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, NamedTuple, Optional
+
+from rich.table import Table
+
+from advent_of_code.constants import LOGS_DIR
+from advent_of_code.exceptions import SolutionNotFound
+from advent_of_code.runner import call_part_function, get_part_function, load_solution_module, SolutionFile
+
+PROFILES_DIR = LOGS_DIR / 'profiles'
+DEFAULT_INTERVAL = 0.001   # seconds of CPU time between samples
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+class FrameKey(NamedTuple):
+    name: str
+    file: str
+    line: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.name} ({Path(self.file).name}:{self.line})"
+
+type Stack = tuple[FrameKey, ...]
+
+@dataclass
+class ProfileResult:
+    name: str
+    interval: float
+    wall_time: float
+    samples: Counter[Stack] = field(default_factory=Counter)
+    return_value: Any = None
+
+    @property
+    def total_samples(self) -> int:
+        return sum(self.samples.values())
+
+    def get_function_counts(self) -> tuple[Counter[FrameKey], Counter[FrameKey]]:
+        ''' Returns (self samples, inclusive samples) per function. '''
+        self_counts: Counter[FrameKey] = Counter()
+        total_counts: Counter[FrameKey] = Counter()
+        for stack, count in self.samples.items():
+            if not stack:
+                continue
+            self_counts[stack[-1]] += count
+            for frame_key in set(stack):   # recursive calls only count once per sample
+                total_counts[frame_key] += count
+        return self_counts, total_counts
+
+    def to_collapsed(self) -> str:
+        ''' Brendan Gregg's folded-stack format (flamegraph.pl, speedscope, inferno, etc.) '''
+        return '\n'.join(f"{';'.join(key.label for key in stack)} {count}"
+                         for stack, count in self.samples.most_common() if stack)
+
+    def to_speedscope(self) -> dict:
+        frames: dict[FrameKey, int] = {}
+        samples = []
+        weights = []
+        for stack, count in self.samples.items():
+            if not stack:
+                continue
+            samples.append([frames.setdefault(key, len(frames)) for key in stack])
+            weights.append(count * self.interval)
+        return {
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'name': self.name,
+            'exporter': 'advent_of_code.profiling',
+            'shared': {'frames': [{'name': key.name, 'file': key.file, 'line': key.line} for key in frames]},
+            'profiles': [{'type': 'sampled',
+                          'name': self.name,
+                          'unit': 'seconds',
+                          'startValue': 0,
+                          'endValue': sum(weights),
+                          'samples': samples,
+                          'weights': weights}],
+        }
+
+    def write_files(self, output_dir: Path = PROFILES_DIR) -> tuple[Path, Path]:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.name.replace(' ', '_')
+        speedscope_path = output_dir / f"{stem}.speedscope.json"
+        collapsed_path = output_dir / f"{stem}.collapsed.txt"
+        with open(speedscope_path, 'w') as f:
+            json.dump(self.to_speedscope(), f)
+        with open(collapsed_path, 'w') as f:
+            f.write(self.to_collapsed())
+        return speedscope_path, collapsed_path
+
+    def make_top_functions_table(self, n: int = 20) -> Table:
+        self_counts, total_counts = self.get_function_counts()
+        total = self.total_samples or 1
+
+        table = Table(title=f"{self.name}: {self.total_samples} samples, {self.wall_time:.3f}s wall")
+        table.add_column('Function')
+        table.add_column('Self', justify='right')
+        table.add_column('Self %', justify='right')
+        table.add_column('Total', justify='right')
+        table.add_column('Total %', justify='right')
+        for frame_key, count in self_counts.most_common(n):
+            table.add_row(frame_key.label,
+                          str(count),
+                          f"{count / total:.1%}",
+                          str(total_counts[frame_key]),
+                          f"{total_counts[frame_key] / total:.1%}")
+        return table
+
+
+class SamplingProfiler:
+    ''' Samples the main thread's Python stack on SIGPROF (i.e. every `interval` seconds of CPU
+        time).  Much cheaper than cProfile's per-call hooks, so hot loops aren't distorted. '''
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self.samples: Counter[Stack] = Counter()
+        self.root_frame: Optional[FrameType] = None
+
+    def handle_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        stack = []
+        while frame is not None and frame is not self.root_frame:
+            code = frame.f_code
+            stack.append(FrameKey(code.co_qualname, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        self.samples[tuple(reversed(stack))] += 1
+
+    def profile(self, name: str, fn: Callable, *args, **kwargs) -> ProfileResult:
+        self.root_frame = sys._getframe()
+        previous_handler = signal.signal(signal.SIGPROF, self.handle_signal)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        start = time.perf_counter()
+        try:
+            return_value = fn(*args, **kwargs)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous_handler)
+            wall_time = time.perf_counter() - start
+            self.root_frame = None
+        return ProfileResult(name, self.interval, wall_time, self.samples, return_value)
+
+def profile_solution(solution: SolutionFile,
+                     part: int,
+                     interval: float = DEFAULT_INTERVAL,
+                     quiet: bool = True) -> ProfileResult:
+    ''' Imports a solution (unprofiled) and then samples one part running on its `INPUT`. '''
+    stdout = io.StringIO() if quiet else sys.stdout
+    with contextlib.redirect_stdout(stdout):
+        module = load_solution_module(solution.path)
+        fn = get_part_function(module, part)
+        if fn is None or not hasattr(module, 'INPUT'):
+            raise SolutionNotFound(f"{solution.year} DAY {solution.day:02d} has no part {part} (or no INPUT)")
+        name = f"{solution.year}_day{solution.day:02d}_part{part}"
+        return SamplingProfiler(interval).profile(name, call_part_function, fn, module.INPUT)
@@ -0,0 +1,71 @@
+import codecs
+import io
+import mmap
+import re
+from pathlib import Path
+from typing import Iterator, TextIO
+
+# Lazy readers for puzzle input, so a pipeline like
+#     max(sum(map(int, block)) for block in aoc.iter_blocks(path))
+# holds one chunk (plus one line) in memory rather than several full copies of the input.
+
+CHUNK_SIZE = 1 << 16
+INT_PATTERN = re.compile(r'-?\d+')
+
+type InputSource = str | Path | TextIO | io.BufferedIOBase | bytes | bytearray | memoryview | mmap.mmap
+
+def iter_chunks(source: InputSource, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    ''' Text in chunks of about `chunk_size` characters from a string, a file path, an open
+        (text or binary) file, or a bytes-like object such as `aoc.get_input_bytes()`.  A
+        plain string is the text itself, not a path. '''
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif isinstance(source, Path):
+        with open(source) as f:
+            yield from iter_chunks(f, chunk_size)
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        with memoryview(source) as view:   # released promptly, so an mmap can still be closed
+            for start in range(0, len(view), chunk_size):
+                yield decoder.decode(view[start:start + chunk_size])
+        yield decoder.decode(b'', final=True)
+    else:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while chunk := source.read(chunk_size):
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        yield decoder.decode(b'', final=True)
+
+def iter_lines(source: InputSource, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    ''' Lines without their line endings; like `str.splitlines()`, but one at a time. '''
+    partial = ''
+    for chunk in iter_chunks(source, chunk_size):
+        if not chunk:
+            continue
+        *lines, partial = (partial + chunk).split('\n')
+        for line in lines:
+            yield line.removesuffix('\r')
+    if partial:
+        yield partial.removesuffix('\r')
+
+def iter_blocks(source: InputSource, chunk_size: int = CHUNK_SIZE) -> Iterator[list[str]]:
+    ''' The lines of each blank-line-separated block (e.g. one elf's calories, or one monkey). '''
+    block: list[str] = []
+    for line in iter_lines(source, chunk_size):
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+def iter_ints(source: InputSource, per_line: bool = False, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    ''' Every integer in the input (negative numbers included), or with `per_line=True` a tuple
+        of each line's integers. '''
+    for line in iter_lines(source, chunk_size):
+        if per_line:
+            yield tuple(int(x) for x in INT_PATTERN.findall(line))
+        else:
+            for match in INT_PATTERN.finditer(line):
+                yield int(match.group())
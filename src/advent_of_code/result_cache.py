@@ -0,0 +1,163 @@
+import ast
+import hashlib
+from pathlib import Path
+from typing import Iterable, Optional
+
+import sqlalchemy as db
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from advent_of_code import resolve_attribute_module
+from advent_of_code.constants import ROOT_DIR
+from advent_of_code.helpers import get_now_string
+from advent_of_code.logging_config import logger
+from advent_of_code.runner import DEFAULT_TIMEOUT, PartResult, SolutionFile, run_jobs
+from advent_of_code.sdk import select_puzzle_columns
+from advent_of_code.sql_engine import get_engine
+from advent_of_code.sql_schema import results_table
+
+SQL_ENGINE = get_engine()
+
+PACKAGE_NAME = 'advent_of_code'
+PACKAGE_DIR = Path(__file__).parent
+
+# Answers are cached under a hash of the solution's source plus everything it imports locally
+# (sibling helpers like `2019/intcode.py`, and any `advent_of_code` modules it uses), so that
+# editing a shared helper invalidates every day that depends on it.
+
+def resolve_module_path(name: str, search_dir: Path) -> Optional[Path]:
+    ''' Maps a module name to a local source file: `advent_of_code.*` to the package, anything
+        else to the importing file's directory.  Third-party and stdlib modules return None. '''
+    top, _, rest = name.partition('.')
+    if top == PACKAGE_NAME:
+        base = PACKAGE_DIR.joinpath(*rest.split('.')) if rest else PACKAGE_DIR
+    else:
+        base = search_dir.joinpath(*name.split('.'))
+    for candidate in (base.parent / f"{base.name}.py", base / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+def get_package_name(path: Path) -> str:
+    ''' The dotted package containing a file inside `advent_of_code` (for relative imports). '''
+    return '.'.join(path.relative_to(PACKAGE_DIR.parent).parts[:-1])
+
+def get_imported_names(path: Path) -> set[str]:
+    ''' Names of the modules a file imports, including `aoc.<attribute>` lookups through the
+        package's lazy namespace.  Inside the package only module-level imports count, since the
+        imports deferred into functions there are the database/server fallbacks. '''
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    in_package = path.is_relative_to(PACKAGE_DIR)
+    nodes = ast.iter_child_nodes(tree) if in_package else ast.walk(tree)
+
+    names: set[str] = set()
+    package_aliases: set[str] = set()
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.add(alias.name)
+                if alias.name == PACKAGE_NAME:
+                    package_aliases.add(alias.asname or alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ''
+            if node.level and in_package:
+                package = get_package_name(path).rsplit('.', node.level - 1)[0]
+                module = f"{package}.{module}".rstrip('.')
+            names.add(module)
+            names.update(f"{module}.{alias.name}" for alias in node.names)   # submodule imports
+
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                and node.value.id in package_aliases):
+            names.add(f"{PACKAGE_NAME}.{resolve_attribute_module(node.attr) or node.attr}")
+    return names
+
+def get_dependency_paths(path: Path) -> list[Path]:
+    ''' The file itself plus every local module it imports, directly or transitively. '''
+    path = path.resolve()
+    seen = {path}
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        for name in get_imported_names(current):
+            dependency = resolve_module_path(name, current.parent)
+            if dependency and (dependency := dependency.resolve()) not in seen:
+                seen.add(dependency)
+                stack.append(dependency)
+    return sorted(seen)
+
+def get_source_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    for dependency in get_dependency_paths(path):
+        label = dependency.relative_to(ROOT_DIR) if dependency.is_relative_to(ROOT_DIR) else dependency
+        digest.update(f"{label.as_posix()}\0".encode())
+        digest.update(dependency.read_bytes())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def get_input_hash(year: int, day: int) -> Optional[str]:
+    ''' None if the input isn't in the database, in which case results aren't cached. '''
+    row = select_puzzle_columns(year, day, ('input_text',))
+    if not row or row[0] is None:
+        return None
+    return hashlib.sha256(row[0].encode()).hexdigest()
+
+def get_cached_result(solution: SolutionFile, part: int, source_hash: str, input_hash: str) -> Optional[PartResult]:
+    results_table.create(SQL_ENGINE, checkfirst=True)
+    with SQL_ENGINE.connect() as conn:
+        stmt = (db.select(results_table)
+                  .where(results_table.c.year == solution.year)
+                  .where(results_table.c.day == solution.day)
+                  .where(results_table.c.part == part)
+                  .where(results_table.c.source_hash == source_hash)
+                  .where(results_table.c.input_hash == input_hash))
+        row = conn.execute(stmt).first()
+    if not row:
+        return None
+    return PartResult(solution.year, solution.day, part, status='cached', answer=row.answer, wall_time=row.wall_time)
+
+def write_results_to_cache(results: Iterable[PartResult], hashes: dict[tuple[int, int], tuple[str, str]]) -> None:
+    ''' Stores successful results; `hashes` maps (year, day) to (source hash, input hash). '''
+    rows = [{'year': r.year, 'day': r.day, 'part': r.part,
+             'source_hash': hashes[(r.year, r.day)][0], 'input_hash': hashes[(r.year, r.day)][1],
+             'answer': r.answer, 'wall_time': r.wall_time, 'timestamp': get_now_string()}
+            for r in results if r.status == 'ok' and (r.year, r.day) in hashes]
+    if not rows:
+        return None
+    results_table.create(SQL_ENGINE, checkfirst=True)
+    stmt = sqlite_insert(results_table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['year', 'day', 'part', 'source_hash', 'input_hash'],
+        set_={col: stmt.excluded[col] for col in ['answer', 'wall_time', 'timestamp']}
+    )
+    with SQL_ENGINE.begin() as conn:
+        conn.execute(stmt, rows)
+    logger.info(f"Cached {len(rows)} results")
+
+def run_solutions_cached(solutions: Iterable[SolutionFile],
+                         parts: Iterable[int] = (1, 2),
+                         max_workers: Optional[int] = None,
+                         timeout: Optional[float] = DEFAULT_TIMEOUT,
+                         force: bool = False) -> list[PartResult]:
+    ''' Like `run_solutions`, but parts whose source and input are unchanged since a successful
+        run come straight from the cache (with status 'cached').  `force` re-runs everything. '''
+    parts = list(parts)
+    hashes: dict[tuple[int, int], tuple[str, str]] = {}
+    results: list[PartResult] = []
+    jobs: list[tuple[SolutionFile, int]] = []
+    for solution in solutions:
+        input_hash = get_input_hash(solution.year, solution.day)
+        if input_hash:
+            hashes[(solution.year, solution.day)] = (get_source_hash(solution.path), input_hash)
+        for part in parts:
+            cached = None
+            if input_hash and not force:
+                cached = get_cached_result(solution, part, *hashes[(solution.year, solution.day)])
+            if cached:
+                results.append(cached)
+            else:
+                jobs.append((solution, part))
+
+    logger.debug(f"{len(results)} cached results, {len(jobs)} parts to run")
+    new_results = run_jobs(jobs, max_workers, timeout)
+    write_results_to_cache(new_results, hashes)
+    return sorted(results + new_results, key=lambda r: (r.year, r.day, r.part))
@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING, Callable, Collection, Hashable, NamedTuple, Optional, Sequence
+
+from advent_of_code.search import bfs, bfs_grid
+
+if TYPE_CHECKING:
+    from advent_of_code.grid import Grid
+
+# Shortest (or longest) routes through every one of a small set of locations.  Distances between
+# the locations are worked out once, into a matrix, and the route is then found by Held-Karp
+# dynamic programming over subsets: O(n²·2ⁿ) rather than trying all n! orderings.
+
+INF = float('inf')
+
+type DistanceMatrix = list[list[int | float]]   # INF where one location can't reach another
+
+class Route(NamedTuple):
+    length: int | float
+    order: list[int]   # indices into the distance matrix, in visiting order (closed tours end at the start)
+
+def make_distance_matrix[T](nodes: Sequence[T], distance: Callable[[T, T], int | float]) -> DistanceMatrix:
+    ''' The matrix of `distance(a, b)` for every ordered pair of `nodes` (0 on the diagonal). '''
+    return [[0 if i == j else distance(a, b) for j, b in enumerate(nodes)]
+            for i, a in enumerate(nodes)]
+
+def get_graph_distances(nodes: Sequence[Hashable], neighbors: Callable) -> DistanceMatrix:
+    ''' All-pairs step counts between `nodes` in an unweighted graph: one breadth-first search
+        from each node, rather than one per pair. '''
+    matrix = []
+    for node in nodes:
+        distances = bfs(node, neighbors).distances
+        matrix.append([distances.get(other, INF) for other in nodes])
+    return matrix
+
+def get_grid_distances(grid: "Grid", indices: Sequence[int], blocked: Collection[int], diagonal: bool = False) -> DistanceMatrix:
+    ''' As `get_graph_distances`, for cells of a padded `Grid` (see `search.bfs_grid`). '''
+    matrix = []
+    for index in indices:
+        distances = bfs_grid(grid, index, blocked, diagonal=diagonal).distances
+        matrix.append([INF if distances[other] == -1 else distances[other] for other in indices])
+    return matrix
+
+def held_karp(distances: DistanceMatrix,
+              start: Optional[int] = None,
+              closed: bool = False,
+              maximize: bool = False) -> Route:
+    ''' The best route visiting every location exactly once.  An open path may begin anywhere
+        unless `start` is given; a `closed` tour returns to its start (location 0 by default).
+        With `maximize`, the longest such route instead.  Unreachable pairs are never used. '''
+    n = len(distances)
+    if n == 0:
+        return Route(0, [])
+    if closed and start is None:
+        start = 0
+
+    # Maximizing is minimizing the negated distances, keeping INF for "no edge"
+    sign = -1 if maximize else 1
+    cost = [[INF if d == INF else sign * d for d in row] for row in distances]
+
+    # best[mask][j]: the cheapest path that visits exactly the locations in `mask`, ending at j
+    full = (1 << n) - 1
+    best = [[INF] * n for _ in range(full + 1)]
+    parent = [[-1] * n for _ in range(full + 1)]
+    for j in (range(n) if start is None else [start]):
+        best[1 << j][j] = 0
+
+    locations = range(n)
+    for mask in range(1, full + 1):
+        row = best[mask]
+        for j in locations:
+            length = row[j]
+            if length == INF:
+                continue
+            cost_from_j = cost[j]
+            for k in locations:
+                if mask >> k & 1:
+                    continue
+                candidate = length + cost_from_j[k]
+                extended = mask | 1 << k
+                if candidate < best[extended][k]:
+                    best[extended][k] = candidate
+                    parent[extended][k] = j
+
+    length, end = min((best[full][j] + (cost[j][start] if closed else 0), j) for j in locations)
+    if length == INF:
+        raise ValueError("No route visits every location")
+
+    order = []
+    mask, j = full, end
+    while j != -1:
+        order.append(j)
+        mask, j = mask ^ (1 << j), parent[mask][j]
+    order.reverse()
+    if closed:
+        order.append(start)
+    return Route(sign * length, order)
@@ -0,0 +1,243 @@
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import re
+import resource
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterable, Optional
+
+from advent_of_code.logging_config import logger
+from rich.table import Table
+
+from advent_of_code.constants import SOLUTIONS_DIR
+from advent_of_code.exceptions import SolutionNotFound, SolutionTimeout
+
+SOLUTION_FILENAME_PATTERN = re.compile(r'^day(\d{2})\.py$')
+PART_FUNCTION_NAMES = {1: 'part_one', 2: 'part_two'}
+DEFAULT_TIMEOUT = 600.0
+
+@dataclass(frozen=True)
+class SolutionFile:
+    year: int
+    day: int
+    path: Path
+
+@dataclass
+class PartResult:
+    year: int
+    day: int
+    part: int
+    status: str = 'ok'   # 'ok', 'cached', 'missing', 'error' or 'timeout'
+    answer: str = field(default_factory=str)
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_rss_kb: int = 0
+    error: str = field(default_factory=str)
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ('ok', 'cached')
+
+
+def find_solution_files(year: Optional[int] = None,
+                        day: Optional[int] = None,
+                        solutions_dir: Path = SOLUTIONS_DIR) -> list[SolutionFile]:
+    ''' Returns every `solutions/<year>/dayNN.py` file, sorted by year and day. '''
+    output_list = []
+    for year_dir in solutions_dir.iterdir():
+        if not year_dir.is_dir() or not year_dir.name.isdigit():
+            continue
+        if year and int(year_dir.name) != year:
+            continue
+        for file in year_dir.iterdir():
+            match = SOLUTION_FILENAME_PATTERN.match(file.name)
+            if not match:
+                continue
+            if day and int(match.group(1)) != day:
+                continue
+            output_list.append(SolutionFile(int(year_dir.name), int(match.group(1)), file))
+    return sorted(output_list, key=lambda s: (s.year, s.day))
+
+def get_solution_file(year: int, day: int, solutions_dir: Path = SOLUTIONS_DIR) -> SolutionFile:
+    files = find_solution_files(year, day, solutions_dir)
+    if not files:
+        raise SolutionNotFound(f"No solution file found for {year} DAY {day:02d}")
+    return files[0]
+
+def load_solution_module(path: Path) -> ModuleType:
+    ''' Imports a solution file under a unique module name.  The file's own directory is put
+        on `sys.path` first, since some solutions import sibling modules (e.g. `intcode.py`). '''
+    module_dir = str(path.parent)
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+
+    module_name = f"aoc_solution_{path.parent.name}_{path.stem}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if not spec or not spec.loader:
+        raise SolutionNotFound(f"Could not load solution file: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def get_part_function(module: ModuleType, part: int) -> Optional[Callable]:
+    return getattr(module, PART_FUNCTION_NAMES[part], None)
+
+def call_part_function(fn: Callable, data) -> object:
+    ''' Most parts take the puzzle input as their only argument; a few older ones take nothing. '''
+    if inspect.signature(fn).parameters:
+        return fn(data)
+    return fn()
+
+def get_peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak   # macOS reports bytes
+
+def _raise_timeout(signum, frame):
+    raise SolutionTimeout("Solution timed out")
+
+@contextlib.contextmanager
+def time_limit(seconds: Optional[float]):
+    if not seconds:
+        yield
+        return
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+def run_part(solution: SolutionFile, part: int, timeout: Optional[float] = DEFAULT_TIMEOUT) -> PartResult:
+    ''' Imports a solution and runs one part on its `INPUT`, timing only the part itself.  Meant
+        to be run in a fresh worker process, so that the peak RSS belongs to this part alone. '''
+    result = PartResult(solution.year, solution.day, part)
+    try:
+        with time_limit(timeout), contextlib.redirect_stdout(io.StringIO()):
+            module = load_solution_module(solution.path)
+            fn = get_part_function(module, part)
+            if fn is None or not hasattr(module, 'INPUT'):
+                result.status = 'missing'
+            else:
+                start_wall = time.perf_counter()
+                start_cpu = time.process_time()
+                try:
+                    result.answer = str(call_part_function(fn, module.INPUT))
+                finally:
+                    result.wall_time = time.perf_counter() - start_wall
+                    result.cpu_time = time.process_time() - start_cpu
+    except SolutionTimeout:
+        result.status = 'timeout'
+        result.error = f"Timed out after {timeout} seconds"
+    except BaseException as e:
+        result.status = 'error'
+        result.error = f"{type(e).__name__}: {e}"
+    result.peak_rss_kb = get_peak_rss_kb()
+    return result
+
+def run_solutions(solutions: Iterable[SolutionFile],
+                  parts: Iterable[int] = (1, 2),
+                  max_workers: Optional[int] = None,
+                  timeout: Optional[float] = DEFAULT_TIMEOUT,
+                  task: Callable[..., PartResult] = run_part,
+                  result_type: type[PartResult] = PartResult) -> list[PartResult]:
+    ''' Runs every part of every solution in a process pool. '''
+    jobs = [(solution, part) for solution in solutions for part in parts]
+    return run_jobs(jobs, max_workers, timeout, task, result_type)
+
+def run_jobs(jobs: Iterable[tuple[SolutionFile, int]],
+             max_workers: Optional[int] = None,
+             timeout: Optional[float] = DEFAULT_TIMEOUT,
+             task: Callable[..., PartResult] = run_part,
+             result_type: type[PartResult] = PartResult) -> list[PartResult]:
+    ''' Runs each (solution, part) job in a process pool.  Each worker handles exactly one part
+        and then exits, so slow days only occupy their own worker.
+
+        A worker that dies (e.g. killed for running out of memory) breaks the whole pool, so the
+        jobs left unfinished are then re-run each in a pool of its own: only the job that kills
+        its worker again is reported as an error (of `result_type`, matching what `task`
+        returns). '''
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    max_workers = max_workers or os.cpu_count() or 1
+    results = []
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1) as executor:
+        futures = {executor.submit(task, solution, part, timeout): (solution, part)
+                   for solution, part in jobs}
+        for future in as_completed(futures):
+            solution, part = futures[future]
+            try:
+                results.append(log_result(future.result()))
+            except BrokenProcessPool:
+                unfinished.append((solution, part))
+            except Exception as e:
+                results.append(log_result(make_error_result(result_type, solution, part, e)))
+
+    if unfinished:
+        logger.warning(f"A worker died; re-running {len(unfinished)} unfinished part(s) one per pool")
+        with ThreadPoolExecutor(max_workers=max_workers) as threads:
+            isolated = [threads.submit(run_job_isolated, solution, part, timeout, task, result_type)
+                        for solution, part in unfinished]
+            results.extend(log_result(future.result()) for future in isolated)
+    return sorted(results, key=lambda r: (r.year, r.day, r.part))
+
+def run_job_isolated(solution: SolutionFile,
+                     part: int,
+                     timeout: Optional[float],
+                     task: Callable[..., PartResult],
+                     result_type: type[PartResult]) -> PartResult:
+    ''' Runs one job in a single-worker pool, so if its worker dies nothing else goes with it. '''
+    try:
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+            return executor.submit(task, solution, part, timeout).result()
+    except Exception as e:
+        return make_error_result(result_type, solution, part, e)
+
+def make_error_result(result_type: type[PartResult], solution: SolutionFile, part: int, e: Exception) -> PartResult:
+    return result_type(solution.year, solution.day, part, status='error', error=f"{type(e).__name__}: {e}")
+
+def log_result(result: PartResult) -> PartResult:
+    logger.debug(f"{result.year} DAY {result.day:02d} | Part {result.part}: " +
+                 f"{result.status} ({result.wall_time:.3f}s)")
+    return result
+
+def make_results_table(results: list[PartResult], title: Optional[str] = None) -> Table:
+    table = Table(title=title)
+    table.add_column('Year')
+    table.add_column('Day', justify='right')
+    table.add_column('Part', justify='center')
+    table.add_column('Status')
+    table.add_column('Answer')
+    table.add_column('Wall (s)', justify='right')
+    table.add_column('CPU (s)', justify='right')
+    table.add_column('Peak RSS (MB)', justify='right')
+    for result in results:
+        status = result.status if result.ok else f"[red]{result.status}[/red]"
+        table.add_row(str(result.year),
+                      str(result.day),
+                      str(result.part),
+                      status,
+                      result.answer if result.ok else result.error,
+                      f"{result.wall_time:.3f}",
+                      f"{result.cpu_time:.3f}",
+                      f"{result.peak_rss_kb / 1024:.1f}")
+    return table
+
+def write_results_json(results: list[PartResult], filepath: Path) -> None:
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, 'w') as f:
+        json.dump([asdict(result) for result in results], f, indent=2)
+    logger.info(f"Wrote {len(results)} results to {filepath}")
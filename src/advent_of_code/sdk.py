@@ -1,51 +1,142 @@
-from advent_of_code.models import Puzzle
-from advent_of_code.exceptions import PuzzleNotFound
+import functools
+import mmap
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from advent_of_code.constants import DATA_DIR, SQLITE_PATH
 from advent_of_code.helpers import validate_year_and_day
 
-def get_example(year: int, day: int) -> str:
+if TYPE_CHECKING:
+    from advent_of_code.models import Puzzle
+
+DESCRIPTION_COLUMNS = ('title', 'part_1_description', 'part_2_description')
+PUZZLE_COLUMNS = {'title', 'part_1_description', 'part_2_description', 'example_text', 'input_text', 'raw_html', 'url'}
+
+# Solutions call these at import time, so the common path selects just the needed columns
+# through the shared engine; the SQLAlchemy models (and the AOC server) are only loaded as a
+# fallback, when the puzzle isn't in the database yet.
+
+@functools.lru_cache(maxsize=None)
+def get_puzzle(year: int, day: int) -> "Puzzle":
+    ''' Returns one shared `Puzzle` per (year, day) for the life of the process. '''
+    from advent_of_code.exceptions import PuzzleNotFound
+    from advent_of_code.models import Puzzle
+
     validate_year_and_day(year, day)
     try:
-        puzzle = Puzzle.from_database(year, day)
+        return Puzzle.from_database(year, day)
     except PuzzleNotFound:
-        puzzle = Puzzle.from_server(year, day)
-    
-    return puzzle.example_text
+        return Puzzle.from_server(year, day)
 
-def get_input(year: int, day: int) -> str:
+def select_puzzle_columns(year: int, day: int, columns: tuple[str, ...]) -> tuple | None:
+    ''' The columns' values, or None if the puzzle (or the whole database) isn't there yet.
+        Database errors, such as a lock held too long by a rebuild, are raised rather than
+        treated as a missing puzzle. '''
+    if not set(columns) <= PUZZLE_COLUMNS:
+        raise ValueError(f"Invalid column(s): {set(columns) - PUZZLE_COLUMNS}")
+    if not SQLITE_PATH.exists():
+        return None
+
+    import sqlalchemy as db
+    from advent_of_code.sql_engine import get_engine
+    from advent_of_code.sql_schema import puzzles_table
+
+    stmt = (db.select(*(puzzles_table.c[column] for column in columns))
+              .where(puzzles_table.c.year == year, puzzles_table.c.day == day))
+    with get_engine(f"sqlite:///{SQLITE_PATH}").connect() as conn:
+        row = conn.execute(stmt).first()
+    return tuple(row) if row else None
+
+@functools.lru_cache(maxsize=1024)
+def get_puzzle_columns(year: int, day: int, columns: tuple[str, ...]) -> tuple[str, ...]:
+    ''' Selects just the requested columns, rather than building a full `Puzzle` (which loads
+        every column and then queries the answers table).  Falls back to the server if the
+        puzzle isn't in the database yet. '''
     validate_year_and_day(year, day)
-    try:
-        puzzle = Puzzle.from_database(year, day)
-    except PuzzleNotFound:
-        puzzle = Puzzle.from_server(year, day)
-        
-    return puzzle.input_text
+    row = select_puzzle_columns(year, day, columns)
+    if row:
+        return tuple(value or '' for value in row)
+
+    puzzle = get_puzzle(year, day)
+    return tuple(getattr(puzzle, col) for col in columns)
+
+def clear_puzzle_cache() -> None:
+    get_puzzle.cache_clear()
+    get_puzzle_columns.cache_clear()
+    close_input_maps()
+
+def get_example(year: int, day: int) -> str:
+    return get_puzzle_columns(year, day, ('example_text',))[0]
+
+def get_input(year: int, day: int) -> str:
+    return get_puzzle_columns(year, day, ('input_text',))[0]
+
+def get_input_path(year: int, day: int) -> Path:
+    ''' The canonical on-disk copy of a puzzle's input, written from the database on first use.
+        An empty input (e.g. fetched with an expired session) is never written, since the file
+        would then stop it from being fetched again. '''
+    filepath = DATA_DIR / str(year) / str(day) / 'input.txt'
+    if not filepath.exists():
+        input_text = get_input(year, day)
+        if not input_text:
+            from advent_of_code.exceptions import PuzzleInputNotFound
+            raise PuzzleInputNotFound(f"No input for {year} DAY {day:02d} (is the AOC session still valid?)")
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = filepath.with_name(f"input.txt.{os.getpid()}.tmp")
+        tmp_path.write_bytes(input_text.encode())
+        tmp_path.replace(filepath)
+    return filepath
+
+def open_input(year: int, day: int) -> mmap.mmap | memoryview:
+    ''' Read-only memory map of the input file, which works anywhere a bytes-like object does
+        (`re` with bytes patterns, `np.frombuffer`, slicing) and also has `readline()`.  Use it
+        in a `with` block, or close it, when done.  An empty file can't be mapped, so for one
+        this is an empty `memoryview` instead. '''
+    with open(get_input_path(year, day), 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b'')
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+# (year, day) -> (the mapped file, the view handed out for it)
+INPUT_MAPS: dict[tuple[int, int], tuple[mmap.mmap | memoryview, memoryview]] = {}
+
+def get_input_bytes(year: int, day: int) -> memoryview:
+    ''' The input as a read-only view of one shared memory map: no decode and no copy.  The map
+        stays open until `clear_puzzle_cache()`. '''
+    if (year, day) not in INPUT_MAPS:
+        source = open_input(year, day)
+        INPUT_MAPS[(year, day)] = (source, memoryview(source))
+    return INPUT_MAPS[(year, day)][1]
+
+def close_input_maps() -> None:
+    ''' Releases every view from `get_input_bytes` and closes its map. '''
+    while INPUT_MAPS:
+        _, (source, view) = INPUT_MAPS.popitem()
+        try:
+            view.release()
+            if isinstance(source, mmap.mmap):
+                source.close()
+        except BufferError:
+            pass   # still exported (e.g. to a NumPy array); the map closes once that's collected
 
 def print_description(year: int, day: int) -> None:
-    validate_year_and_day(year, day)
-    try:
-        puzzle = Puzzle.from_database(year, day)
-    except PuzzleNotFound:
-        puzzle = Puzzle.from_server(year, day)
+    title, part_1_description, part_2_description = get_puzzle_columns(year, day, DESCRIPTION_COLUMNS)
 
-    print(puzzle.title + '\n')
-    print(puzzle.part_1_description)
-    if puzzle.part_2_description:
+    print(title + '\n')
+    print(part_1_description)
+    if part_2_description:
         print('--- Part Two ---\n')
-        print(puzzle.part_2_description)
+        print(part_2_description)
 
 def get_description(year: int, day: int) -> str:
-    validate_year_and_day(year, day)
-    try:
-        puzzle = Puzzle.from_database(year, day)
-    except PuzzleNotFound:
-        puzzle = Puzzle.from_server(year, day)
+    title, part_1_description, part_2_description = get_puzzle_columns(year, day, DESCRIPTION_COLUMNS)
 
-    output = puzzle.title
+    output = title
     output += '\n'
-    output += puzzle.part_1_description
-    if puzzle.part_2_description:
+    output += part_1_description
+    if part_2_description:
         output += '--- Part Two ---\n'
-        output += puzzle.part_2_description
+        output += part_2_description
 
     return output
-    
\ No newline at end of file
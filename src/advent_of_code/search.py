@@ -0,0 +1,227 @@
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Collection, Hashable, Iterable, Optional
+
+if TYPE_CHECKING:
+    from advent_of_code.grid import Grid
+
+# Graph searches that record a parent pointer per node instead of carrying a copy of the path
+# in every queue entry, so each expansion is O(1) and a path is only rebuilt if asked for.
+# Neighbors come from a function, so the same searches work on dicts, grids or implicit graphs:
+#   - unweighted:  neighbors(node) -> iterable of nodes
+#   - weighted:    neighbors(node) -> iterable of (node, cost)
+
+type Node = Hashable
+type Neighbors = Callable[[Node], Iterable[Node]]
+type WeightedNeighbors = Callable[[Node], Iterable[tuple[Node, int | float]]]
+
+@dataclass
+class SearchResult:
+    distances: dict[Node, int | float] = field(default_factory=dict)
+    parents: dict[Node, Optional[Node]] = field(default_factory=dict)
+    target: Optional[Node] = None   # the goal that ended the search, if one was reached
+
+    @property
+    def found(self) -> bool:
+        return self.target is not None
+
+    @property
+    def distance(self) -> Optional[int | float]:
+        return self.distances[self.target] if self.found else None
+
+    @property
+    def path(self) -> list[Node]:
+        return self.path_to(self.target) if self.found else []
+
+    def path_to(self, node: Node) -> list[Node]:
+        ''' The nodes from a start to `node` inclusive (empty if `node` wasn't reached). '''
+        if node not in self.parents:
+            return []
+        path = [node]
+        while (node := self.parents[node]) is not None:
+            path.append(node)
+        return path[::-1]
+
+def make_goal_test(goal: Optional[Node], is_goal: Optional[Callable[[Node], bool]]) -> Optional[Callable[[Node], bool]]:
+    if is_goal is not None:
+        return is_goal
+    if goal is not None:
+        return lambda node: node == goal
+    return None
+
+def drop_unsettled(result: SearchResult, settled: set[Node]) -> None:
+    ''' Removes tentative distances left by an early stop: only settled ones are final. '''
+    for node in set(result.distances) - settled:
+        del result.distances[node], result.parents[node]
+
+def multi_source_bfs(starts: Iterable[Node],
+                     neighbors: Neighbors,
+                     goal: Optional[Node] = None,
+                     is_goal: Optional[Callable[[Node], bool]] = None,
+                     max_distance: Optional[int] = None) -> SearchResult:
+    ''' Breadth-first search from every start at once (distance 0 each).  Stops at the first
+        goal reached, or else explores everything within `max_distance` and returns the full
+        distance map. '''
+    goal_test = make_goal_test(goal, is_goal)
+    result = SearchResult()
+    distances, parents = result.distances, result.parents
+    queue: deque[Node] = deque()
+    for start in starts:
+        if start not in distances:
+            distances[start] = 0
+            parents[start] = None
+            queue.append(start)
+
+    while queue:
+        node = queue.popleft()
+        if goal_test and goal_test(node):
+            result.target = node
+            return result
+        distance = distances[node] + 1
+        if max_distance is not None and distance > max_distance:
+            continue
+        for neighbor in neighbors(node):
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                parents[neighbor] = node
+                queue.append(neighbor)
+    return result
+
+def bfs(start: Node,
+        neighbors: Neighbors,
+        goal: Optional[Node] = None,
+        is_goal: Optional[Callable[[Node], bool]] = None,
+        max_distance: Optional[int] = None) -> SearchResult:
+    return multi_source_bfs([start], neighbors, goal, is_goal, max_distance)
+
+def bfs_01(start: Node,
+           neighbors: WeightedNeighbors,
+           goal: Optional[Node] = None,
+           is_goal: Optional[Callable[[Node], bool]] = None) -> SearchResult:
+    ''' Shortest paths where every edge costs 0 or 1, using a deque instead of a heap.  As with
+        `astar`, only settled (final) distances are kept in the result. '''
+    goal_test = make_goal_test(goal, is_goal)
+    result = SearchResult({start: 0}, {start: None})
+    distances, parents = result.distances, result.parents
+    done = set()
+    queue: deque[Node] = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        if node in done:
+            continue
+        done.add(node)
+        if goal_test and goal_test(node):
+            result.target = node
+            break
+        for neighbor, cost in neighbors(node):
+            distance = distances[node] + cost
+            if distance < distances.get(neighbor, distance + 1):
+                distances[neighbor] = distance
+                parents[neighbor] = node
+                if cost:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+
+    drop_unsettled(result, done)
+    return result
+
+def astar(start: Node,
+          neighbors: WeightedNeighbors,
+          goal: Optional[Node] = None,
+          is_goal: Optional[Callable[[Node], bool]] = None,
+          heuristic: Optional[Callable[[Node], int | float]] = None) -> SearchResult:
+    ''' A* search; with no heuristic this is Dijkstra.  Settled nodes are never reopened, so
+        the heuristic must be consistent: never more than the cost of an edge plus the heuristic
+        at its far end (and 0 at a goal).  A merely admissible one may give a longer path. '''
+    goal_test = make_goal_test(goal, is_goal)
+    result = SearchResult({start: 0}, {start: None})
+    distances, parents = result.distances, result.parents
+    done = set()
+    tiebreak = itertools.count()   # nodes themselves needn't be orderable
+    heap = [(heuristic(start) if heuristic else 0, next(tiebreak), start)]
+
+    while heap:
+        _, _, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        if goal_test and goal_test(node):
+            result.target = node
+            break
+        for neighbor, cost in neighbors(node):
+            distance = distances[node] + cost
+            if neighbor not in done and distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                parents[neighbor] = node
+                priority = distance + heuristic(neighbor) if heuristic else distance
+                heapq.heappush(heap, (priority, next(tiebreak), neighbor))
+
+    drop_unsettled(result, done)
+    return result
+
+def dijkstra(start: Node,
+             neighbors: WeightedNeighbors,
+             goal: Optional[Node] = None,
+             is_goal: Optional[Callable[[Node], bool]] = None) -> SearchResult:
+    return astar(start, neighbors, goal, is_goal)
+
+
+@dataclass
+class GridSearchResult:
+    ''' Distances and parents indexed by the grid's linear cell index (-1 where unreached). '''
+    distances: list[int]
+    parents: list[int]
+    target: int = -1
+
+    @property
+    def found(self) -> bool:
+        return self.target != -1
+
+    @property
+    def distance(self) -> Optional[int]:
+        return self.distances[self.target] if self.found else None
+
+    def path_to(self, index: int) -> list[int]:
+        if self.distances[index] == -1:
+            return []
+        path = [index]
+        while (index := self.parents[index]) != -1:
+            path.append(index)
+        return path[::-1]
+
+def bfs_grid(grid: "Grid",
+             starts: int | Iterable[int],
+             blocked: Collection[int],
+             goal: Optional[int] = None,
+             diagonal: bool = False) -> GridSearchResult:
+    ''' Breadth-first search over a padded `Grid`, on plain ints with list-backed parent and
+        distance arrays: no tuples, no hashing, no bounds checks.  `blocked` holds the cell
+        values that can't be entered, and must include the padding value. '''
+    if not grid.pad:
+        raise ValueError("bfs_grid needs a grid with pad_value set (to a blocked value)")
+    data = grid.data
+    offsets = grid.offsets_8 if diagonal else grid.offsets_4
+    passable = [value not in blocked for value in range(256)]
+    distances = [-1] * len(data)
+    parents = [-1] * len(data)
+    queue: deque[int] = deque()
+    for start in ([starts] if isinstance(starts, int) else starts):
+        distances[start] = 0
+        queue.append(start)
+
+    while queue:
+        index = queue.popleft()
+        if index == goal:
+            return GridSearchResult(distances, parents, index)
+        distance = distances[index] + 1
+        for offset in offsets:
+            neighbor = index + offset
+            if distances[neighbor] == -1 and passable[data[neighbor]]:
+                distances[neighbor] = distance
+                parents[neighbor] = index
+                queue.append(neighbor)
+    return GridSearchResult(distances, parents)
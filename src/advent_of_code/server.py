@@ -1,13 +1,41 @@
+import datetime as dt
+import email.utils
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
 
 import requests
-from loguru import logger
+from requests.adapters import HTTPAdapter
+from advent_of_code.logging_config import logger
 
-from advent_of_code.constants import AOC_SESSION, DATA_DIR, LATEST_AOC_YEAR
+from advent_of_code.constants import AOC_SESSION, DATA_DIR, LATEST_AOC_YEAR, PART_TWO_SOLVED_TEXT
 from advent_of_code.helpers import validate_year_and_day
 from advent_of_code.exceptions import AOCLoginException
+from advent_of_code.http_cache import ResponseCache
 
 USER_AGENT_STRING = "github.com/cyrii42/advent_of_code by zvaughan@gmail.com"
+AOC_BASE_URL = "https://adventofcode.com"
+
+# Bulk downloads stay at or under one request every 5 seconds (what the old serial loop slept)
+POLITE_REQUESTS_PER_SECOND = 0.2
+POLITE_BURST = 1
+DOWNLOAD_WORKERS = 4
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 3
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRY_AFTER = 300   # seconds
+DOWNLOAD_MANIFEST = DATA_DIR / 'download_manifest.json'
+
+# Inputs never change, and a puzzle page only changes when a part gets solved (which we
+# invalidate on a correct submission), so pages are only re-fetched now and then in case a
+# part was solved somewhere else.  Pages with both parts solved never change again.
+UNSOLVED_PAGE_TTL = dt.timedelta(hours=1)
+
+RESPONSE_CACHE = ResponseCache()
 
 # def do_initial_pull():
 #     for year in range(2020, 2024):
@@ -16,45 +44,242 @@ USER_AGENT_STRING = "github.com/cyrii42/advent_of_code by zvaughan@gmail.com"
 #             puzzle.write_data_files()
 #             time.sleep(2)
 
-def download_html_file(year: int, day: int) -> None:
-    url = f"https://adventofcode.com/{year}/day/{day}"
-    resp = requests.get(url, headers={"Cookie": f"session={AOC_SESSION}", 
-                                      "User-Agent": USER_AGENT_STRING})
-    resp.raise_for_status()
+_SESSION: Optional[requests.Session] = None
+
+def get_session() -> requests.Session:
+    ''' One keep-alive session (and connection pool) shared by every request to the AOC server. '''
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = make_session()
+    return _SESSION
+
+def make_session(pool_size: int = DOWNLOAD_WORKERS) -> requests.Session:
+    session = requests.Session()
+    session.headers.update({"Cookie": f"session={AOC_SESSION}",
+                            "User-Agent": USER_AGENT_STRING})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class TokenBucket:
+    ''' Thread-safe token bucket: `acquire()` blocks until a request is allowed. '''
+    def __init__(self, rate: float = POLITE_REQUESTS_PER_SECOND, capacity: int = POLITE_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return None
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        ''' Empties the bucket and holds off new requests (e.g. after a 429 response). '''
+        with self.lock:
+            self.tokens = -seconds * self.rate
+
+
+@dataclass
+class DownloadTarget:
+    year: int
+    day: int
+    url: str
+    filepath: Path
+
+@dataclass
+class DownloadManifest:
+    ''' Validators and fetch times for every downloaded file, saved after each download so that
+        an interrupted bulk download can pick up where it left off. '''
+    filepath: Path = DOWNLOAD_MANIFEST
+    entries: dict[str, dict] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def load(cls, filepath: Path = DOWNLOAD_MANIFEST) -> "DownloadManifest":
+        if not filepath.exists():
+            return cls(filepath)
+        with open(filepath) as f:
+            return cls(filepath, json.load(f))
+
+    def get(self, url: str) -> dict:
+        with self.lock:
+            return dict(self.entries.get(url, {}))
+
+    def update(self, url: str, **values) -> None:
+        with self.lock:
+            self.entries.setdefault(url, {}).update(values)
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.filepath.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self.entries, f, indent=2)
+            tmp_path.replace(self.filepath)
+
+@dataclass
+class DownloadSummary:
+    downloaded: list[DownloadTarget] = field(default_factory=list)
+    not_modified: list[DownloadTarget] = field(default_factory=list)
+    skipped: list[DownloadTarget] = field(default_factory=list)
+    failed: list[DownloadTarget] = field(default_factory=list)
 
-    html = resp.text
 
-    filename = f"aoc_{year}_day_{day}.html"
-    filepath = DATA_DIR / str(year) / str(day) / filename
+def make_html_targets(years: Iterable[int],
+                      days: Iterable[int] = range(1, 26),
+                      base_url: str = AOC_BASE_URL,
+                      data_dir: Path = DATA_DIR) -> list[DownloadTarget]:
+    return [DownloadTarget(year, day, f"{base_url}/{year}/day/{day}",
+                           data_dir / str(year) / str(day) / f"aoc_{year}_day_{day}.html")
+            for year in years for day in days]
 
-    if isinstance(html, str):
-        with open(filepath, 'w') as f:
-            f.write(html)
-        logger.info(f"{year} DAY {day:02d} | Writing new file: {filepath}")
+def get_retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    ''' Seconds to wait before retrying: the `Retry-After` header (a number of seconds or an
+        HTTP date), else exponential backoff, clamped to [0, MAX_RETRY_AFTER]. '''
+    delay = float(2 ** attempt)
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+                delay = (retry_at - dt.datetime.now(dt.timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
 
-def download_all_html_files():
-    for year in range(2015, LATEST_AOC_YEAR+1):
-        for day in range(1, 26):
-            download_html_file(year, day)
-            time.sleep(5)
+def fetch_with_retries(session: requests.Session,
+                       bucket: TokenBucket,
+                       url: str,
+                       headers: dict[str, str]) -> requests.Response:
+    for attempt in range(1, MAX_RETRIES + 1):
+        bucket.acquire()
+        resp = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+            return resp
+        retry_after = get_retry_delay(resp.headers.get('Retry-After'), attempt)
+        logger.warning(f"{url} | HTTP {resp.status_code}; retrying in {retry_after} seconds")
+        bucket.pause(retry_after)
+    return resp
 
-def get_raw_html_from_server(year: int, day: int) -> str:
+def download_target(target: DownloadTarget,
+                    session: requests.Session,
+                    bucket: TokenBucket,
+                    manifest: DownloadManifest,
+                    summary: DownloadSummary,
+                    refresh_after: dt.timedelta) -> None:
+    entry = manifest.get(target.url)
+    file_exists = target.filepath.exists()
+
+    if file_exists and entry.get('fetched_at'):
+        age = dt.datetime.now(dt.timezone.utc) - dt.datetime.fromisoformat(entry['fetched_at'])
+        if age < refresh_after:
+            summary.skipped.append(target)
+            return None
+
+    headers = {}
+    if file_exists and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if file_exists and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+
+    try:
+        resp = fetch_with_retries(session, bucket, target.url, headers)
+        now = dt.datetime.now(dt.timezone.utc).isoformat()
+        if resp.status_code == 304:
+            manifest.update(target.url, fetched_at=now)
+            summary.not_modified.append(target)
+            logger.debug(f"{target.year} DAY {target.day:02d} | Not modified: {target.url}")
+            return None
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        logger.error(f"{target.year} DAY {target.day:02d} | Download failed: {e}")
+        summary.failed.append(target)
+        return None
+
+    target.filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(target.filepath, 'w') as f:
+        f.write(resp.text)
+    manifest.update(target.url,
+                    fetched_at=now,
+                    etag=resp.headers.get('ETag', ''),
+                    last_modified=resp.headers.get('Last-Modified', ''))
+    summary.downloaded.append(target)
+    logger.info(f"{target.year} DAY {target.day:02d} | Writing new file: {target.filepath}")
+
+def download_files(targets: list[DownloadTarget],
+                   session: Optional[requests.Session] = None,
+                   bucket: Optional[TokenBucket] = None,
+                   manifest: Optional[DownloadManifest] = None,
+                   max_workers: int = DOWNLOAD_WORKERS,
+                   refresh_after: dt.timedelta = dt.timedelta(days=1)) -> DownloadSummary:
+    ''' Downloads every target over one keep-alive session, at most as fast as the token bucket
+        allows.  Files fetched within `refresh_after` are skipped outright (so an interrupted run
+        resumes); older ones are re-validated with conditional requests. '''
+    session = session or get_session()
+    bucket = bucket or TokenBucket()
+    manifest = manifest or DownloadManifest.load()
+    summary = DownloadSummary()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(download_target, target, session, bucket, manifest, summary, refresh_after)
+                   for target in targets]
+        for future in futures:
+            future.result()
+
+    logger.info(f"Downloaded {len(summary.downloaded)}, not modified {len(summary.not_modified)}, " +
+                f"skipped {len(summary.skipped)}, failed {len(summary.failed)}")
+    return summary
+
+def download_html_file(year: int, day: int) -> None:
+    download_files(make_html_targets([year], [day]), refresh_after=dt.timedelta(0))
+
+def download_all_html_files(refresh_after: dt.timedelta = dt.timedelta(days=1)) -> DownloadSummary:
+    return download_files(make_html_targets(range(2015, LATEST_AOC_YEAR+1)), refresh_after=refresh_after)
+
+def get_puzzle_url(year: int, day: int) -> str:
+    return f"{AOC_BASE_URL}/{year}/day/{day}"
+
+def get_input_url(year: int, day: int) -> str:
+    return f"{AOC_BASE_URL}/{year}/day/{day}/input"
+
+def get_raw_html_from_server(year: int, day: int, use_cache: bool = True) -> str:
     validate_year_and_day(year, day)
-        
-    url = f"https://adventofcode.com/{year}/day/{day}"
-    resp = requests.get(url, headers={"Cookie": f"session={AOC_SESSION}", 
-                                      "User-Agent": USER_AGENT_STRING})
+
+    url = get_puzzle_url(year, day)
+    if use_cache and (cached := RESPONSE_CACHE.get(url)):
+        if PART_TWO_SOLVED_TEXT in cached or RESPONSE_CACHE.get_age(url) < UNSOLVED_PAGE_TTL:
+            return cached
+
+    resp = get_session().get(url, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
+    RESPONSE_CACHE.put(url, resp.text)
     return resp.text
 
-def get_input_from_server(year: int, day: int) -> str:
+def get_input_from_server(year: int, day: int, use_cache: bool = True) -> str:
     validate_year_and_day(year, day)
-    
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
-    resp = requests.get(url, headers={"Cookie": f"session={AOC_SESSION}", 
-                                      "User-Agent": USER_AGENT_STRING})
+
+    url = get_input_url(year, day)
+    if use_cache and (cached := RESPONSE_CACHE.get(url)):
+        return cached
+
+    resp = get_session().get(url, timeout=REQUEST_TIMEOUT)
     if 'Please log in to get your puzzle input.' in resp.text:
         raise AOCLoginException('Please log in to get your puzzle input.')
     else:
-        return resp.text.removesuffix('\n')
+        input_text = resp.text.removesuffix('\n')
+        if resp.ok:
+            RESPONSE_CACHE.put(url, input_text)
+        return input_text
 
+def invalidate_puzzle_page(year: int, day: int) -> None:
+    ''' Called after a correct answer, since the page now shows the next part (or both answers). '''
+    RESPONSE_CACHE.invalidate(get_puzzle_url(year, day))
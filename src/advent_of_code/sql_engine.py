@@ -0,0 +1,46 @@
+import os
+
+import sqlalchemy as db
+from sqlalchemy.engine import Engine
+
+from advent_of_code.constants import SQLITE_URL
+
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+BUSY_TIMEOUT_MS = 10_000
+CACHED_STATEMENTS = 256   # per-connection sqlite3 prepared-statement cache
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',      # readers don't block the writer (and vice versa)
+    'synchronous': 'NORMAL',    # safe with WAL; skips an fsync per commit
+    'busy_timeout': BUSY_TIMEOUT_MS,
+    'temp_store': 'MEMORY',
+}
+
+ENGINES: dict[str, Engine] = {}
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for key, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {key}={value}")
+    cursor.close()
+
+def get_engine(url: str = SQLITE_URL) -> Engine:
+    ''' Returns the one shared engine (and connection pool) for a database URL. '''
+    if url not in ENGINES:
+        engine = db.create_engine(url,
+                                  pool_size=POOL_SIZE,
+                                  max_overflow=MAX_OVERFLOW,
+                                  connect_args={'cached_statements': CACHED_STATEMENTS,
+                                                'timeout': BUSY_TIMEOUT_MS / 1000})
+        db.event.listen(engine, 'connect', set_sqlite_pragmas)
+        ENGINES[url] = engine
+    return ENGINES[url]
+
+def dispose_engines_after_fork() -> None:
+    ''' A forked child (e.g. a `ProcessPoolExecutor` worker) must not reuse the parent's pooled
+        connections, so it drops the inherited pools without closing them. '''
+    for engine in ENGINES.values():
+        engine.dispose(close=False)
+
+os.register_at_fork(after_in_child=dispose_engines_after_fork)
@@ -1,15 +1,18 @@
 import sqlalchemy as db
-from sqlalchemy.orm import Session
-from loguru import logger
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from advent_of_code.logging_config import logger
 
-from advent_of_code.constants import SQLITE_URL
 from advent_of_code.models import Puzzle, PuzzleAnswer
-from advent_of_code.sql_schema import answers_table, metadata_obj, puzzles_table
-from advent_of_code.helpers import validate_year_and_day
-from advent_of_code.local import get_puzzle_from_local, get_all_puzzles_from_local
+from advent_of_code.models.puzzle import EAGER_COLUMNS
+from advent_of_code.sql_engine import get_engine
+from advent_of_code.sql_schema import answers_table, benchmarks_table, metadata_obj, puzzles_table, results_table
+from advent_of_code.enums import ResponseType
+from advent_of_code.helpers import get_now_string, validate_year_and_day
+from advent_of_code.html_parsing import get_answers_from_soup, make_soup
+from advent_of_code.local import get_puzzle_values_from_local, get_all_puzzle_values_from_local
 from advent_of_code.exceptions import PuzzleNotFound, PuzzleAnswerNotFound
 
-SQL_ENGINE = db.create_engine(SQLITE_URL)
+SQL_ENGINE = get_engine()
 
 def create_all_tables() -> None:
     metadata_obj.create_all(SQL_ENGINE, checkfirst=True)
@@ -20,6 +23,12 @@ def create_puzzles_table() -> None:
 def create_answers_table() -> None:
     answers_table.create(SQL_ENGINE, checkfirst=True)
 
+def create_benchmarks_table() -> None:
+    benchmarks_table.create(SQL_ENGINE, checkfirst=True)
+
+def create_results_table() -> None:
+    results_table.create(SQL_ENGINE, checkfirst=True)
+
 def drop_all_tables() -> None:
     metadata_obj.drop_all(SQL_ENGINE)
 
@@ -29,59 +38,79 @@ def drop_puzzles_table() -> None:
 def drop_answers_table() -> None:
     answers_table.drop(SQL_ENGINE)
 
+def drop_benchmarks_table() -> None:
+    benchmarks_table.drop(SQL_ENGINE)
+
+def drop_results_table() -> None:
+    results_table.drop(SQL_ENGINE)
+
 
 def delete_and_replace_all_puzzles_on_db() -> None:
     drop_puzzles_table()
     create_puzzles_table()
     write_all_puzzles_to_db()
     
+def upsert_puzzle_rows(rows: list[dict]) -> None:
+    ''' Writes all rows in one transaction (a single `executemany`), updating any puzzle that 
+        already exists for the same year and day. '''
+    if not rows:
+        return None
+    stmt = sqlite_insert(puzzles_table)
+    update_columns = [col.name for col in puzzles_table.c 
+                      if col.name not in ('id', 'year', 'day') and col.name in rows[0]]
+    stmt = stmt.on_conflict_do_update(index_elements=['year', 'day'],
+                                      set_={col: stmt.excluded[col] for col in update_columns})
+    with SQL_ENGINE.begin() as conn:
+        conn.execute(stmt, rows)
+    logger.debug(f"Upserted {len(rows)} puzzles")
+
+def insert_answer_rows(rows: list[dict]) -> None:
+    ''' Inserts all rows in one transaction, skipping any that are already on the DB. '''
+    if not rows:
+        return None
+    stmt = sqlite_insert(answers_table).on_conflict_do_nothing()
+    with SQL_ENGINE.begin() as conn:
+        conn.execute(stmt, rows)
+    logger.debug(f"Inserted up to {len(rows)} answers")
+
 def write_all_puzzles_to_db() -> None:
-    puzzle_list = get_all_puzzles_from_local()
-    with Session(SQL_ENGINE) as session:
-        for puzzle in puzzle_list:
-            sql_puzzle = puzzle.get_sql_object()
-            session.add(sql_puzzle)
-        session.commit()     
+    upsert_puzzle_rows(get_all_puzzle_values_from_local())
 
 def sql_tests():
     metadata_obj.create_all(SQL_ENGINE)
-    with Session(SQL_ENGINE) as session:
-        for year in range(2015, 2025):
-            for day in range(1, 26):
-                puzzle = get_puzzle_from_local(year, day)
-                sql_puzzle = puzzle.get_sql_object()
-                session.add(sql_puzzle)
-                session.commit()     
+    upsert_puzzle_rows([get_puzzle_values_from_local(year, day) 
+                        for year in range(2015, 2025)
+                        for day in range(1, 26)])
 
 
 
 def get_all_puzzles_from_db() -> list[Puzzle]:
     with SQL_ENGINE.connect() as conn:
-        stmt = db.select(puzzles_table)
+        stmt = db.select(*EAGER_COLUMNS)
         response = conn.execute(stmt).fetchall()
         if not response:
             raise PuzzleNotFound("No puzzles found in database")
-        return [Puzzle(**row._asdict()) for row in response]
+        return [Puzzle.from_row(row) for row in response]
 
 def get_puzzle_from_db_by_id(id: int) -> Puzzle:
     with SQL_ENGINE.connect() as conn:
-        stmt = (db.select(puzzles_table)
+        stmt = (db.select(*EAGER_COLUMNS)
                   .where(puzzles_table.c.id == id))
         row = conn.execute(stmt).fetchone()
         if not row:
             raise PuzzleNotFound(f"No puzzle found in database with ID {id}")
-        return Puzzle(**row._asdict())
+        return Puzzle.from_row(row)
 
 def get_puzzle_from_db_by_year_and_day(year: int, day: int) -> Puzzle:
     validate_year_and_day(year, day)
     with SQL_ENGINE.connect() as conn:
-        stmt = (db.select(puzzles_table)
+        stmt = (db.select(*EAGER_COLUMNS)
                   .where(puzzles_table.c.year == year)
                   .where(puzzles_table.c.day == day))
         row = conn.execute(stmt).fetchone()
         if not row:
             raise PuzzleNotFound(f"No puzzle found in database for {year} DAY {day:02f}")
-        return Puzzle(**row._asdict())
+        return Puzzle.from_row(row)
 
 
 
@@ -122,10 +151,49 @@ def fix_manual_raw_responses():
         answer.update_info_on_db()
         
 def find_answers_in_html_text_on_db() -> None:
-    puzzle_list = get_all_puzzles_from_db()
-    for puzzle in puzzle_list:
-        puzzle.find_answers_in_raw_html()
-        puzzle.update_answers_in_db_answer_table()
+    ''' Back-fills answers found in each puzzle's saved HTML: one UPDATE batch for the
+        `puzzles` table and one INSERT batch for the `answers` table. '''
+    with SQL_ENGINE.connect() as conn:
+        puzzle_rows = conn.execute(db.select(puzzles_table.c.id, puzzles_table.c.year, puzzles_table.c.day,
+                                             puzzles_table.c.part_1_answer, puzzles_table.c.part_2_answer,
+                                             puzzles_table.c.raw_html)
+                                     .where(puzzles_table.c.raw_html.contains('Your puzzle answer was'))).fetchall()
+        solved_rows = conn.execute(db.select(answers_table.c.puzzle_id, answers_table.c.level)
+                                     .where(answers_table.c.correct == 1)).fetchall()
+    solved_levels = {(r.puzzle_id, r.level) for r in solved_rows}
+
+    puzzle_updates: dict[int, list[dict]] = {1: [], 2: []}
+    answer_rows = []
+    for row in puzzle_rows:
+        answers = get_answers_from_soup(make_soup(row.raw_html))
+        current = (row.part_1_answer, row.part_2_answer)
+        for level, answer in enumerate(answers, start=1):
+            if not answer:
+                continue
+            if answer != current[level-1]:
+                logger.info(f"{row.year} DAY {row.day:02d} (ID: {row.id}) | Adding new Part {level} answer: {answer}")
+                puzzle_updates[level].append({'b_id': row.id, 'b_answer': answer})
+            if (row.id, level) not in solved_levels:
+                answer_rows.append({'puzzle_id': row.id,
+                                    'year': row.year,
+                                    'day': row.day,
+                                    'timestamp': get_now_string(),
+                                    'level': level,
+                                    'answer': answer,
+                                    'correct': True,
+                                    'response_type': ResponseType.NOT_YET_SUBMITTED.name,
+                                    'raw_response': "Found in HTML response from AOC server."})
+
+    with SQL_ENGINE.begin() as conn:
+        for level, updates in puzzle_updates.items():
+            if not updates:
+                continue
+            stmt = (db.update(puzzles_table)
+                      .where(puzzles_table.c.id == db.bindparam('b_id'))
+                      .values({f"part_{level}_answer": db.bindparam('b_answer'),
+                               f"part_{level}_solved": True}))
+            conn.execute(stmt, updates)
+    insert_answer_rows(answer_rows)
 
 def delete_blank_answers_on_db():
     with SQL_ENGINE.connect() as conn:
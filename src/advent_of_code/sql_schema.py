@@ -1,5 +1,5 @@
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData, Table, Column, ForeignKey, UniqueConstraint, Text, Integer, Boolean
+from sqlalchemy import MetaData, Table, Column, ForeignKey, UniqueConstraint, Text, Integer, Boolean, Float
 
 metadata_obj = MetaData()
 
@@ -39,6 +39,37 @@ answers_table = Table(
     UniqueConstraint('puzzle_id', 'level', 'answer', 'response_type'), 
 )
 
+benchmarks_table = Table(
+    'benchmarks',
+    metadata_obj,
+    Column('id', Integer, primary_key=True),
+    Column('year', Integer, nullable=False),
+    Column('day', Integer, nullable=False),
+    Column('part', Integer, nullable=False),
+    Column('commit', Text, nullable=False),
+    Column('timestamp', Text, nullable=False),
+    Column('runs', Integer, nullable=False),
+    Column('min_time', Float, nullable=False),
+    Column('median_time', Float, nullable=False),
+    Column('p95_time', Float, nullable=False),
+    UniqueConstraint('year', 'day', 'part', 'commit'), 
+)
+
+results_table = Table(
+    'results',
+    metadata_obj,
+    Column('id', Integer, primary_key=True),
+    Column('year', Integer, nullable=False),
+    Column('day', Integer, nullable=False),
+    Column('part', Integer, nullable=False),
+    Column('source_hash', Text, nullable=False),
+    Column('input_hash', Text, nullable=False),
+    Column('answer', Text, nullable=False),
+    Column('wall_time', Float, nullable=False),
+    Column('timestamp', Text, nullable=False),
+    UniqueConstraint('year', 'day', 'part', 'source_hash', 'input_hash'), 
+)
+
 class Base(DeclarativeBase):
     pass
 
@@ -48,6 +79,12 @@ class PuzzleSQL(Base):
 class AnswerSQL(Base):
     __table__ = answers_table
 
+class BenchmarkSQL(Base):
+    __table__ = benchmarks_table
+
+class ResultSQL(Base):
+    __table__ = results_table
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,87 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import sqlalchemy as db
+from rich.table import Table
+
+from advent_of_code.runner import DEFAULT_TIMEOUT, PartResult, SolutionFile, run_solutions
+from advent_of_code.sql_engine import get_engine
+from advent_of_code.sql_schema import answers_table
+
+SQL_ENGINE = get_engine()
+
+FAILING_OUTCOMES = {'wrong', 'error', 'timeout'}
+
+@dataclass
+class Verification:
+    result: PartResult
+    expected: Optional[str]
+
+    @property
+    def outcome(self) -> str:
+        ''' 'pass', 'wrong', 'error', 'timeout', 'missing' (no part function) or 'unknown'
+            (no correct answer on record to compare against). '''
+        if not self.result.ok:
+            return self.result.status
+        if self.expected is None:
+            return 'unknown'
+        return 'pass' if self.result.answer.strip() == self.expected.strip() else 'wrong'
+
+    @property
+    def failed(self) -> bool:
+        ''' A part that's gone missing fails too if it has an accepted answer on record (so a
+            deleted `part_two` is caught), but not otherwise (e.g. day 25 part two). '''
+        if self.outcome == 'missing':
+            return self.expected is not None
+        return self.outcome in FAILING_OUTCOMES
+
+
+def get_correct_answers_from_db(year: Optional[int] = None) -> dict[tuple[int, int, int], str]:
+    ''' Maps (year, day, part) to the answer the AOC server accepted. '''
+    with SQL_ENGINE.connect() as conn:
+        stmt = (db.select(answers_table.c.year, answers_table.c.day, answers_table.c.level, answers_table.c.answer)
+                  .where(answers_table.c.correct == 1))
+        if year:
+            stmt = stmt.where(answers_table.c.year == year)
+        return {(row.year, row.day, row.level): row.answer for row in conn.execute(stmt)}
+
+def verify_results(results: Iterable[PartResult], correct_answers: dict[tuple[int, int, int], str]) -> list[Verification]:
+    return [Verification(result, correct_answers.get((result.year, result.day, result.part)))
+            for result in results]
+
+def verify_solutions(solutions: Iterable[SolutionFile],
+                     max_workers: Optional[int] = None,
+                     timeout: Optional[float] = DEFAULT_TIMEOUT) -> list[Verification]:
+    ''' Always runs the solutions (never the result cache), since this is the check that a
+        refactor didn't change any answers. '''
+    solutions = list(solutions)
+    years = {solution.year for solution in solutions}
+    correct_answers = get_correct_answers_from_db(years.pop() if len(years) == 1 else None)
+    results = run_solutions(solutions, max_workers=max_workers, timeout=timeout)
+    return verify_results(results, correct_answers)
+
+def count_outcomes(verifications: list[Verification]) -> Counter[str]:
+    return Counter(v.outcome for v in verifications)
+
+def make_verify_table(verifications: list[Verification], show_all: bool = False) -> Table:
+    table = Table()
+    table.add_column('Year')
+    table.add_column('Day', justify='right')
+    table.add_column('Part', justify='center')
+    table.add_column('Outcome')
+    table.add_column('Expected')
+    table.add_column('Got')
+    table.add_column('Wall (s)', justify='right')
+    for v in verifications:
+        if not show_all and not v.failed and v.outcome in ('pass', 'missing'):
+            continue
+        outcome = f"[red]{v.outcome}[/red]" if v.failed else v.outcome
+        table.add_row(str(v.result.year),
+                      str(v.result.day),
+                      str(v.result.part),
+                      outcome,
+                      v.expected or '',
+                      v.result.answer if v.result.ok else v.result.error,
+                      f"{v.result.wall_time:.3f}")
+    return table
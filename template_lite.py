@@ -0,0 +1,53 @@
+import functools
+import itertools
+import math
+import re
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum, StrEnum
+from pathlib import Path
+from typing import Callable, Generator, NamedTuple, Optional, Self, Any
+
+from rich import print
+
+import advent_of_code as aoc
+
+# Only imported if actually used, so a day that doesn't need them starts instantly
+np = aoc.lazy_import('numpy')
+pd = aoc.lazy_import('pandas')
+pl = aoc.lazy_import('polars')
+nx = aoc.lazy_import('networkx')
+alive_progress = aoc.lazy_import('alive_progress')
+
+CURRENT_FILE = Path(__file__)
+YEAR = int(CURRENT_FILE.parts[-2])
+DAY = int(CURRENT_FILE.stem.removeprefix('day')[0:2])
+
+EXAMPLE = aoc.get_example(YEAR, DAY)
+INPUT = aoc.get_input(YEAR, DAY)
+
+def parse_data(data: str):
+    line_list = data.splitlines()
+    
+def part_one(data: str):
+    __ = parse_data(data)
+
+def part_two(data: str):
+    __ = parse_data(data)
+
+
+
+def main():
+    print(f"Part One (example):  {part_one(EXAMPLE)}")
+    print(f"Part One (input):  {part_one(INPUT)}")
+    print(f"Part Two (example):  {part_two(EXAMPLE)}")
+    print(f"Part Two (input):  {part_two(INPUT)}")
+
+    random_tests()
+
+def random_tests():
+    ...
+
+       
+if __name__ == '__main__':
+    main()
\ No newline at end of file
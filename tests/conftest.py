@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# Test runs (and the worker processes they start) log to a scratch directory, not the repo's logs/
+os.environ.setdefault('AOC_LOGS_DIR', tempfile.mkdtemp(prefix='aoc_test_logs_'))
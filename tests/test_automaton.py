@@ -0,0 +1,84 @@
+import runpy
+
+import numpy as np
+import pytest
+
+import advent_of_code as aoc
+from advent_of_code import automaton
+from advent_of_code.constants import SOLUTIONS_DIR
+from advent_of_code.grid import Grid
+
+def reference_step(cells: np.ndarray, diagonal: bool = True) -> np.ndarray:
+    ''' Conway's Life, one cell at a time. '''
+    rows, cols = cells.shape
+    result = np.zeros_like(cells)
+    for row in range(rows):
+        for col in range(cols):
+            live = 0
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if (dr or dc) and (diagonal or not (dr and dc)) and 0 <= row + dr < rows and 0 <= col + dc < cols:
+                        live += cells[row + dr, col + dc]
+            result[row, col] = live in ((2, 3) if cells[row, col] else (3,))
+    return result
+
+def test_life_rule_table():
+    rule = automaton.make_life_rule()
+    assert rule.shape == (2, 9)
+    assert list(np.flatnonzero(rule[0])) == [3]
+    assert list(np.flatnonzero(rule[1])) == [2, 3]
+
+@pytest.mark.parametrize('diagonal', [True, False])
+def test_matches_reference(diagonal):
+    cells = (np.random.default_rng(11).random((13, 17)) < 0.4).astype(np.uint8)
+    life = automaton.Automaton(cells, automaton.make_life_rule(), diagonal=diagonal)
+    expected = cells
+    for _ in range(6):
+        life.step()
+        expected = reference_step(expected, diagonal)
+        assert np.array_equal(life.cells, expected)
+    assert life.generation == 6
+
+def test_count_neighbors_matches_grid():
+    cells = (np.random.default_rng(2).random((9, 8)) < 0.5).astype(np.uint8)
+    life = automaton.Automaton(cells, automaton.make_life_rule())
+    assert np.array_equal(life.count_neighbors(1), Grid(cells).count_neighbors(1))
+
+def test_blinker_and_fixed_cells():
+    cells = np.zeros((5, 5), dtype=np.uint8)
+    cells[2, 1:4] = 1
+    life = automaton.Automaton(cells, automaton.make_life_rule())
+    life.step()
+    assert [tuple(p) for p in np.argwhere(life.cells)] == [(1, 2), (2, 2), (3, 2)]
+    assert life.run(1).key() == cells.tobytes()
+
+    fixed = np.zeros((5, 5), dtype=bool)
+    fixed[0, 0] = True
+    stuck = automaton.Automaton(np.eye(5, dtype=np.uint8), automaton.make_life_rule(), fixed=fixed)
+    assert stuck.run(10).cells[0, 0] == 1
+    assert stuck.count() == 1
+
+def test_multi_state_rule():
+    # Two counted states: a cell becomes 2 if it has any 2-neighbor, else 1 with two or more 1s
+    rule = automaton.make_rule(3, (1, 2), lambda state, ones, twos: 2 if twos else (1 if ones >= 2 else 0))
+    assert rule.shape == (3, 9, 9)
+    cells = np.array([[2, 0, 0, 0],
+                      [0, 1, 1, 0],
+                      [0, 0, 0, 0]], dtype=np.uint8)
+    world = automaton.Automaton(cells, rule, counted=(1, 2)).run(1)
+    assert world.cells.tolist() == [[0, 2, 1, 0],
+                                     [2, 2, 0, 0],
+                                     [0, 1, 1, 0]]
+
+def test_rule_shape_must_match_counted_states():
+    with pytest.raises(ValueError):
+        automaton.Automaton(np.zeros((3, 3)), automaton.make_life_rule(), counted=(1, 2))
+
+def test_2015_day18_example(monkeypatch):
+    # Part two's corners are stuck on from the start, before step 1
+    monkeypatch.setattr(aoc, 'get_input', lambda year, day: '')
+    monkeypatch.setattr(aoc, 'get_description', lambda year, day: '')
+    day18 = runpy.run_path(str(SOLUTIONS_DIR / '2015' / 'day18.py'))
+    assert day18['part_one'](day18['EXAMPLE'], steps=4) == 4
+    assert day18['part_two'](day18['EXAMPLE'], steps=5) == 17
+    assert day18['part_two'](day18['EXAMPLE_PART_TWO'], steps=5) == 17
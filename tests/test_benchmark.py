@@ -0,0 +1,37 @@
+import pytest
+
+import advent_of_code.benchmark as bench
+from advent_of_code.runner import PartResult
+
+def test_percentile_single_run():
+    assert bench.percentile([1.5], 95) == 1.5
+
+@pytest.mark.parametrize('pct, expected', [(50, 10), (95, 19), (100, 20)])
+def test_percentile_nearest_rank(pct, expected):
+    assert bench.percentile([float(x) for x in range(20, 0, -1)], pct) == expected
+
+def test_summarize_timings():
+    result = bench.summarize_timings(2015, 1, 1, 'abc1234', [3.0, 1.0, 2.0, 10.0])
+    assert result.runs == 4
+    assert result.min_time == 1.0
+    assert result.median_time == 2.5
+    assert result.p95_time == 10.0
+
+def test_summarize_part_results_drops_failed_parts():
+    results = [PartResult(2015, 1, 1, wall_time=1.0),
+               PartResult(2015, 1, 1, wall_time=2.0),
+               PartResult(2015, 1, 2, wall_time=1.0),
+               PartResult(2015, 1, 2, status='timeout'),
+               PartResult(2015, 2, 2, status='missing')]
+    summaries = bench.summarize_part_results(results, 'abc1234')
+    assert [(b.day, b.part, b.runs) for b in summaries] == [(1, 1, 2)]
+
+def test_find_regressions():
+    fast = bench.summarize_timings(2015, 1, 1, 'new', [1.05])
+    slow = bench.summarize_timings(2015, 1, 2, 'new', [1.5])
+    new = bench.summarize_timings(2015, 2, 1, 'new', [9.0])
+    for b in (fast, slow):
+        b.baseline_commit, b.baseline_median_time = 'old', 1.0
+
+    assert bench.find_regressions([fast, slow, new], threshold=10) == [slow]
+    assert bench.find_regressions([fast, slow, new], threshold=60) == []
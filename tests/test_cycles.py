@@ -0,0 +1,62 @@
+import pytest
+
+from advent_of_code import cycles
+
+def rho_step(x: int) -> int:
+    ''' 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 3 -> ...: a tail of 3, then a cycle of 4. '''
+    return x + 1 if x < 6 else 3
+
+@pytest.mark.parametrize('find', [cycles.find_cycle, cycles.brent])
+def test_find_cycle(find):
+    assert find(0, rho_step) == cycles.Cycle(3, 4)
+    assert find(4, rho_step) == cycles.Cycle(0, 4)
+    assert find(0, lambda x: x + 1, max_steps=100) is None
+
+@pytest.mark.parametrize('find', [cycles.find_cycle, cycles.brent])
+def test_find_cycle_matches_simulation(find):
+    step = lambda x: (x * x + 1) % 255
+    cycle = find(3, step)
+    states = [3]
+    for _ in range(cycle.start + 3 * cycle.length):
+        states.append(step(states[-1]))
+    assert states[cycle.start] == states[cycle.start + cycle.length]
+    assert len(set(states[:cycle.start + cycle.length])) == cycle.start + cycle.length
+
+def test_equivalent_step():
+    cycle = cycles.Cycle(3, 4)
+    assert cycle.equivalent_step(2) == 2
+    assert cycle.equivalent_step(7) == 3
+    assert cycle.equivalent_step(1_000_000_001) == 3 + (1_000_000_001 - 3) % 4
+
+def test_fast_forward():
+    assert cycles.fast_forward(0, rho_step, 5) == 5
+    assert cycles.fast_forward(0, rho_step, 1_000_000_000) == 3 + (1_000_000_000 - 3) % 4
+    assert cycles.fast_forward(0, rho_step, 10**30, observe=lambda x: x * 10) == 10 * (3 + (10**30 - 3) % 4)
+
+def test_fast_forward_in_place_step():
+    class Counter:
+        def __init__(self):
+            self.value = 0
+            self.steps = 0
+        def tick(self) -> None:
+            self.value = (self.value + 1) % 3
+            self.steps += 1
+
+    counter = Counter()
+    assert cycles.fast_forward(counter, Counter.tick, 10**12, key=lambda c: c.value, observe=lambda c: c.value) == 10**12 % 3
+    assert counter.steps == 3
+
+def test_fast_forward_with_drift():
+    # A pattern that moves one cell to the right every step: its position sum grows steadily
+    def step(cells: frozenset[int]) -> frozenset[int]:
+        return frozenset(c + 1 for c in cells)
+    start = frozenset({0, 2, 3})
+    key = lambda cells: frozenset(c - min(cells) for c in cells)
+    assert cycles.fast_forward(start, step, 50_000_000_000, key=key, observe=sum, drift=True) == 5 + 3 * 50_000_000_000
+
+def test_extrapolate_linear():
+    # Wobbles for a while, then settles into +7 per step
+    step = lambda x: x + 1
+    observe = lambda x: (x % 5) * 100 if x < 40 else 7 * x - 3
+    assert cycles.extrapolate_linear(0, step, 10**9, observe, confirmations=10) == 7 * 10**9 - 3
+    assert cycles.extrapolate_linear(0, step, 12, observe, confirmations=10) == observe(12)
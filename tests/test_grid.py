@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+import advent_of_code as aoc
+from advent_of_code import grid
+
+MAZE = "#####\n#S..#\n#.#E#\n#####\n"
+
+def test_parse_raw_ascii():
+    array, start, target = grid.parse(MAZE)
+    assert array.dtype == np.uint8
+    assert array.shape == (4, 5)
+    assert array.flags.writeable
+    assert (array == ord('#')).sum() == 15
+    assert start == (1, 1)
+    assert target == (2, 3)
+
+def test_parse_with_codes():
+    parsed = grid.parse(MAZE, codes={'#': 1, '.': 0, 'S': 0, 'E': 0})
+    assert parsed.array.tolist() == [[1, 1, 1, 1, 1],
+                                     [1, 0, 0, 0, 1],
+                                     [1, 0, 1, 0, 1],
+                                     [1, 1, 1, 1, 1]]
+    assert (parsed.start, parsed.target) == ((1, 1), (2, 3))
+
+def test_parse_digits_and_bytes_input():
+    parsed = grid.parse(b"0123\r\n4567\r\n", codes={str(i): i for i in range(10)}, start=None, target=None)
+    assert parsed.array.tolist() == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert parsed.start is None and parsed.target is None
+
+def test_parse_unmapped_characters():
+    with pytest.raises(ValueError, match="'E'"):
+        grid.parse(MAZE, codes={'#': 1, '.': 0, 'S': 0})
+    assert grid.parse(MAZE, codes={'#': 1}, default=0).array.sum() == 15
+
+def test_parse_ragged_grid():
+    with pytest.raises(ValueError):
+        grid.parse("###\n##\n###")
+    with pytest.raises(ValueError):
+        grid.parse("##\n###\n#")
+
+def test_parse_keeps_leading_rows():
+    parsed = grid.parse("   \n.S.\n...\n\n", target=None)
+    assert parsed.array.shape == (3, 3)
+    assert parsed.start == (1, 1)
+    # A leading empty line is an empty row (as with str.splitlines()), not something to drop
+    with pytest.raises(ValueError):
+        grid.parse("\n###\n###")
+
+def test_find():
+    array = grid.parse("@.@\n.@.", codes={'@': 1, '.': 0}).array
+    assert grid.find(array, 1) == [(0, 0), (0, 2), (1, 1)]
+
+def test_aoc_grid_namespace():
+    assert aoc.grid.parse is grid.parse
+
+def test_grid_padding_and_indices():
+    g = grid.Grid.from_text(MAZE, codes={'#': 1, '.': 0, 'S': 0, 'E': 0}, pad_value=2)
+    assert (g.rows, g.cols, g.width) == (4, 5, 7)
+    assert g.coordinate(g.start) == (1, 1)
+    assert g.coordinate(g.target) == (2, 3)
+    assert g.array.shape == (4, 5)
+    assert g.array.sum() == 15
+
+    corner = g.index(0, 0)
+    assert sorted(g[n] for n in g.neighbors(corner)) == [1, 1, 2, 2]
+    assert len(g.neighbors(corner, diagonal=True)) == 8
+
+def test_grid_unpadded_neighbors():
+    g = grid.Grid(np.zeros((3, 4), dtype=np.uint8))
+    assert sorted(map(g.coordinate, g.neighbors(g.index(0, 0)))) == [(0, 1), (1, 0)]
+    assert len(g.neighbors(g.index(1, 3), diagonal=True)) == 5
+    assert len(g.neighbors(g.index(1, 1), diagonal=True)) == 8
+
+def test_grid_buffers_share_memory():
+    g = grid.Grid.from_text("..\n..", codes={'.': 0}, pad_value=9)
+    g[g.index(0, 1)] = 5
+    assert g.array[0, 1] == 5
+    g.array[1, 0] = 7
+    assert g[g.index(1, 0)] == 7
+    assert g.indices_of(7) == [g.index(1, 0)]
+
+def test_count_neighbors():
+    g = grid.Grid.from_text("@@.\n@@.\n..@", codes={'@': 1, '.': 0}, pad_value=1)
+    assert g.count_neighbors(1).tolist() == [[3, 3, 2],
+                                             [3, 4, 3],
+                                             [2, 3, 1]]
+    assert g.count_neighbors(1, diagonal=False).tolist() == [[2, 2, 1],
+                                                             [2, 2, 2],
+                                                             [1, 2, 0]]
+
+def test_to_text():
+    g = grid.Grid.from_text(MAZE, pad_value=0)
+    assert g.to_text() == MAZE.strip()
+    assert grid.Grid.from_text("ab", codes={'a': 0, 'b': 1}).to_text({0: '.', 1: '#'}) == '.#'
@@ -0,0 +1,34 @@
+import hashlib
+import itertools
+
+import pytest
+
+from advent_of_code import hashing
+
+def brute_force(prefix: str, zeros: int, count: int) -> list[hashing.Match]:
+    matches = []
+    for nonce in itertools.count():
+        hexdigest = hashlib.md5(f"{prefix}{nonce}".encode()).hexdigest()
+        if hexdigest.startswith('0' * zeros):
+            matches.append(hashing.Match(nonce, hexdigest))
+            if len(matches) == count:
+                return matches
+
+@pytest.mark.parametrize('zeros', [0, 1, 2, 3, 4])
+def test_mine_chunk_matches_hexdigest_check(zeros):
+    expected = [hashing.Match(nonce, hashlib.md5(b'xyz%d' % nonce).hexdigest()) for nonce in range(5000)]
+    expected = [m for m in expected if m.hexdigest.startswith('0' * zeros)]
+    assert hashing.mine_chunk(b'xyz', zeros, 0, 5000) == expected
+
+def test_mine_chunk_range():
+    assert hashing.mine_chunk(b'abc', 3, 0, 20_000) == [m for m in brute_force('abc', 3, 10) if m.nonce < 20_000]
+    assert all(1000 <= m.nonce < 3000 for m in hashing.mine_chunk(b'abc', 1, 1000, 3000))
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_iter_matches_in_nonce_order(max_workers):
+    matches = list(itertools.islice(hashing.iter_matches('abc', zeros=3, max_workers=max_workers, chunk_size=997), 12))
+    assert matches == brute_force('abc', 3, 12)
+
+def test_find_nonce():
+    assert hashing.find_nonce('abcdef', zeros=2, max_workers=1) == brute_force('abcdef', 2, 1)[0].nonce
+    assert hashing.find_nonce(b'abcdef', zeros=2, start=1000, max_workers=1) >= 1000
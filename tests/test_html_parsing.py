@@ -143,4 +143,27 @@ def mock_no_example():
 def test_get_example_from_soup_no_example(mock_no_example: BeautifulSoup):
     soup = mock_no_example
     with pytest.raises(exc.ElementNotFound):
-        html.get_example_from_soup(soup)
\ No newline at end of file
+        html.get_example_from_soup(soup)
+
+
+@pytest.mark.parametrize('filename', ['neither_part_solved.html', 'part_1_solved.html', 
+                                      'both_parts_solved.html', 'no_example.html'])
+def test_parse_puzzle_html_matches_individual_functions(filename):
+    raw_html = (TEST_HTML_DIR / filename).read_text()
+    soup = BeautifulSoup(raw_html, "html.parser")
+    try:
+        example_text = html.get_example_from_soup(soup)
+    except exc.ElementNotFound:
+        example_text = ''
+
+    parsed = html.parse_puzzle_html(raw_html)
+    assert (parsed.title, parsed.part_1_description, parsed.part_2_description) == \
+        html.get_puzzle_title_and_descriptions_from_soup(soup)
+    assert parsed.example_text == example_text
+    assert (parsed.part_1_answer, parsed.part_2_answer) == html.get_answers_from_soup(soup)
+    assert (parsed.part_1_solved, parsed.part_2_solved) == html.get_solved_statuses_from_soup(soup)
+
+def test_parse_puzzle_html_without_main_tag():
+    parsed = html.parse_puzzle_html('<html><body><article><h2>--- Day 1: Test ---</h2><p>Text</p></article></body></html>')
+    assert parsed.title == '--- Day 1: Test ---'
+    assert parsed.part_1_description == 'Text'
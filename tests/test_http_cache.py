@@ -0,0 +1,37 @@
+import datetime as dt
+
+import pytest
+
+from advent_of_code.http_cache import ResponseCache
+
+URL = 'https://adventofcode.com/2015/day/1'
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path, session='test-session')
+
+def test_get_missing(cache):
+    assert cache.get(URL) is None
+
+def test_put_and_get(cache):
+    cache.put(URL, '<html>day 1</html>')
+    assert cache.get(URL) == '<html>day 1</html>'
+
+def test_identical_bodies_stored_once(cache, tmp_path):
+    cache.put(URL, 'same')
+    cache.put(URL + '/input', 'same')
+    assert len(list((tmp_path / 'objects').rglob('*'))) == 2   # one subdirectory, one object
+
+def test_keyed_by_session(cache, tmp_path):
+    cache.put(URL, '<html>day 1</html>')
+    assert ResponseCache(tmp_path, session='another-session').get(URL) is None
+
+def test_max_age(cache):
+    cache.put(URL, '<html>day 1</html>')
+    assert cache.get(URL, max_age=dt.timedelta(hours=1)) == '<html>day 1</html>'
+    assert cache.get(URL, max_age=dt.timedelta(0)) is None
+
+def test_invalidate(cache):
+    cache.put(URL, '<html>day 1</html>')
+    cache.invalidate(URL)
+    assert cache.get(URL) is None
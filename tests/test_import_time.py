@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_US = 100_000   # 100 ms for `import advent_of_code` (cumulative, per -X importtime)
+HEAVY_MODULES = ['sqlalchemy', 'bs4', 'requests', 'loguru', 'numpy', 'pandas', 'polars', 'networkx']
+
+def get_cumulative_import_time_us(module: str) -> int:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        # e.g. "import time:       654 |      14911 | advent_of_code"
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace(':', '|', 1).split('|'))
+        if name == module:
+            return int(cumulative_us)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+def test_import_time_budget():
+    assert get_cumulative_import_time_us('advent_of_code') < IMPORT_BUDGET_US
+
+@pytest.mark.parametrize('heavy_module', HEAVY_MODULES)
+def test_no_heavy_imports(heavy_module):
+    code = f"import sys, advent_of_code; sys.exit({heavy_module!r} in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+def test_lazy_attribute():
+    code = "import sys, advent_of_code as aoc; aoc.get_input; sys.exit('sqlalchemy' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+def test_resolve_attribute_module():
+    import advent_of_code as aoc
+    assert aoc.resolve_attribute_module('get_input') == 'sdk'
+    assert aoc.resolve_attribute_module('grid') == 'grid'
+    assert aoc.resolve_attribute_module('no_such_name') is None
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import advent_of_code.instrumentation as instrumentation
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'ENABLED', True)
+
+def test_disabled_decorators_return_original_function(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'ENABLED', False)
+
+    def fn(x):
+        return x + 1
+
+    assert instrumentation.counted(fn) is fn
+    assert instrumentation.timed(name='fn')(fn) is fn
+    root = instrumentation.ROOT_REGISTRY
+    children, counters, timers = list(root.children), root.counters.copy(), dict(root.timers)
+    for _ in range(100):
+        with instrumentation.counter_scope('disabled') as registry:
+            instrumentation.increment('steps')
+            with instrumentation.timer('block'):
+                pass
+    assert registry is root
+    assert root.children == children
+    assert root.counters == counters and root.timers == timers
+
+def test_counters_and_timers(enabled):
+    @instrumentation.counted
+    @instrumentation.timed(name='step')
+    def step(n):
+        instrumentation.increment('work', n)
+        return n
+
+    with instrumentation.counter_scope('outer') as outer:
+        for n in range(5):
+            step(n)
+        with instrumentation.counter_scope('inner') as inner:
+            step(10)
+            with instrumentation.timer('block'):
+                pass
+
+    assert inner.counters == {'work': 10, 'test_counters_and_timers.<locals>.step': 1}
+    assert outer.counters['work'] == 20
+    assert outer.counters['test_counters_and_timers.<locals>.step'] == 6
+    assert outer.timers['step'].calls == 6
+    assert outer.timers['block'].calls == 1
+    assert outer.children == [inner]
+    assert outer.get_rate('work') > 0
+
+def test_dump_json(enabled, tmp_path):
+    with instrumentation.counter_scope('part one') as registry:
+        instrumentation.increment('nodes_expanded', 42)
+    filepath = instrumentation.dump_json(tmp_path / 'counts.json', registry)
+
+    with open(filepath) as f:
+        data = json.load(f)
+    assert data['name'] == 'part one'
+    assert data['counters']['nodes_expanded']['count'] == 42
+    assert data['counters']['nodes_expanded']['per_second'] > 0
+    assert data['scopes'] == []
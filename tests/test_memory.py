@@ -0,0 +1,64 @@
+import pytest
+
+from advent_of_code.memory import (get_current_rss_kb, make_allocation_table, make_memory_table, measure_memory,
+                                   MemoryResult, RSSSampler)
+from advent_of_code.runner import SolutionFile
+
+HUNGRY_SOLUTION = '''
+CACHE = {}
+
+INPUT = 20_000
+
+def part_one(data):
+    for i in range(data):
+        CACHE[i] = str(i) * 10
+    return len(CACHE)
+
+def part_two(data):
+    big = bytearray(64 * 1024 * 1024)
+    return len(big)
+'''
+
+@pytest.fixture
+def solution(tmp_path):
+    year_dir = tmp_path / '2016'
+    year_dir.mkdir()
+    path = year_dir / 'day14.py'
+    path.write_text(HUNGRY_SOLUTION)
+    return SolutionFile(2016, 14, path)
+
+def test_rss_sampler():
+    with RSSSampler(interval=0.001) as sampler:
+        block = bytearray(32 * 1024 * 1024)
+        block[::4096] = b'x' * len(block[::4096])   # touch every page so it counts toward RSS
+    assert sampler.peak_kb >= get_current_rss_kb() - 1024
+    assert sampler.peak_kb > 0
+
+def test_measure_memory(solution):
+    results = measure_memory([solution], max_workers=2, timeout=30)
+    assert [(r.part, r.status) for r in results] == [(1, 'ok'), (2, 'ok')]
+    part_one, part_two = results
+
+    assert part_one.answer == '20000'
+    assert part_one.traced_peak_kb > 1_000
+    # The module-level cache is still alive at the end, so its line is the top allocator
+    assert 'CACHE[i]' in part_one.top_lines[0].source
+    assert part_one.top_lines[0].location == 'day14.py:8'
+
+    assert part_two.traced_peak_kb >= 64 * 1024
+    assert part_two.rss_growth_kb >= 0
+    assert make_allocation_table(part_one).row_count == len(part_one.top_lines)
+
+def test_measure_memory_worker_killed(tmp_path, solution):
+    path = tmp_path / '2016' / 'day15.py'
+    path.write_text("import os\n\nINPUT = 3\n\ndef part_one(data):\n    os._exit(1)\n\n"
+                    "def part_two(data):\n    return data * 2\n")
+    results = measure_memory([solution, SolutionFile(2016, 15, path)], max_workers=2, timeout=30)
+    assert [(r.day, r.part, r.status) for r in results] == [(14, 1, 'ok'), (14, 2, 'ok'),
+                                                            (15, 1, 'error'), (15, 2, 'ok')]
+    assert all(isinstance(r, MemoryResult) for r in results)
+    killed = results[2]
+    assert 'BrokenProcessPool' in killed.error
+    assert results[3].answer == '6'
+    assert results[0].answer == '20000'
+    assert make_memory_table(results).row_count == 4
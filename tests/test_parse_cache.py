@@ -0,0 +1,65 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import advent_of_code.parse_cache as parse_cache
+
+CALLS = []
+SCALE = 2
+
+def helper(line: str) -> list[int]:
+    return [int(x) * SCALE for x in line.split(',')]
+
+def parse(data: str) -> dict:
+    CALLS.append(data)
+    return {'rows': [helper(line) for line in data.splitlines()],
+            'grid': np.arange(12, dtype=np.int64).reshape(3, 4)}
+
+@pytest.fixture
+def cached(tmp_path):
+    CALLS.clear()
+    return parse_cache.cached_parse(cache_dir=tmp_path)(parse)
+
+def test_round_trip_with_out_of_band_buffers(tmp_path):
+    obj = {'array': np.arange(1000, dtype=np.uint8), 'text': 'abc', 'nested': [np.ones((2, 2))]}
+    filepath = tmp_path / 'obj'
+    parse_cache.dump_parsed(obj, filepath)
+    loaded = parse_cache.load_parsed(filepath)
+
+    assert np.array_equal(loaded['array'], obj['array'])
+    assert np.array_equal(loaded['nested'][0], obj['nested'][0])
+    assert loaded['text'] == 'abc'
+    loaded['array'][0] = 99   # rebuilt arrays are writable
+    # The array's bytes are stored raw, not inside the pickle stream
+    assert filepath.stat().st_size > len(pickle.dumps(obj, protocol=5, buffer_callback=lambda b: None)) + 1000
+
+def test_cached_parse_hits_and_returns_copies(cached):
+    first = cached('1,2\n3,4')
+    second = cached('1,2\n3,4')
+    assert len(CALLS) == 1
+    assert second['rows'] == first['rows'] == [[2, 4], [6, 8]]
+    assert np.array_equal(second['grid'], first['grid'])
+    assert second is not first
+
+    cached('5,6')
+    assert len(CALLS) == 2
+
+def test_cache_can_be_bypassed(cached, monkeypatch):
+    monkeypatch.setenv(parse_cache.PARSE_CACHE_ENV_VAR, '0')
+    cached('1,2')
+    cached('1,2')
+    assert len(CALLS) == 2
+
+def test_source_hash_includes_helpers_and_constants():
+    source = parse_cache.get_referenced_source(parse)
+    assert 'def helper' in source
+    assert 'SCALE = 2' in source
+    assert 'def test_' not in source
+
+def test_corrupt_file_is_recomputed(cached, tmp_path):
+    cached('7,8')
+    for filepath in tmp_path.glob('*/*'):
+        filepath.write_bytes(b'garbage')
+    assert cached('7,8')['rows'] == [[14, 16]]
+    assert len(CALLS) == 2
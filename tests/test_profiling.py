@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from advent_of_code.exceptions import SolutionNotFound
+from advent_of_code.profiling import SamplingProfiler, profile_solution
+from advent_of_code.runner import SolutionFile
+
+BUSY_SOLUTION = '''
+INPUT = 200_000
+
+def inner_loop(n):
+    return sum(i * i for i in range(n))
+
+def part_one(data):
+    total = 0
+    for _ in range(10):
+        total += inner_loop(data)
+    return total
+'''
+
+def busy_work():
+    return sum(i * i for i in range(2_000_000))
+
+def test_sampling_profiler_collects_stacks():
+    result = SamplingProfiler(interval=0.001).profile('busy', busy_work)
+
+    assert result.return_value == busy_work()
+    assert result.total_samples > 0
+    self_counts, total_counts = result.get_function_counts()
+    assert any(key.name == 'busy_work' for key in total_counts)
+    # Only frames below the profiler's own call are recorded
+    assert all(stack[0].name == 'busy_work' for stack in result.samples if stack)
+
+def test_profile_outputs(tmp_path):
+    result = SamplingProfiler(interval=0.001).profile('busy run', busy_work)
+    speedscope_path, collapsed_path = result.write_files(tmp_path)
+
+    assert speedscope_path.name == 'busy_run.speedscope.json'
+    with open(speedscope_path) as f:
+        data = json.load(f)
+    frames = data['shared']['frames']
+    profile = data['profiles'][0]
+    assert profile['type'] == 'sampled'
+    assert len(profile['samples']) == len(profile['weights'])
+    assert all(0 <= i < len(frames) for sample in profile['samples'] for i in sample)
+
+    lines = collapsed_path.read_text().splitlines()
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in lines) == result.total_samples
+    assert all(line.startswith('busy_work') for line in lines)
+
+def test_profile_solution(tmp_path):
+    path = tmp_path / 'day01.py'
+    path.write_text(BUSY_SOLUTION)
+    solution = SolutionFile(2015, 1, path)
+
+    result = profile_solution(solution, 1)
+    assert result.return_value == 10 * sum(i * i for i in range(200_000))
+    assert result.name == '2015_day01_part1'
+    assert any(key.name == 'inner_loop' for key in result.get_function_counts()[1])
+
+    with pytest.raises(SolutionNotFound):
+        profile_solution(solution, 2)
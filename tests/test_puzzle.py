@@ -0,0 +1,50 @@
+import pytest
+import sqlalchemy as db
+
+import advent_of_code.models.puzzle as puzzle_module
+from advent_of_code.models import Puzzle
+from advent_of_code.sql_schema import metadata_obj, puzzles_table
+
+RAW_HTML = '<html>' + 'x' * 10_000 + '</html>'
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = db.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    metadata_obj.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(db.insert(puzzles_table).values(year=2015, day=1, title='--- Day 1: Test ---',
+                                                     part_1_description='Part one.', example_text='(())', 
+                                                     input_text='()()', raw_html=RAW_HTML))
+        conn.commit()
+    monkeypatch.setattr(puzzle_module, 'SQL_ENGINE', engine)
+    return engine
+
+def test_from_database_defers_heavy_columns(engine):
+    puzzle = Puzzle.from_database(2015, 1)
+    assert puzzle.title == '--- Day 1: Test ---'
+    assert set(puzzle.deferred_columns) == set(puzzle_module.DEFERRED_COLUMNS)
+
+def test_deferred_column_loads_on_access(engine):
+    puzzle = Puzzle.from_database(2015, 1)
+    assert puzzle.raw_html == RAW_HTML
+    assert 'raw_html' not in puzzle.deferred_columns
+    assert 'input_text' in puzzle.deferred_columns
+
+def test_from_database_not_deferred(engine):
+    puzzle = Puzzle.from_database(2015, 1, deferred=False)
+    assert not puzzle.deferred_columns
+    assert puzzle.input_text == '()()'
+
+def test_update_info_on_db_keeps_unloaded_columns(engine):
+    puzzle = Puzzle.from_database(2015, 1)
+    puzzle.title = 'New Title'
+    puzzle.update_info_on_db()
+
+    reloaded = Puzzle.from_database(2015, 1, deferred=False)
+    assert reloaded.title == 'New Title'
+    assert reloaded.raw_html == RAW_HTML
+
+def test_unknown_attribute_still_raises(engine):
+    puzzle = Puzzle.from_database(2015, 1)
+    with pytest.raises(AttributeError):
+        puzzle.not_a_column
@@ -0,0 +1,55 @@
+import io
+import mmap
+
+import pytest
+
+from advent_of_code.readers import iter_blocks, iter_chunks, iter_ints, iter_lines
+
+TEXT = "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n\n-7 x=8, y=-9\n"
+
+@pytest.fixture(params=['str', 'path', 'text_file', 'binary_file', 'bytes', 'mmap'])
+def source(request, tmp_path):
+    filepath = tmp_path / 'input.txt'
+    filepath.write_text(TEXT)
+    match request.param:
+        case 'str':
+            yield TEXT
+        case 'path':
+            yield filepath
+        case 'text_file':
+            with open(filepath) as f:
+                yield f
+        case 'binary_file':
+            with open(filepath, 'rb') as f:
+                yield f
+        case 'bytes':
+            yield TEXT.encode()
+        case 'mmap':
+            with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1024])
+def test_iter_lines_matches_splitlines(source, chunk_size):
+    assert list(iter_lines(source, chunk_size)) == TEXT.splitlines()
+
+def test_iter_blocks(source):
+    assert list(iter_blocks(source, chunk_size=4)) == [['1000', '2000', '3000'], ['4000'],
+                                                       ['5000', '6000'], ['-7 x=8, y=-9']]
+
+def test_iter_ints(source):
+    assert list(iter_ints(source, chunk_size=5)) == [1000, 2000, 3000, 4000, 5000, 6000, -7, 8, -9]
+
+def test_iter_ints_per_line():
+    assert list(iter_ints("1,2\n\n-3 4", per_line=True)) == [(1, 2), (), (-3, 4)]
+
+def test_multibyte_characters_split_across_chunks():
+    text = "é€\n🎄🎄\n"
+    assert list(iter_lines(io.BytesIO(text.encode()), chunk_size=1)) == ['é€', '🎄🎄']
+    assert ''.join(iter_chunks(text.encode(), chunk_size=3)) == text
+
+def test_windows_line_endings():
+    assert list(iter_lines("a\r\nb\r\n")) == ['a', 'b']
+
+def test_lazy():
+    lines = iter_lines(io.StringIO("first\n" + "x" * 10_000), chunk_size=8)
+    assert next(lines) == 'first'
@@ -0,0 +1,72 @@
+import pytest
+import sqlalchemy as db
+
+import advent_of_code.result_cache as result_cache
+from advent_of_code.runner import SolutionFile
+
+HELPER = '''
+def double(x):
+    return 2 * x
+'''
+
+SOLUTION = '''
+import advent_of_code as aoc
+from helper import double
+
+INPUT = "21"
+
+def part_one(data: str):
+    return double(int(data))
+'''
+
+@pytest.fixture
+def solution(tmp_path):
+    year_dir = tmp_path / '2019'
+    year_dir.mkdir()
+    (year_dir / 'helper.py').write_text(HELPER)
+    (year_dir / 'unrelated.py').write_text(HELPER)
+    path = year_dir / 'day09.py'
+    path.write_text(SOLUTION)
+    return SolutionFile(2019, 9, path)
+
+@pytest.fixture
+def cache_db(tmp_path, monkeypatch):
+    engine = db.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(result_cache, 'SQL_ENGINE', engine)
+    monkeypatch.setattr(result_cache, 'get_input_hash', lambda year, day: 'input-hash')
+    return engine
+
+def test_dependency_paths(solution):
+    names = {path.name for path in result_cache.get_dependency_paths(solution.path)}
+    assert {'day09.py', 'helper.py', '__init__.py'} <= names
+    assert 'unrelated.py' not in names
+
+def test_aoc_attributes_resolve_to_package_modules(tmp_path):
+    path = tmp_path / 'day01.py'
+    path.write_text('import advent_of_code as aoc\nINPUT = aoc.get_input(2015, 1)\n')
+    paths = result_cache.get_dependency_paths(path)
+    assert result_cache.PACKAGE_DIR / 'sdk.py' in paths
+    assert result_cache.PACKAGE_DIR / 'cli.py' not in paths
+
+def test_source_hash_tracks_local_imports(solution):
+    original = result_cache.get_source_hash(solution.path)
+    (solution.path.parent / 'unrelated.py').write_text(HELPER + '\n# edited\n')
+    assert result_cache.get_source_hash(solution.path) == original
+
+    (solution.path.parent / 'helper.py').write_text(HELPER + '\n# edited\n')
+    assert result_cache.get_source_hash(solution.path) != original
+
+def test_run_solutions_cached(solution, cache_db):
+    first = result_cache.run_solutions_cached([solution], parts=[1, 2], max_workers=1, timeout=30)
+    assert [(r.part, r.status, r.answer) for r in first] == [(1, 'ok', '42'), (2, 'missing', '')]
+
+    second = result_cache.run_solutions_cached([solution], parts=[1, 2], max_workers=1, timeout=30)
+    assert [(r.part, r.status, r.answer) for r in second] == [(1, 'cached', '42'), (2, 'missing', '')]
+
+    forced = result_cache.run_solutions_cached([solution], parts=[1], max_workers=1, timeout=30, force=True)
+    assert forced[0].status == 'ok'
+
+    # Changing a shared helper invalidates the cached answer
+    (solution.path.parent / 'helper.py').write_text(HELPER.replace('2 * x', '3 * x'))
+    third = result_cache.run_solutions_cached([solution], parts=[1], max_workers=1, timeout=30)
+    assert (third[0].status, third[0].answer) == ('ok', '63')
@@ -0,0 +1,73 @@
+import itertools
+import random
+
+import pytest
+
+from advent_of_code import routes
+from advent_of_code.grid import Grid
+
+CITIES = {('London', 'Dublin'): 464, ('London', 'Belfast'): 518, ('Dublin', 'Belfast'): 141}
+
+def city_distance(a: str, b: str) -> int:
+    return CITIES.get((a, b)) or CITIES[(b, a)]
+
+def brute_force(distances, start=None, closed=False, maximize=False) -> int:
+    n = len(distances)
+    lengths = []
+    for order in itertools.permutations(range(n)):
+        if start is not None and order[0] != start:
+            continue
+        stops = list(order) + ([order[0]] if closed else [])
+        lengths.append(sum(distances[a][b] for a, b in zip(stops, stops[1:])))
+    return max(lengths) if maximize else min(lengths)
+
+def test_open_path_min_and_max():
+    distances = routes.make_distance_matrix(['London', 'Dublin', 'Belfast'], city_distance)
+    shortest = routes.held_karp(distances)
+    assert shortest.length == 605
+    assert sorted(shortest.order) == [0, 1, 2]
+    assert routes.held_karp(distances, maximize=True).length == 982
+
+@pytest.mark.parametrize('closed', [False, True])
+@pytest.mark.parametrize('maximize', [False, True])
+def test_matches_brute_force_on_asymmetric_matrix(closed, maximize):
+    rng = random.Random(7)
+    distances = [[0 if i == j else rng.randint(-20, 50) for j in range(7)] for i in range(7)]
+    start = 0 if closed else None
+    route = routes.held_karp(distances, start=start, closed=closed, maximize=maximize)
+    assert route.length == brute_force(distances, start, closed, maximize)
+
+    stops = route.order
+    assert sum(distances[a][b] for a, b in zip(stops, stops[1:])) == route.length
+    if closed:
+        assert stops[0] == stops[-1] == 0 and sorted(stops[:-1]) == list(range(7))
+
+def test_fixed_start_and_unreachable_pairs():
+    inf = routes.INF
+    distances = [[0, 1, inf], [inf, 0, 1], [1, inf, 0]]
+    assert routes.held_karp(distances, start=0) == routes.Route(2, [0, 1, 2])
+    assert routes.held_karp(distances, start=0, closed=True).length == 3
+    assert routes.held_karp(distances, maximize=True).length == 2
+    with pytest.raises(ValueError):
+        routes.held_karp([[0, inf], [inf, 0]])
+
+def test_trivial_routes():
+    assert routes.held_karp([]) == routes.Route(0, [])
+    assert routes.held_karp([[0]]) == routes.Route(0, [0])
+
+def test_graph_and_grid_distances_agree():
+    text = '''\
+###########
+#0.1.....2#
+#.#######.#
+#4.......3#
+###########'''
+    grid = Grid.from_text(text, pad_value=ord('#'))
+    indices = [grid.indices_of(ord(c))[0] for c in '01234']
+    grid_distances = routes.get_grid_distances(grid, indices, blocked={ord('#')})
+    assert grid_distances[0] == [0, 2, 8, 10, 2]
+
+    def neighbors(index):
+        return [n for n in grid.neighbors(index) if grid[n] != ord('#')]
+    assert routes.get_graph_distances(indices, neighbors) == grid_distances
+    assert routes.held_karp(grid_distances, start=0).length == 14
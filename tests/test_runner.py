@@ -0,0 +1,77 @@
+import pytest
+
+import advent_of_code.runner as runner
+
+GOOD_SOLUTION = '''
+INPUT = "1\\n2\\n3"
+
+def part_one(data: str):
+    return sum(int(x) for x in data.splitlines())
+
+def part_two():
+    return "no args"
+'''
+
+BROKEN_SOLUTION = '''
+INPUT = ""
+
+def part_one(data: str):
+    raise ValueError("broken")
+'''
+
+SLOW_SOLUTION = '''
+import time
+
+INPUT = ""
+
+def part_one(data: str):
+    time.sleep(10)
+'''
+
+@pytest.fixture
+def solutions_dir(tmp_path):
+    year_dir = tmp_path / '2015'
+    year_dir.mkdir()
+    (year_dir / 'day01.py').write_text(GOOD_SOLUTION)
+    (year_dir / 'day02.py').write_text(BROKEN_SOLUTION)
+    (year_dir / 'day03.py').write_text(SLOW_SOLUTION)
+    (year_dir / 'day3_code_old.py').write_text(GOOD_SOLUTION)
+    (tmp_path / 'notes').mkdir()
+    return tmp_path
+
+def test_find_solution_files(solutions_dir):
+    files = runner.find_solution_files(solutions_dir=solutions_dir)
+    assert [(f.year, f.day) for f in files] == [(2015, 1), (2015, 2), (2015, 3)]
+
+def test_find_solution_files_by_day(solutions_dir):
+    files = runner.find_solution_files(2015, 2, solutions_dir=solutions_dir)
+    assert [f.day for f in files] == [2]
+
+def test_run_part_ok(solutions_dir):
+    solution = runner.get_solution_file(2015, 1, solutions_dir)
+    result = runner.run_part(solution, 1)
+    assert result.ok and result.answer == '6'
+    assert result.peak_rss_kb > 0
+
+def test_run_part_without_arguments(solutions_dir):
+    solution = runner.get_solution_file(2015, 1, solutions_dir)
+    result = runner.run_part(solution, 2)
+    assert result.ok and result.answer == 'no args'
+
+def test_run_part_missing(solutions_dir):
+    solution = runner.get_solution_file(2015, 2, solutions_dir)
+    result = runner.run_part(solution, 2)
+    assert result.status == 'missing'
+
+def test_run_part_timeout(solutions_dir):
+    solution = runner.get_solution_file(2015, 3, solutions_dir)
+    result = runner.run_part(solution, 1, timeout=0.2)
+    assert result.status == 'timeout'
+
+def test_run_solutions_in_pool(solutions_dir):
+    solutions = runner.find_solution_files(solutions_dir=solutions_dir)
+    results = runner.run_solutions(solutions, max_workers=4, timeout=1)
+    statuses = {(r.day, r.part): r.status for r in results}
+    assert statuses == {(1, 1): 'ok', (1, 2): 'ok',
+                        (2, 1): 'error', (2, 2): 'missing',
+                        (3, 1): 'timeout', (3, 2): 'missing'}
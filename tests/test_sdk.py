@@ -0,0 +1,118 @@
+import pytest
+import sqlalchemy as db
+
+import advent_of_code.sdk as sdk
+from advent_of_code.sql_schema import metadata_obj, puzzles_table
+
+@pytest.fixture
+def query_log(tmp_path, monkeypatch):
+    db_path = tmp_path / 'test.db'
+    engine = db.create_engine(f"sqlite:///{db_path}")
+    metadata_obj.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(db.insert(puzzles_table).values(year=2015, day=1, title='--- Day 1: Test ---',
+                                                     part_1_description='Part one.', part_2_description='',
+                                                     example_text='(())', input_text='()()', raw_html='<html/>'))
+        conn.commit()
+    engine.dispose()
+
+    queries = []
+    select_puzzle_columns = sdk.select_puzzle_columns
+    def logged_select(year, day, columns):
+        queries.append(columns)
+        return select_puzzle_columns(year, day, columns)
+
+    monkeypatch.setattr(sdk, 'SQLITE_PATH', db_path)
+    monkeypatch.setattr(sdk, 'select_puzzle_columns', logged_select)
+    sdk.clear_puzzle_cache()
+    yield queries
+    sdk.clear_puzzle_cache()
+
+def test_get_input_hits_database_once(query_log):
+    assert sdk.get_input(2015, 1) == '()()'
+    assert sdk.get_input(2015, 1) == '()()'
+    assert query_log == [('input_text',)]
+
+def test_get_description(query_log):
+    assert sdk.get_description(2015, 1) == '--- Day 1: Test ---\nPart one.'
+
+def test_clear_puzzle_cache(query_log):
+    sdk.get_example(2015, 1)
+    sdk.clear_puzzle_cache()
+    sdk.get_example(2015, 1)
+    assert len(query_log) == 2
+
+def test_invalid_column_name(query_log):
+    with pytest.raises(ValueError):
+        sdk.get_puzzle_columns(2015, 1, ('input_text; DROP TABLE puzzles',))
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sdk, 'DATA_DIR', tmp_path / 'data')
+    return tmp_path / 'data'
+
+def test_input_file_written_from_database(query_log, data_dir):
+    filepath = sdk.get_input_path(2015, 1)
+    assert filepath == data_dir / '2015' / '1' / 'input.txt'
+    assert filepath.read_text() == '()()'
+
+    sdk.get_input_path(2015, 1)
+    assert query_log == [('input_text',)]
+
+def test_open_input(query_log, data_dir):
+    import re
+
+    with sdk.open_input(2015, 1) as mm:
+        assert mm[:] == b'()()'
+        assert re.findall(rb'\(\)', mm) == [b'()', b'()']
+        assert mm.readline() == b'()()'
+
+def test_get_input_bytes(query_log, data_dir):
+    np = pytest.importorskip('numpy')
+
+    view = sdk.get_input_bytes(2015, 1)
+    assert view.readonly
+    assert sdk.get_input_bytes(2015, 1) is view
+    assert np.frombuffer(view, dtype=np.uint8).tolist() == list(b'()()')
+
+def test_clear_puzzle_cache_closes_input_maps(query_log, data_dir):
+    view = sdk.get_input_bytes(2015, 1)
+    source, _ = sdk.INPUT_MAPS[(2015, 1)]
+    sdk.clear_puzzle_cache()
+    assert source.closed
+    assert not sdk.INPUT_MAPS
+    with pytest.raises(ValueError):
+        view.tobytes()
+
+def test_empty_input_file(query_log, data_dir):
+    filepath = data_dir / '2015' / '2' / 'input.txt'
+    filepath.parent.mkdir(parents=True)
+    filepath.write_bytes(b'')
+
+    with sdk.open_input(2015, 2) as mm:
+        assert mm[:] == b''
+    view = sdk.get_input_bytes(2015, 2)
+    assert view.readonly and view.tobytes() == b''
+    assert query_log == []
+
+def test_select_missing_row_returns_none(query_log):
+    assert sdk.select_puzzle_columns(2015, 2, ('input_text',)) is None
+
+def test_select_schema_error_is_raised(tmp_path, monkeypatch):
+    db_path = tmp_path / 'empty.db'
+    engine = db.create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        conn.execute(db.text("CREATE TABLE unrelated (x INTEGER)"))
+        conn.commit()
+    engine.dispose()
+    monkeypatch.setattr(sdk, 'SQLITE_PATH', db_path)
+    with pytest.raises(db.exc.OperationalError):
+        sdk.select_puzzle_columns(2015, 1, ('input_text',))
+
+def test_empty_input_is_not_written(query_log, data_dir, monkeypatch):
+    from advent_of_code.exceptions import PuzzleInputNotFound
+
+    monkeypatch.setattr(sdk, 'get_input', lambda year, day: '')
+    with pytest.raises(PuzzleInputNotFound):
+        sdk.get_input_path(2015, 3)
+    assert not (data_dir / '2015' / '3' / 'input.txt').exists()
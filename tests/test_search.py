@@ -0,0 +1,112 @@
+import pytest
+
+from advent_of_code import search
+from advent_of_code.grid import Grid
+
+MAZE = '''\
+#########
+#S..#...#
+#.#.#.#.#
+#.#...#E#
+#########'''
+
+def maze_neighbors(text: str):
+    lines = text.splitlines()
+    def neighbors(node):
+        row, col = node
+        for dr, dc in ((-1, 0), (0, 1), (1, 0), (0, -1)):
+            if lines[row + dr][col + dc] != '#':
+                yield (row + dr, col + dc)
+    return neighbors
+
+def test_bfs_path_and_distance():
+    result = search.bfs((1, 1), maze_neighbors(MAZE), goal=(3, 7))
+    assert result.found
+    assert result.distance == 12
+    assert result.path[0] == (1, 1) and result.path[-1] == (3, 7)
+    assert len(result.path) == 13
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(result.path, result.path[1:]))
+
+def test_bfs_unreachable_goal_returns_distance_map():
+    result = search.bfs((1, 1), maze_neighbors(MAZE), goal=(0, 0))
+    assert not result.found
+    assert result.distance is None and result.path == []
+    assert result.distances[(3, 7)] == 12
+    assert len(result.distances) == 15
+
+def test_bfs_max_distance_and_predicate():
+    result = search.bfs((1, 1), maze_neighbors(MAZE), max_distance=2)
+    assert max(result.distances.values()) == 2
+    result = search.bfs((1, 1), maze_neighbors(MAZE), is_goal=lambda node: node[1] == 3)
+    assert result.target == (1, 3)
+
+def test_multi_source_bfs():
+    result = search.multi_source_bfs([(1, 1), (3, 7)], maze_neighbors(MAZE))
+    assert result.distances[(1, 1)] == result.distances[(3, 7)] == 0
+    assert max(result.distances.values()) == 6
+    assert result.path_to((3, 7)) == [(3, 7)]
+
+def weighted(graph: dict):
+    return lambda node: graph.get(node, [])
+
+GRAPH = {'a': [('b', 7), ('c', 9), ('f', 14)],
+         'b': [('a', 7), ('c', 10), ('d', 15)],
+         'c': [('a', 9), ('b', 10), ('d', 11), ('f', 2)],
+         'd': [('b', 15), ('c', 11), ('e', 6)],
+         'e': [('d', 6), ('f', 9)],
+         'f': [('a', 14), ('c', 2), ('e', 9)]}
+
+def test_dijkstra():
+    result = search.dijkstra('a', weighted(GRAPH), goal='e')
+    assert result.distance == 20
+    assert result.path == ['a', 'c', 'f', 'e']
+    assert search.dijkstra('a', weighted(GRAPH)).distances == {'a': 0, 'b': 7, 'c': 9, 'd': 20, 'e': 20, 'f': 11}
+
+def test_astar_matches_dijkstra_on_grid():
+    lines = MAZE.splitlines()
+    def neighbors(node):
+        return ((n, 1) for n in maze_neighbors(MAZE)(node))
+    def heuristic(node):
+        return abs(node[0] - 3) + abs(node[1] - 7)
+    result = search.astar((1, 1), neighbors, goal=(3, 7), heuristic=heuristic)
+    assert result.distance == 12
+    assert all(lines[r][c] != '#' for r, c in result.path)
+
+def test_bfs_01():
+    # Moving right is free, anything else costs 1
+    def neighbors(node):
+        row, col = node
+        if col < 5:
+            yield (row, col + 1), 0
+        if row < 5:
+            yield (row + 1, col), 1
+    result = search.bfs_01((0, 0), neighbors, goal=(5, 5))
+    assert result.distance == 5
+    assert result.distances[(0, 5)] == 0
+
+def test_early_stop_keeps_only_final_distances():
+    full = search.dijkstra('a', weighted(GRAPH)).distances
+    stopped = search.dijkstra('a', weighted(GRAPH), goal='f')
+    assert stopped.distances == {n: d for n, d in full.items() if n in stopped.distances}
+    assert set(stopped.distances) == {'a', 'b', 'c', 'f'}
+
+    graph_01 = {'a': [('b', 1), ('c', 0)], 'c': [('d', 1)], 'b': [('d', 0)], 'd': [('e', 1)]}
+    full_01 = search.bfs_01('a', weighted(graph_01)).distances
+    stopped_01 = search.bfs_01('a', weighted(graph_01), goal='c')
+    assert stopped_01.distances == {'a': 0, 'c': 0}
+    assert all(full_01[n] == d for n, d in stopped_01.distances.items())
+
+def test_bfs_grid_matches_bfs():
+    grid = Grid.from_text(MAZE, codes={'#': 1, '.': 0, 'S': 0, 'E': 0}, pad_value=1)
+    result = search.bfs_grid(grid, grid.start, blocked={1}, goal=grid.target)
+    assert result.distance == 12
+    path = [grid.coordinate(i) for i in result.path_to(grid.target)]
+    assert len(path) == 13 and path[0] == (1, 1) and path[-1] == (3, 7)
+
+    full = search.bfs_grid(grid, grid.start, blocked={1})
+    assert not full.found
+    assert sum(d >= 0 for d in full.distances) == 15
+
+def test_bfs_grid_requires_padding():
+    with pytest.raises(ValueError):
+        search.bfs_grid(Grid.from_text(MAZE), 0, blocked={ord('#')})
@@ -0,0 +1,148 @@
+import datetime as dt
+import email.utils
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import advent_of_code.server as server
+
+class StubAOCHandler(BaseHTTPRequestHandler):
+    ''' Serves "/<year>/day/<day>" pages with an ETag, honouring If-None-Match. '''
+    requests_seen: list[tuple[str, dict]] = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.requests_seen.append((self.path, dict(self.headers)))
+        etag = f'"{self.path}-v1"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = f"<html><h2>{self.path}</h2></html>".encode()
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    StubAOCHandler.requests_seen = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubAOCHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def fast_bucket():
+    return server.TokenBucket(rate=1000, capacity=10)
+
+def download(base_url, tmp_path, bucket, refresh_after=dt.timedelta(0)) -> server.DownloadSummary:
+    targets = server.make_html_targets([2015, 2016], range(1, 4), base_url=base_url, data_dir=tmp_path)
+    manifest = server.DownloadManifest.load(tmp_path / 'manifest.json')
+    return server.download_files(targets, session=server.make_session(), bucket=bucket,
+                                 manifest=manifest, refresh_after=refresh_after)
+
+def test_download_files(stub_server, tmp_path, fast_bucket):
+    summary = download(stub_server, tmp_path, fast_bucket)
+    assert len(summary.downloaded) == 6
+    assert (tmp_path / '2016' / '3' / 'aoc_2016_day_3.html').read_text() == '<html><h2>/2016/day/3</h2></html>'
+
+def test_conditional_requests(stub_server, tmp_path, fast_bucket):
+    download(stub_server, tmp_path, fast_bucket)
+    summary = download(stub_server, tmp_path, fast_bucket)
+    assert len(summary.not_modified) == 6 and not summary.downloaded
+    assert all('If-None-Match' in headers for _, headers in StubAOCHandler.requests_seen[6:])
+
+def test_resume_skips_recent_downloads(stub_server, tmp_path, fast_bucket):
+    download(stub_server, tmp_path, fast_bucket)
+    (tmp_path / '2015' / '2' / 'aoc_2015_day_2.html').unlink()   # as if interrupted
+    summary = download(stub_server, tmp_path, fast_bucket, refresh_after=dt.timedelta(hours=1))
+    assert len(summary.skipped) == 5
+    assert [(t.year, t.day) for t in summary.downloaded] == [(2015, 2)]
+    assert len(StubAOCHandler.requests_seen) == 7
+
+def test_token_bucket_limits_rate(stub_server, tmp_path):
+    bucket = server.TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    download(stub_server, tmp_path, bucket)
+    assert time.monotonic() - start >= 5 / 20
+
+def test_get_retry_delay():
+    soon = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=30)
+    assert 25 <= server.get_retry_delay(email.utils.format_datetime(soon, usegmt=True), 1) <= 30
+    assert server.get_retry_delay('Wed, 21 Oct 2015 07:28:00 GMT', 1) == 0   # already past
+    assert server.get_retry_delay('7', 1) == 7
+    assert server.get_retry_delay(None, 3) == 8
+    assert server.get_retry_delay('not a date', 2) == 4
+    assert server.get_retry_delay('99999', 1) == server.MAX_RETRY_AFTER
+    assert server.get_retry_delay('-5', 1) == 0
+
+class RetryDateHandler(BaseHTTPRequestHandler):
+    ''' Answers the first request with a 503 whose Retry-After is an HTTP date. '''
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        if self.calls == 1:
+            self.send_response(503)
+            self.send_header('Retry-After', email.utils.formatdate(time.time() - 60, usegmt=True))
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+def test_fetch_retries_after_http_date(fast_bucket):
+    RetryDateHandler.calls = 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), RetryDateHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{httpd.server_address[1]}/2015/day/1"
+        resp = server.fetch_with_retries(server.make_session(), fast_bucket, url, {})
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert resp.status_code == 200 and resp.text == 'ok'
+    assert RetryDateHandler.calls == 2
+
+@pytest.fixture
+def cached_server(stub_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server, 'AOC_BASE_URL', stub_server)
+    monkeypatch.setattr(server, 'RESPONSE_CACHE', server.ResponseCache(tmp_path, session='test'))
+    monkeypatch.setattr(server, '_SESSION', server.make_session())
+    return server
+
+def test_input_is_cached(cached_server):
+    first = cached_server.get_input_from_server(2015, 1)
+    second = cached_server.get_input_from_server(2015, 1)
+    assert first == second
+    assert len(StubAOCHandler.requests_seen) == 1
+
+def test_unsolved_page_expires(cached_server, monkeypatch):
+    cached_server.get_raw_html_from_server(2015, 1)
+    cached_server.get_raw_html_from_server(2015, 1)
+    assert len(StubAOCHandler.requests_seen) == 1
+
+    monkeypatch.setattr(server, 'UNSOLVED_PAGE_TTL', dt.timedelta(0))
+    cached_server.get_raw_html_from_server(2015, 1)
+    assert len(StubAOCHandler.requests_seen) == 2
+
+def test_invalidate_puzzle_page(cached_server):
+    cached_server.get_raw_html_from_server(2015, 1)
+    cached_server.invalidate_puzzle_page(2015, 1)
+    cached_server.get_raw_html_from_server(2015, 1)
+    assert len(StubAOCHandler.requests_seen) == 2
@@ -0,0 +1,58 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import sqlalchemy as db
+
+from advent_of_code.sql_engine import get_engine
+from advent_of_code.sql_schema import metadata_obj, puzzles_table
+
+NUM_READERS = 8
+NUM_READS = 200
+
+@pytest.fixture
+def db_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'stress.db'}"
+    engine = get_engine(url)
+    metadata_obj.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(db.insert(puzzles_table),
+                     [{'year': year, 'day': day, 'title': f"{year} day {day}", 'input_text': 'x' * 5000}
+                      for year in range(2015, 2026) for day in range(1, 26)])
+        conn.commit()
+    return url
+
+def read_puzzles(url: str) -> int:
+    engine = get_engine(url)
+    rows_read = 0
+    for i in range(NUM_READS):
+        with engine.connect() as conn:
+            stmt = (db.select(puzzles_table.c.input_text)
+                      .where(puzzles_table.c.year == 2015 + i % 11)
+                      .where(puzzles_table.c.day == 1 + i % 25))
+            rows_read += len(conn.execute(stmt).fetchall())
+    return rows_read
+
+def write_titles(url: str) -> int:
+    engine = get_engine(url)
+    for i in range(NUM_READS):
+        with engine.connect() as conn:
+            conn.execute(db.update(puzzles_table)
+                           .where(puzzles_table.c.id == 1 + i % 275)
+                           .values(title=f"updated {i}"))
+            conn.commit()
+    return NUM_READS
+
+def test_sqlite_pragmas(db_url):
+    with get_engine(db_url).connect() as conn:
+        assert conn.exec_driver_sql('PRAGMA journal_mode').scalar() == 'wal'
+        assert conn.exec_driver_sql('PRAGMA synchronous').scalar() == 1   # NORMAL
+
+def test_get_engine_is_shared(db_url):
+    assert get_engine(db_url) is get_engine(db_url)
+
+def test_concurrent_readers_with_writer(db_url):
+    with ProcessPoolExecutor(max_workers=NUM_READERS + 1) as executor:
+        writer = executor.submit(write_titles, db_url)
+        readers = [executor.submit(read_puzzles, db_url) for _ in range(NUM_READERS)]
+        assert [r.result(timeout=60) for r in readers] == [NUM_READS] * NUM_READERS
+        assert writer.result(timeout=60) == NUM_READS
@@ -0,0 +1,46 @@
+import pytest
+import sqlalchemy as db
+
+import advent_of_code.sql_functions as sql
+from advent_of_code.constants import ROOT_DIR
+from advent_of_code.sql_schema import answers_table, metadata_obj, puzzles_table
+
+TEST_HTML_DIR = ROOT_DIR / 'tests' / 'mock_html'
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = db.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    metadata_obj.create_all(engine)
+    monkeypatch.setattr(sql, 'SQL_ENGINE', engine)
+    return engine
+
+def make_row(year: int, day: int, html_file: str = 'neither_part_solved.html') -> dict:
+    return dict(year=year, day=day, title=f"Day {day}", input_text='input',
+                raw_html=(TEST_HTML_DIR / html_file).read_text())
+
+def count_rows(engine, table) -> int:
+    with engine.connect() as conn:
+        return conn.execute(db.select(db.func.count()).select_from(table)).scalar()
+
+def test_upsert_puzzle_rows(engine):
+    sql.upsert_puzzle_rows([make_row(2015, day) for day in range(1, 26)])
+    sql.upsert_puzzle_rows([make_row(2015, 1) | {'title': 'Updated'}])
+
+    assert count_rows(engine, puzzles_table) == 25
+    with engine.connect() as conn:
+        title = conn.execute(db.select(puzzles_table.c.title).where(puzzles_table.c.day == 1)).scalar()
+    assert title == 'Updated'
+
+def test_find_answers_in_html_text_on_db(engine):
+    sql.upsert_puzzle_rows([make_row(2015, 1, 'both_parts_solved.html'),
+                            make_row(2015, 2, 'part_1_solved.html'),
+                            make_row(2015, 3)])
+    sql.find_answers_in_html_text_on_db()
+    sql.find_answers_in_html_text_on_db()
+
+    assert count_rows(engine, answers_table) == 3
+    with engine.connect() as conn:
+        rows = conn.execute(db.select(puzzles_table.c.day, puzzles_table.c.part_1_solved, 
+                                      puzzles_table.c.part_2_solved)
+                              .order_by(puzzles_table.c.day)).all()
+    assert rows == [(1, True, True), (2, True, None), (3, None, None)]
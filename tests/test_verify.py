@@ -0,0 +1,64 @@
+import pytest
+import sqlalchemy as db
+
+import advent_of_code.verify as verify
+from advent_of_code.runner import PartResult, SolutionFile
+from advent_of_code.sql_schema import answers_table
+
+SOLUTIONS = {
+    'day01.py': 'INPUT = ""\ndef part_one(data):\n    return 42\ndef part_two(data):\n    return "wrong"\n',
+    'day02.py': 'INPUT = ""\ndef part_one(data):\n    raise KeyError("boom")\n',
+    'day03.py': 'import time\nINPUT = ""\ndef part_one(data):\n    time.sleep(10)\n',
+}
+
+@pytest.fixture
+def answers_db(tmp_path, monkeypatch):
+    engine = db.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    answers_table.create(engine)
+    rows = [(2015, 1, 1, '42', True), (2015, 1, 2, 'right', True), (2015, 1, 2, 'wrong', False),
+            (2015, 2, 1, '7', True), (2016, 1, 1, '99', True)]
+    with engine.begin() as conn:
+        conn.execute(db.insert(answers_table),
+                     [{'puzzle_id': 1, 'year': year, 'day': day, 'level': level, 'answer': answer,
+                       'correct': correct, 'timestamp': '2024-12-01'}
+                      for year, day, level, answer, correct in rows])
+    monkeypatch.setattr(verify, 'SQL_ENGINE', engine)
+    return engine
+
+def test_get_correct_answers_from_db(answers_db):
+    assert verify.get_correct_answers_from_db(2015) == {(2015, 1, 1): '42', (2015, 1, 2): 'right', (2015, 2, 1): '7'}
+    assert len(verify.get_correct_answers_from_db()) == 4
+
+def test_outcomes():
+    expected = {(2015, 1, 1): '42', (2015, 1, 2): '7'}
+    results = [PartResult(2015, 1, 1, answer='42'),
+               PartResult(2015, 1, 2, answer='8'),
+               PartResult(2015, 2, 1, answer='1'),
+               PartResult(2015, 2, 2, status='missing')]
+    outcomes = [v.outcome for v in verify.verify_results(results, expected)]
+    assert outcomes == ['pass', 'wrong', 'unknown', 'missing']
+
+def test_missing_part_with_accepted_answer_fails():
+    expected = {(2015, 1, 2): '7'}
+    results = [PartResult(2015, 1, 2, status='missing'),
+               PartResult(2015, 25, 2, status='missing')]
+    verifications = verify.verify_results(results, expected)
+    assert [v.outcome for v in verifications] == ['missing', 'missing']
+    assert [v.failed for v in verifications] == [True, False]
+    assert verify.make_verify_table(verifications).row_count == 1
+
+def test_verify_solutions(answers_db, tmp_path):
+    year_dir = tmp_path / '2015'
+    year_dir.mkdir()
+    solutions = []
+    for filename, source in SOLUTIONS.items():
+        (year_dir / filename).write_text(source)
+        solutions.append(SolutionFile(2015, int(filename[3:5]), year_dir / filename))
+
+    verifications = verify.verify_solutions(solutions, max_workers=3, timeout=1)
+    outcomes = {(v.result.day, v.result.part): v.outcome for v in verifications}
+    assert outcomes == {(1, 1): 'pass', (1, 2): 'wrong',
+                        (2, 1): 'error', (2, 2): 'missing',
+                        (3, 1): 'timeout', (3, 2): 'missing'}
+    assert verify.count_outcomes(verifications)['missing'] == 2
+    assert verify.make_verify_table(verifications).row_count == 3